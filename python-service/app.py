@@ -34,8 +34,13 @@ load_dotenv()
 # Import our AI modules
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from modules.resume_parser import ResumeParser
+from modules.parse_guard import ParseBudgetExceeded
+from modules.resume_document import ResumeDocument
 from modules.anomaly_detector import AnomalyDetector
-from modules.deep_analyzer import DeepResumeAnalyzer
+from modules.deep_analyzer import DeepResumeAnalyzer, section_cache_stats
+from modules.jd_profile import jd_profiles
+from modules.analysis_cache import analysis_cache
+from modules import response_fields
 
 # Try Groq first (FREE & FAST), then OpenAI, then Gemini
 ai_analyzer = None
@@ -118,6 +123,20 @@ except Exception as e:
     print(f"[WARNING] Job Matcher setup failed: {e}")
     job_matcher = None
 
+# Minimum seconds between job-index writes triggered by match requests
+JOB_INDEX_SAVE_INTERVAL = float(os.getenv('JOB_INDEX_SAVE_INTERVAL', '60'))
+
+
+def _index_jobs(jobs):
+    """Precompute matcher features for freshly scraped jobs and persist them"""
+    if not job_matcher or not jobs:
+        return
+    try:
+        job_matcher.index.add_jobs(jobs)
+        job_matcher.index.save_if_dirty()
+    except Exception as e:
+        print(f"[WARNING] Job indexing failed: {e}")
+
 try:
     # Temporarily disabled - sentence_transformers import hangs on Windows
     # from modules.ranking_engine import RankingEngine
@@ -129,6 +148,14 @@ except ImportError:
     RankingEngine = None
     ranking_engine = None
 
+# Dense-embedding similarity (optional, EMBEDDING_MODEL); the model loads on first use,
+# so sentence_transformers is never imported at startup
+from modules.embeddings import embedding_backend
+if embedding_backend:
+    print(f"[OK] Embedding backend configured: {embedding_backend.model_name} (loads on first use)")
+else:
+    print("[INFO] Embedding backend not configured, semantic matching uses TF-IDF")
+
 # Import ENHANCED HR System module (from HRcode_INTEGRATED.py)
 print("\n" + "=" * 70)
 print("[INIT] INITIALIZING ENHANCED VERIRESUME HR SYSTEM")
@@ -183,8 +210,14 @@ print("=" * 70 + "\n")
 app = Flask(__name__)
 CORS(app)  # Enable CORS for Node.js backend
 
+# Parse budgets: per-document deadline in a killable worker (0 = parse in-process);
+# single uploads parse in-process by default, bulk screening batches are guarded
+PARSE_TIMEOUT = float(os.getenv('PARSE_TIMEOUT', '0'))
+BULK_PARSE_TIMEOUT = float(os.getenv('BULK_PARSE_TIMEOUT', '30'))
+PARSE_MAX_BYTES = int(float(os.getenv('PARSE_MAX_BYTES_MB', '10')) * 1024 * 1024)
+
 # Initialize modules
-resume_parser = ResumeParser()
+resume_parser = ResumeParser(max_bytes=PARSE_MAX_BYTES, timeout=PARSE_TIMEOUT or None)
 anomaly_detector_module = AnomalyDetector()
 deep_analyzer = DeepResumeAnalyzer()
 # ai_analyzer is already initialized above with fallback logic
@@ -213,6 +246,8 @@ else:
 # Configuration
 UPLOAD_FOLDER = 'uploads'
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
+# Worker processes for bulk parsing (0 = parser default)
+PARSE_WORKERS = int(os.getenv('PARSE_WORKERS', '0')) or None
 
 
 @app.route('/health', methods=['GET'])
@@ -259,6 +294,38 @@ def model_status():
         }), 500
 
 
+@app.route('/api/cache-stats', methods=['GET'])
+def cache_stats():
+    """Hit / miss counters and sizes of the service caches (used to size them)"""
+    try:
+        return jsonify({
+            'success': True,
+            'data': {
+                'parse_cache': resume_parser.cache.stats() if resume_parser.cache else None,
+                'job_index': job_matcher.index.stats() if job_matcher else None,
+                'job_ann': job_matcher.ann.stats() if job_matcher and job_matcher.ann else None,
+                'embeddings': embedding_backend.stats() if embedding_backend else None,
+                'jd_profiles': jd_profiles.stats(),
+                'analyzer_sections': section_cache_stats(),
+                'analysis_results': analysis_cache.stats()
+            }
+        })
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+@app.route('/api/anomaly-rule-stats', methods=['GET'])
+def anomaly_rule_stats():
+    """Per-rule evaluations, hits and time of the anomaly rule engine (shows which rules are expensive)"""
+    try:
+        return jsonify({
+            'success': True,
+            'data': anomaly_detector_module.rule_stats()
+        })
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
 @app.route('/api/filter-tech-keywords', methods=['POST'])
 def filter_tech_keywords():
     """
@@ -277,15 +344,15 @@ def filter_tech_keywords():
         if not keywords:
             return jsonify({'success': True, 'tech_keywords': []})
         
-        # ── First pass: use the TECH_SKILLS + SOFT_SKILLS sets from deep_analyzer ──
-        from modules.deep_analyzer import TECH_SKILLS, SOFT_SKILLS
+        # ── First pass: exact lookup in the shared tech + soft skill lexicon ──
+        from modules.skill_taxonomy import ANALYZER_LEXICON
         
         known_tech = set()
         unknown = []
         
         for kw in keywords:
             kw_lower = kw.strip().lower()
-            if kw_lower in TECH_SKILLS or kw_lower in SOFT_SKILLS:
+            if kw_lower in ANALYZER_LEXICON:
                 known_tech.add(kw)
             elif len(kw_lower) < 2:
                 continue  # skip garbage
@@ -409,10 +476,9 @@ def parse_resume():
             
             print(f"\n[PARSE-RESUME] Parsing file: {file.filename}")
             
-            # Save file temporarily
-            file_path = os.path.join(UPLOAD_FOLDER, file.filename)
-            file.save(file_path)
-            print(f"[PARSE-RESUME] File saved to: {file_path}")
+            # Parse straight from the request body (no temp file, read within the byte budget)
+            file_name = file.filename
+            file_data = file.stream
         
         elif 'fileData' in request.json:
             # Handle base64 encoded file
@@ -420,11 +486,6 @@ def parse_resume():
             print(f"\n[PARSE-RESUME] Parsing base64 file: {file_name}")
             
             file_data = base64.b64decode(request.json['fileData'])
-            
-            file_path = os.path.join(UPLOAD_FOLDER, file_name)
-            with open(file_path, 'wb') as f:
-                f.write(file_data)
-            print(f"[PARSE-RESUME] File written to: {file_path}")
         
         else:
             print("[PARSE-RESUME] ❌ No file provided in request")
@@ -432,7 +493,7 @@ def parse_resume():
         
         # Parse resume
         print("[PARSE-RESUME] Parsing resume using resume_parser...")
-        parsed_data = resume_parser.parse_resume(file_path)
+        parsed_data = resume_parser.parse_resume(file_data, file_name=file_name)
         
         print(f"[PARSE-RESUME] ✅ Resume parsed successfully")
         print(f"   Name: {parsed_data.get('name', 'Unknown')}")
@@ -442,16 +503,19 @@ def parse_resume():
         print(f"   Experience: {len(parsed_data.get('experience', []))} entries")
         print(f"   Education: {len(parsed_data.get('education', []))} entries")
         
-        # Clean up temp file
-        if os.path.exists(file_path):
-            os.remove(file_path)
-            print(f"[PARSE-RESUME] Temp file cleaned up")
-        
         return jsonify({
             'success': True,
             'data': parsed_data
         })
     
+    except ParseBudgetExceeded as e:
+        print(f"[PARSE-RESUME] ❌ {e}")
+        return jsonify({
+            'success': False,
+            'error': str(e),
+            'budget_exceeded': e.to_dict()
+        }), 422
+    
     except Exception as e:
         print(f"\n❌ ERROR parsing resume: {str(e)}")
         print(f"   Exception type: {type(e).__name__}")
@@ -489,6 +553,12 @@ def analyze_resume():
             "decision": "SHORTLISTED"
         }
     }
+    
+    Resubmissions: the HRCode analysis and the Groq review are cached on their
+    whole inputs (resume text, JD, thresholds / prompt), so only an identical
+    resubmission skips them; any edit to the text pays for both again. The
+    deep analysis re-scores only the changed paragraphs, and skills come from
+    a lexicon scan rather than a full parse.
     """
     try:
         data = request.json
@@ -512,7 +582,14 @@ def analyze_resume():
         
         if hrcode_svc:
             try:
-                result = hrcode_svc.analyze_resume_complete(resume_text, job_description, anomaly_threshold, match_threshold)
+                # Same resume / JD / thresholds: reuse the analysis (incl. anomaly detection)
+                hrcode_key = analysis_cache.key('hrcode', resume_text, job_description,
+                                                anomaly_threshold, match_threshold)
+                result = analysis_cache.get(hrcode_key)
+                if result is None:
+                    result = hrcode_svc.analyze_resume_complete(resume_text, job_description, anomaly_threshold, match_threshold)
+                    if result.get('success'):
+                        analysis_cache.put(hrcode_key, result)
                 if not result.get('success'):
                     result = None
             except Exception as e:
@@ -521,16 +598,20 @@ def analyze_resume():
         
         # If HRCode failed, use Deep Analyzer + Groq AI for intelligent matching
         if not result or not result.get('success'):
-            # Use DeepResumeAnalyzer for structural scoring
-            deep_result = deep_analyzer.analyze(resume_text, job_description)
+            # One document model shared by the analyzer and the parser
+            resume_doc = ResumeDocument(resume_text.strip())
             
-            # Use pre-parsed skills if available, otherwise extract
+            # Use DeepResumeAnalyzer for structural scoring (JD compiled once, cached across requests);
+            # incremental: an edited resubmission only re-analyzes the paragraphs that changed
+            deep_result = deep_analyzer.analyze(resume_doc, jd_profiles.get(job_description).analysis,
+                                                incremental=True)
+            
+            # Use pre-parsed skills if available, otherwise extract (skills only: no name / NER pass)
             if parsed_skills and len(parsed_skills) > 0:
                 extracted_skills = parsed_skills
             else:
                 try:
-                    parsed_data = resume_parser.parse_resume(resume_text)
-                    extracted_skills = parsed_data.get('skills', [])
+                    extracted_skills = resume_parser.extract_skills(resume_doc)
                 except:
                     extracted_skills = []
             
@@ -542,21 +623,17 @@ def analyze_resume():
             ai_missing = []
             ai_match_score = 0
             ai_recommendation = ''
+            ai_strengths = []
+            ai_concerns = []
             
             groq_key = os.getenv('GROQ_API_KEY')
             if groq_key and job_description and len(job_description) > 20:
                 try:
-                    from groq import Groq
                     import json
-                    client = Groq(api_key=groq_key)
                     
                     skills_str = ', '.join(f'"{s}"' for s in all_skills[:30])
-                    
-                    response = client.chat.completions.create(
-                        model="llama-3.3-70b-versatile",
-                        messages=[{
-                            "role": "user",
-                            "content": f"""You are an expert HR recruiter. Analyze this resume against the job description.
+                    groq_model = "llama-3.3-70b-versatile"
+                    prompt = f"""You are an expert HR recruiter. Analyze this resume against the job description.
 
 JOB DESCRIPTION:
 {job_description[:2000]}
@@ -577,15 +654,26 @@ Return a JSON object with:
 }}
 
 Return ONLY the JSON object, nothing else."""
-                        }],
-                        temperature=0.2,
-                        max_tokens=800,
-                    )
                     
-                    ai_text = response.choices[0].message.content.strip()
-                    if '{' in ai_text:
-                        json_str = ai_text[ai_text.index('{'):ai_text.rindex('}')+1]
-                        ai_result = json.loads(json_str)
+                    # The prompt holds every input of the review: an unchanged one is answered from cache
+                    groq_cache_key = analysis_cache.key('groq', groq_model, prompt)
+                    ai_result = analysis_cache.get(groq_cache_key)
+                    if ai_result is None:
+                        from groq import Groq
+                        client = Groq(api_key=groq_key)
+                        response = client.chat.completions.create(
+                            model=groq_model,
+                            messages=[{"role": "user", "content": prompt}],
+                            temperature=0.2,
+                            max_tokens=800,
+                        )
+                        
+                        ai_text = response.choices[0].message.content.strip()
+                        if '{' in ai_text:
+                            json_str = ai_text[ai_text.index('{'):ai_text.rindex('}')+1]
+                            ai_result = json.loads(json_str)
+                            analysis_cache.put(groq_cache_key, ai_result)
+                    if ai_result is not None:
                         ai_matched = ai_result.get('matched_skills', [])
                         ai_missing = ai_result.get('missing_skills', [])
                         ai_match_score = ai_result.get('match_score', 0)
@@ -597,9 +685,6 @@ Return ONLY the JSON object, nothing else."""
                     print(f"[ANALYZE-RESUME] Groq AI matching failed: {e}")
                     ai_strengths = []
                     ai_concerns = []
-            else:
-                ai_strengths = []
-                ai_concerns = []
             
             # Use AI match score if available, otherwise calculate from skills
             if ai_match_score > 0:
@@ -912,23 +997,18 @@ def hr_parse_resume():
                 'status': 'loading'
             }), 503
         
-        # Handle file upload
-        file_path = None
+        # Handle file upload (parsed in memory) or a server-side path
         if 'file' in request.files:
             file = request.files['file']
             if file.filename == '':
                 return jsonify({'success': False, 'error': 'No file selected'}), 400
             
-            file_path = os.path.join(UPLOAD_FOLDER, file.filename)
-            file.save(file_path)
-        elif request.json and 'filePath' in request.json:
-            file_path = request.json['filePath']
+            parsed_data = hr_system.parser.parse_resume(file.stream, file_name=file.filename)
+        elif request.is_json and 'filePath' in request.json:
+            parsed_data = hr_system.parser.parse_resume(request.json['filePath'])
         else:
             return jsonify({'success': False, 'error': 'No file provided'}), 400
         
-        # Parse resume using HR system
-        parsed_data = hr_system.parser.parse_resume(file_path)
-        
         return jsonify({
             'success': True,
             'data': parsed_data
@@ -1085,16 +1165,17 @@ def hr_process_resume():
                 'status': 'loading'
             }), 503
         
-        # Handle file upload
+        # Handle file upload (parsed in memory) or a server-side path
         file_path = None
+        file_name = None
         if 'file' in request.files:
             file = request.files['file']
             if file.filename == '':
                 return jsonify({'success': False, 'error': 'No file selected'}), 400
             
-            file_path = os.path.join(UPLOAD_FOLDER, file.filename)
-            file.save(file_path)
-        elif request.json and 'filePath' in request.json:
+            file_path = file.stream
+            file_name = file.filename
+        elif request.is_json and 'filePath' in request.json:
             file_path = request.json['filePath']
         else:
             return jsonify({'success': False, 'error': 'No file provided'}), 400
@@ -1103,11 +1184,11 @@ def hr_process_resume():
         job_description = ''
         if request.form and 'jobDescription' in request.form:
             job_description = request.form['jobDescription']
-        elif request.json and 'jobDescription' in request.json:
+        elif request.is_json and 'jobDescription' in request.json:
             job_description = request.json['jobDescription']
         
         # Process resume with full HR analysis
-        result = hr_system.process_resume(file_path, job_description)
+        result = hr_system.process_resume(file_path, job_description, file_name=file_name)
         
         # Add anomaly detection to the result
         try:
@@ -1185,7 +1266,7 @@ def hr_detect_anomalies():
         parsed_data = None
         
         # Option 1: Receive already parsed data
-        if request.json and 'parsedData' in request.json:
+        if request.is_json and 'parsedData' in request.json:
             parsed_data = request.json['parsedData']
         
         # Option 2: Parse resume file first
@@ -1194,18 +1275,11 @@ def hr_detect_anomalies():
             if file.filename == '':
                 return jsonify({'success': False, 'error': 'No file selected'}), 400
             
-            # Save and parse file
-            file_path = os.path.join(UPLOAD_FOLDER, file.filename)
-            file.save(file_path)
-            
-            parsed_data = resume_parser.parse_resume(file_path)
-            
-            # Clean up
-            if os.path.exists(file_path):
-                os.remove(file_path)
+            # Parse the upload in memory
+            parsed_data = resume_parser.parse_resume(file.stream, file_name=file.filename)
         
         # Option 3: Receive file path (from previous processing)
-        elif request.json and 'filePath' in request.json:
+        elif request.is_json and 'filePath' in request.json:
             file_path = request.json['filePath']
             parsed_data = resume_parser.parse_resume(file_path)
         
@@ -1227,6 +1301,14 @@ def hr_detect_anomalies():
             'data': anomalies
         })
     
+    except ParseBudgetExceeded as e:
+        print(f"Error detecting anomalies: {e}")
+        return jsonify({
+            'success': False,
+            'error': str(e),
+            'budget_exceeded': e.to_dict()
+        }), 422
+    
     except Exception as e:
         print(f"Error detecting anomalies: {str(e)}")
         traceback.print_exc()
@@ -1236,6 +1318,10 @@ def hr_detect_anomalies():
         }), 500
 
 
+# Per-candidate score breakdowns, left out beyond the bulk-screen `explain` rank
+SCREENING_EXPLANATION_FIELDS = ('analysis', 'anomaly_detection')
+
+
 @app.route('/api/hr/bulk-screen-resumes', methods=['POST'])
 def hr_bulk_screen_resumes():
     """
@@ -1254,6 +1340,11 @@ def hr_bulk_screen_resumes():
     - jobDescription: Job description text
     - requirements: Job requirements (optional)
     - anomalyThreshold: Weight threshold for rejection (default: 30)
+    - fields: Candidate fields to return, e.g. "rank,candidate_name,match_score,parsed_data.skills"
+              (optional, default: every field)
+    - limit / offset: Page of the ranked shortlist (optional)
+    - explain: "top-k" - only the k best shortlisted candidates carry "analysis" and
+               "anomaly_detection" (optional, default: all)
     
     Response:
     {
@@ -1276,6 +1367,7 @@ def hr_bulk_screen_resumes():
                 },
                 ...
             ],
+            "pagination": { "offset": 0, "limit": 20, "returned": 6, "total": 6, "hasMore": false },
             "rejected_candidates": [
                 {
                     "candidate_name": "Jane Doe",
@@ -1320,6 +1412,18 @@ def hr_bulk_screen_resumes():
         # Get anomaly threshold (default: 30)
         anomaly_threshold = int(request.form.get('anomalyThreshold', 30))
         
+        # Response shaping (projection / pagination / explanations)
+        try:
+            fields = response_fields.parse_fields(request.form.get('fields'))
+            offset, limit = response_fields.parse_page(request.form.get('limit'), request.form.get('offset'))
+            explain = response_fields.parse_explain(request.form.get('explain'))
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
+        
+        # Compiled once for every batch screened against this posting
+        jd_profile = jd_profiles.get(job_description)
+        ats_scorer = getattr(hr_system.analyzer, 'calculate_ats_score', None) if hr_system else None
+        
         print(f"\n{'='*70}")
         print(f"🔍 BULK RESUME SCREENING STARTED")
         print(f"{'='*70}")
@@ -1332,17 +1436,23 @@ def hr_bulk_screen_resumes():
         rejected_candidates = []
         processing_errors = []
         
+        # Parse every upload up front across the worker pool (results in upload order);
+        # each upload is read only up to the parser's byte budget
+        parse_results = resume_parser.parse_many(
+            [file.stream for file in files],
+            workers=PARSE_WORKERS,
+            file_names=[file.filename for file in files],
+            timeout=BULK_PARSE_TIMEOUT or None,
+        )
+        
         # Process each resume
-        for idx, file in enumerate(files, 1):
+        for idx, (file, parse_result) in enumerate(zip(files, parse_results), 1):
             try:
                 print(f"[{idx}/{len(files)}] Processing: {file.filename}")
                 
-                # Save file temporarily
-                file_path = os.path.join(UPLOAD_FOLDER, file.filename)
-                file.save(file_path)
-                
-                # Parse resume
-                parsed_data = resume_parser.parse_resume(file_path)
+                if not parse_result['success']:
+                    raise ValueError(parse_result['error'])
+                parsed_data = parse_result['data']
                 candidate_name = parsed_data.get('candidate_info', {}).get('name', 'Unknown')
                 candidate_email = parsed_data.get('candidate_info', {}).get('email', '')
                 
@@ -1362,29 +1472,23 @@ def hr_bulk_screen_resumes():
                 
                 if shortlist_decision['shortlisted']:
                     # Calculate match score with job description
-                    if hr_system:
-                        ats_results = hr_system.analyzer.calculate_ats_score(
-                            parsed_data, 
-                            job_description
-                        )
-                        match_score = ats_results.get('ats_score', 0)
-                    else:
-                        match_score = 50  # Default if HR system unavailable
-                    
-                    print(f"  ✓ Match score: {match_score}")
+                    # (without an HR ATS scorer: deep analysis of the whole shortlist, below)
+                    ats_results = ats_scorer(parsed_data, job_description) if ats_scorer else None
+                    if ats_results is not None:
+                        print(f"  ✓ Match score: {ats_results.get('ats_score', 0)}")
                     print(f"  ✅ SHORTLISTED\n")
                     
                     shortlisted_candidates.append({
                         'candidate_name': candidate_name,
                         'email': candidate_email,
                         'phone': parsed_data.get('candidate_info', {}).get('phone', ''),
-                        'match_score': match_score,
+                        'match_score': ats_results.get('ats_score', 0) if ats_results is not None else 0,
                         'anomaly_weight': anomaly_weight,
-                        'anomaly_status': shortlist_decision['decision'],
+                        'anomaly_status': shortlist_decision['decision_status'],
                         'anomaly_severity': anomalies.get('severity', 'none'),
                         'parsed_data': parsed_data,
                         'anomaly_detection': anomalies,
-                        'analysis': ats_results if hr_system else {},
+                        'analysis': ats_results,
                         'file_name': file.filename
                     })
                 else:
@@ -1395,24 +1499,32 @@ def hr_bulk_screen_resumes():
                         'email': candidate_email,
                         'phone': parsed_data.get('candidate_info', {}).get('phone', ''),
                         'anomaly_weight': anomaly_weight,
-                        'anomaly_status': shortlist_decision['decision'],
+                        'anomaly_status': shortlist_decision['decision_status'],
                         'anomaly_severity': anomalies.get('severity', 'high'),
                         'rejection_reason': shortlist_decision['reason'],
                         'recommendation': shortlist_decision['recommendation'],
                         'anomaly_detection': anomalies,
                         'file_name': file.filename
                     })
-                
-                # Clean up temp file
-                if os.path.exists(file_path):
-                    os.remove(file_path)
                     
             except Exception as e:
                 print(f"  ❌ ERROR: {str(e)}\n")
-                processing_errors.append({
+                error_entry = {
                     'file_name': file.filename,
                     'error': str(e)
-                })
+                }
+                if parse_result['budget_exceeded']:
+                    error_entry['budget_exceeded'] = parse_result['budget_exceeded']
+                processing_errors.append(error_entry)
+        
+        # HR analyzer without ATS scoring: rank the whole shortlist on the ATS score alone,
+        # in one batch against the compiled JD (spread over the analyzer's worker pool)
+        unscored = [c for c in shortlisted_candidates if c['analysis'] is None]
+        if unscored:
+            scores = deep_analyzer.ats_scores(
+                [c['parsed_data'].get('raw_text', '') for c in unscored], jd_profile.analysis)
+            for candidate, score in zip(unscored, scores):
+                candidate['match_score'] = score
         
         # Rank shortlisted candidates by match score (highest first)
         shortlisted_candidates.sort(key=lambda x: x['match_score'], reverse=True)
@@ -1420,6 +1532,24 @@ def hr_bulk_screen_resumes():
         # Add rank numbers
         for idx, candidate in enumerate(shortlisted_candidates, 1):
             candidate['rank'] = idx
+            if explain is not None and idx > explain:
+                for key in SCREENING_EXPLANATION_FIELDS:
+                    candidate.pop(key, None)
+        
+        # Only the returned page is shaped: full deep analysis for its explained candidates
+        # (when "analysis" is requested), parsed data dropped unless requested
+        page = response_fields.paginate(shortlisted_candidates, offset, limit)
+        if response_fields.wants(fields, 'analysis'):
+            explained = [c for c in page if 'analysis' in c and c['analysis'] is None]
+            if explained:
+                analyses = deep_analyzer.analyze_many(
+                    [c['parsed_data'].get('raw_text', '') for c in explained], jd_profile.analysis)
+                for candidate, ats_results in zip(explained, analyses):
+                    candidate['analysis'] = ats_results
+                print(f"🧮 Deep-analyzed {len(explained)} of {len(unscored)} shortlisted resumes")
+        if not response_fields.wants(fields, 'parsed_data'):
+            for candidate in page:
+                candidate.pop('parsed_data', None)
         
         # Summary
         print(f"\n{'='*70}")
@@ -1438,8 +1568,9 @@ def hr_bulk_screen_resumes():
                 'rejected': len(rejected_candidates),
                 'errors': len(processing_errors),
                 'anomaly_threshold': anomaly_threshold,
-                'shortlisted_candidates': shortlisted_candidates,
-                'rejected_candidates': rejected_candidates,
+                'shortlisted_candidates': [response_fields.project(c, fields) for c in page],
+                'pagination': response_fields.pagination(len(shortlisted_candidates), offset, limit, len(page)),
+                'rejected_candidates': [response_fields.project(c, fields) for c in rejected_candidates],
                 'processing_errors': processing_errors if processing_errors else None
             }
         })
@@ -1595,6 +1726,17 @@ def rank_resumes():
                 'weaknesses': [f"✗ {skill}" for skill in rank.get('missingSkills', [])[:3]]
             })
         
+        # Dense-embedding similarity of each resume to the JD (when a model is configured)
+        if embedding_backend and transformed_rankings:
+            try:
+                texts = {r.get('id'): r.get('text', '') for r in resumes}
+                similarities = jd_profiles.get(job_description).similarity(
+                    embedding_backend, [texts.get(r['resumeId'], '') for r in transformed_rankings])
+                for ranking, similarity in zip(transformed_rankings, similarities):
+                    ranking['semanticSimilarity'] = round(float(similarity) * 100, 1)
+            except Exception as e:
+                print(f"[RANK-RESUMES] ⚠️ Embedding similarity skipped: {e}")
+
         print(f"[RANK-RESUMES] ✅ Ranked {len(transformed_rankings)} resumes successfully")
         print(f"{'='*70}\n")
         
@@ -1688,7 +1830,14 @@ def match_resume_to_jobs():
         "resumeSummary": "Experienced full-stack developer...",
         "resumeExperienceYears": 3,
         "jobs": [ { title, company, location, description, source, url, ... } ],
-        "minScore": 30
+        "minScore": 30,
+        "fields": "title,company,url,matchScore",   (optional, default: every field)
+        "limit": 20, "offset": 0,                    (optional page of the ranking)
+        "explain": "top-5",                          (optional: matchedSkills / missingSkills /
+                                                      sub-scores only for the 5 best jobs)
+        "totals": true                               (optional: exact statistics / pagination total
+                                                      for a limited page; scores every job that
+                                                      can reach minScore, default false)
     }
 
     Response:
@@ -1696,9 +1845,12 @@ def match_resume_to_jobs():
         "success": true,
         "data": {
             "matchedJobs": [ ...scored and ranked... ],
-            "statistics": { totalInput, totalMatched, avgScore, topScore }
+            "statistics": { totalInput, totalMatched, avgScore, topScore },
+            "pagination": { offset, limit, returned, total, hasMore }
         }
     }
+    With a limit and without "totals", only the page is ranked: totalMatched,
+    avgScore and pagination.total are null (hasMore is still exact).
     """
     try:
         data = request.get_json()
@@ -1708,6 +1860,15 @@ def match_resume_to_jobs():
         resume_exp = data.get('resumeExperienceYears', 2)
         jobs = data.get('jobs', [])
         min_score = data.get('minScore', 30)
+        want_totals = bool(data.get('totals', False))
+        try:
+            fields = response_fields.parse_fields(data.get('fields'))
+            offset, limit = response_fields.parse_page(data.get('limit'), data.get('offset'))
+            explain = response_fields.parse_explain(data.get('explain'))
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
+        if job_matcher and not response_fields.wants(fields, *job_matcher.EXPLANATION_FIELDS):
+            explain = 0  # no explanation field requested: skip building them
 
         print(f"\n{'='*60}")
         print(f"AI JOB MATCHING REQUEST")
@@ -1723,19 +1884,26 @@ def match_resume_to_jobs():
                 'success': True,
                 'data': {
                     'matchedJobs': [],
-                    'statistics': {'totalInput': 0, 'totalMatched': 0, 'avgScore': 0, 'topScore': 0}
+                    'statistics': {'totalInput': 0, 'totalMatched': 0, 'avgScore': 0, 'topScore': 0},
+                    'pagination': response_fields.pagination(0, offset, limit, 0)
                 }
             })
 
         if job_matcher:
-            matched = job_matcher.match_resume_to_jobs(
+            # A page only ranks its best offset+limit jobs (totals on request)
+            matched, totals = job_matcher.match_page(
                 resume_skills=resume_skills,
                 resume_title=resume_title,
                 resume_summary=resume_summary,
                 resume_experience_years=resume_exp,
                 jobs=jobs,
                 min_score=min_score,
+                offset=offset,
+                limit=limit,
+                explain=explain,
+                totals=want_totals,
             )
+            job_matcher.index.save_if_dirty(min_interval=JOB_INDEX_SAVE_INTERVAL)
         else:
             # Fallback: simple keyword matching
             print("   [WARN] JobMatcher not available, using basic matching")
@@ -1753,25 +1921,39 @@ def match_resume_to_jobs():
                 })
             matched.sort(key=lambda x: x['matchScore'], reverse=True)
             matched = [j for j in matched if j['matchScore'] >= min_score]
-
-        scores = [j['matchScore'] for j in matched]
-        stats = {
-            'totalInput': len(jobs),
-            'totalMatched': len(matched),
-            'avgScore': int(round(sum(scores) / len(scores))) if scores else 0,
-            'topScore': max(scores) if scores else 0,
-        }
+            scores = [j['matchScore'] for j in matched]
+            totals = {'matched': len(matched), 'scoreSum': sum(scores), 'topScore': max(scores, default=0)}
+
+        if totals is not None:
+            stats = {
+                'totalInput': len(jobs),
+                'totalMatched': totals['matched'],
+                'avgScore': int(round(totals['scoreSum'] / totals['matched'])) if totals['matched'] else 0,
+                'topScore': totals['topScore'],
+            }
+        else:
+            # Page ranked alone: the best score is known, the totals were not counted
+            stats = {
+                'totalInput': len(jobs),
+                'totalMatched': None,
+                'avgScore': None,
+                'topScore': matched[0]['matchScore'] if matched else 0,
+            }
 
         print(f"\n   Matched: {stats['totalMatched']}/{stats['totalInput']}")
         print(f"   Avg Score: {stats['avgScore']}%")
         print(f"   Top Score: {stats['topScore']}%")
         print(f"{'='*60}\n")
 
+        page = response_fields.paginate(matched, offset, limit)
         return jsonify({
             'success': True,
             'data': {
-                'matchedJobs': matched,
-                'statistics': stats
+                'matchedJobs': [response_fields.project(job, fields) for job in page],
+                'statistics': stats,
+                'pagination': response_fields.pagination(
+                    totals['matched'] if totals is not None else None, offset, limit, len(page),
+                    has_more=len(matched) > offset + len(page)),
             }
         })
 
@@ -1781,6 +1963,91 @@ def match_resume_to_jobs():
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+@app.route('/api/match-resumes-to-jobs', methods=['POST'])
+def match_resumes_to_jobs():
+    """
+    POST /api/match-resumes-to-jobs
+    Batch version of /api/match-resume-to-jobs: top-k jobs for each of many resumes
+    (e.g. the nightly recommendation rebuild), scored together as matrix products.
+
+    Request body:
+    {
+        "resumes": [
+            { "id": "user-1", "resumeSkills": [...], "resumeTitle": "...",
+              "resumeSummary": "...", "resumeExperienceYears": 3 },
+            ...
+        ],
+        "jobs": [ { title, company, location, description, source, url, ... } ],
+        "minScore": 30,
+        "topK": 10
+    }
+    Omit "jobs" to match against every job in the job index (scraped / previously
+    matched jobs); results then carry jobKey (URL / ID) and title only.
+
+    Response:
+    {
+        "success": true,
+        "data": {
+            "results": [ { "id": "user-1", "matchedJobs": [ ...top-k... ] }, ... ],
+            "statistics": { totalResumes, totalJobs, avgTopScore }
+        }
+    }
+    """
+    try:
+        if not job_matcher:
+            return jsonify({'success': False, 'error': 'Job matcher not available'}), 503
+
+        data = request.get_json()
+        resumes = data.get('resumes', [])
+        jobs = data.get('jobs')
+        min_score = data.get('minScore', 30)
+        top_k = data.get('topK', 10)
+
+        print(f"\n{'='*60}")
+        print(f"AI BATCH JOB MATCHING REQUEST")
+        print(f"{'='*60}")
+        print(f"   Resumes: {len(resumes)}")
+        print(f"   Jobs: {len(jobs) if jobs is not None else f'{len(job_matcher.index)} (indexed)'}")
+        print(f"   Min score: {min_score}%  Top-k: {top_k}")
+
+        matched = job_matcher.match_many(
+            resumes=[{
+                'resume_skills': r.get('resumeSkills', []),
+                'resume_title': r.get('resumeTitle', ''),
+                'resume_summary': r.get('resumeSummary', ''),
+                'resume_experience_years': r.get('resumeExperienceYears', 2),
+            } for r in resumes],
+            jobs=jobs,
+            min_score=min_score,
+            top_k=top_k,
+        )
+        if jobs:
+            job_matcher.index.save_if_dirty(min_interval=JOB_INDEX_SAVE_INTERVAL)
+
+        top_scores = [m[0]['matchScore'] for m in matched if m]
+        stats = {
+            'totalResumes': len(resumes),
+            'totalJobs': len(jobs) if jobs is not None else len(job_matcher.index),
+            'avgTopScore': int(round(sum(top_scores) / len(top_scores))) if top_scores else 0,
+        }
+        print(f"   Avg Top Score: {stats['avgTopScore']}%")
+        print(f"{'='*60}\n")
+
+        return jsonify({
+            'success': True,
+            'data': {
+                'results': [{'id': r.get('id', i), 'matchedJobs': m}
+                            for i, (r, m) in enumerate(zip(resumes, matched))],
+                'statistics': stats
+            }
+        })
+
+    except Exception as e:
+        print(f"\nBATCH MATCH ERROR: {str(e)}")
+        traceback.print_exc()
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
 # ==================== JOB API SEARCH ENDPOINTS ====================
 
 @app.route('/api/search-jobs-api', methods=['POST'])
@@ -1850,6 +2117,7 @@ def search_jobs_api():
             print(f"  USAJobs: {len(usajobs_jobs)} jobs")
         
         print(f"\n  TOTAL: {len(all_jobs)} jobs from {len(jobs_by_platform)} platforms")
+        _index_jobs(all_jobs)
         
         return jsonify({
             'success': True,
@@ -1933,6 +2201,7 @@ def scrape_jobs():
         print(f"   Total Jobs: {total_jobs}")
         print(f"   Indeed: {len(results['jobsByPlatform'].get('indeed', []))} jobs")
         print(f"   Rozee: {len(results['jobsByPlatform'].get('rozee', []))} jobs")
+        _index_jobs(results['allJobs'])
         
         return jsonify({
             'success': True,
@@ -0,0 +1,9 @@
+"""
+VeriResume Benchmarks
+Reproducible throughput / latency measurements for the resume pipeline
+
+Usage (from python-service/):
+    python -m benchmarks.run                          # default corpus, JSON in benchmarks/results/
+    python -m benchmarks.run --count 60 --repeat 3
+    python -m benchmarks.run --compare benchmarks/results/baseline.json --fail-on-regression
+"""
@@ -0,0 +1,119 @@
+"""
+VeriResume Benchmarks - ANN Recall
+recall@k and latency of JobMatcher's ANN candidate generation against exact matching
+
+    python -m benchmarks.ann_recall --jobs 20000 --resumes 50 --k 10
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.corpus import SKILLS, TITLES, generate_jobs
+from modules.ann_index import JobVectorIndex
+from modules.job_index import JobFeatureIndex
+from modules.job_matcher import JobMatcher
+
+
+def generate_queries(count: int, seed: int) -> List[Dict]:
+    """match_many resume dicts with random skills / titles"""
+    rng = random.Random(seed)
+    queries = []
+    for _ in range(count):
+        skills = rng.sample(SKILLS, rng.randint(3, 12))
+        title = rng.choice(TITLES)
+        queries.append({
+            'resume_skills': skills,
+            'resume_title': title,
+            'resume_summary': f"{title} working with {', '.join(skills[:4])}.",
+            'resume_experience_years': rng.randint(0, 10),
+        })
+    return queries
+
+
+def recall_at_k(exact: List[Dict], approx: List[Dict], k: int) -> Dict[str, float]:
+    """
+    Id recall, and tie-aware recall: share of the ANN top-k scoring at least
+    the exact k-th best score (many jobs share a score, so ids alone undercount).
+    """
+    wanted = {job['jobKey'] for job in exact[:k]}
+    if not wanted:
+        return {'recall': 1.0, 'tie_aware_recall': 1.0}
+    found = {job['jobKey'] for job in approx[:k]}
+    kth = exact[:k][-1]['matchScore']
+    good = sum(1 for job in approx[:k] if job['matchScore'] >= kth)
+    return {'recall': len(wanted & found) / len(wanted), 'tie_aware_recall': good / len(wanted)}
+
+
+def run_recall(jobs: int = 20000, resumes: int = 50, k: int = 10, candidates: Optional[int] = None,
+               nprobe: int = 8, scan_factor: float = 4.0, seed: int = 42) -> Dict:
+    index = JobFeatureIndex(max_entries=jobs)
+    started = time.perf_counter()
+    index.add_jobs(generate_jobs(count=jobs, seed=seed))
+    index_s = time.perf_counter() - started
+
+    queries = generate_queries(resumes, seed + 1)
+    exact_matcher = JobMatcher(index=index)
+    ann = JobVectorIndex(nprobe=nprobe, scan_factor=scan_factor, seed=seed)
+    ann_matcher = JobMatcher(index=index, ann=ann, ann_min_jobs=0)
+
+    started = time.perf_counter()
+    ann.sync(index)
+    build_s = time.perf_counter() - started
+
+    exact_ms, ann_ms, recalls = [], [], []
+    for query in queries:
+        started = time.perf_counter()
+        exact = exact_matcher.match_many([query], min_score=0, top_k=k, workers=1)[0]
+        exact_ms.append((time.perf_counter() - started) * 1000)
+
+        started = time.perf_counter()
+        approx = ann_matcher.match_many([query], min_score=0, top_k=k, workers=1, candidates=candidates)[0]
+        ann_ms.append((time.perf_counter() - started) * 1000)
+        recalls.append(recall_at_k(exact, approx, k))
+
+    return {
+        'config': {'jobs': jobs, 'resumes': resumes, 'k': k, 'nprobe': nprobe,
+                   'scan_factor': scan_factor, 'candidates': candidates or max(500, 50 * k), 'seed': seed},
+        'index_s': round(index_s, 3),
+        'ann_build_s': round(build_s, 3),
+        'ann': ann.stats(),
+        f'recall@{k}': round(float(np.mean([r['recall'] for r in recalls])), 4),
+        f'tie_aware_recall@{k}': round(float(np.mean([r['tie_aware_recall'] for r in recalls])), 4),
+        'exact_p50_ms': round(float(np.percentile(exact_ms, 50)), 3),
+        'ann_p50_ms': round(float(np.percentile(ann_ms, 50)), 3),
+    }
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="ANN candidate generation recall@k vs brute force")
+    parser.add_argument('--jobs', type=int, default=20000, help="indexed job pool size")
+    parser.add_argument('--resumes', type=int, default=50, help="query resumes")
+    parser.add_argument('--k', type=int, default=10)
+    parser.add_argument('--candidates', type=int, help="ANN candidates re-scored per resume")
+    parser.add_argument('--nprobe', type=int, default=8, help="IVF lists scanned per query")
+    parser.add_argument('--scan-factor', type=float, default=4.0,
+                        help="scan at least scan_factor x candidates vectors per query")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--out', help="optional JSON report path")
+    args = parser.parse_args(argv)
+
+    report = run_recall(jobs=args.jobs, resumes=args.resumes, k=args.k, candidates=args.candidates,
+                        nprobe=args.nprobe, scan_factor=args.scan_factor, seed=args.seed)
+    print(json.dumps(report, indent=2))
+    if args.out:
+        with open(args.out, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,185 @@
+"""
+VeriResume Benchmarks - Synthetic Corpus
+Seeded generator for PDF / DOCX / TXT resumes of varying size and a job list
+"""
+
+import io
+import random
+from typing import Dict, List, NamedTuple, Sequence
+
+import pymupdf as fitz
+from docx import Document
+
+FORMATS = ('pdf', 'docx', 'txt')
+
+# Roles / projects / skills per resume size
+SIZES = {
+    'small':  {'roles': 2,  'projects': 1,  'skills': 8,  'bullets': 2},
+    'medium': {'roles': 5,  'projects': 4,  'skills': 16, 'bullets': 4},
+    'large':  {'roles': 14, 'projects': 12, 'skills': 30, 'bullets': 6},
+}
+
+FIRST_NAMES = ['Ali', 'Sara', 'Usman', 'Ayesha', 'Bilal', 'Fatima', 'Hamza', 'Zainab',
+               'John', 'Maria', 'Chen', 'Priya', 'Omar', 'Hina', 'David', 'Noor']
+LAST_NAMES = ['Khan', 'Ahmed', 'Raza', 'Malik', 'Smith', 'Garcia', 'Wang', 'Patel',
+              'Hussain', 'Iqbal', 'Brown', 'Sheikh', 'Butt', 'Qureshi']
+TITLES = ['Software Engineer', 'Senior Software Engineer', 'Python Developer',
+          'Full Stack Developer', 'Data Analyst', 'Machine Learning Engineer',
+          'Frontend Developer', 'Backend Developer', 'DevOps Engineer', 'Project Manager',
+          'QA Engineer', 'Mobile App Developer', 'Data Scientist', 'Cloud Engineer']
+COMPANIES = ['Systems Ltd', 'Netsol Technologies', 'Arbisoft', 'Techlogix', 'Acme Corp',
+             '10Pearls', 'Contour Software', 'Folio3', 'Devsinc', 'Motive', 'Afiniti']
+UNIVERSITIES = ['FAST University', 'NUST', 'LUMS', 'COMSATS University', 'Air University',
+                'University of the Punjab', 'UET Lahore', 'GIKI']
+DEGREES = ['Bachelor of Computer Science', 'BS Software Engineering', 'Master of Data Science',
+           'MS Computer Science', 'Bachelor of Information Technology']
+SKILLS = ['Python', 'Django', 'Flask', 'React', 'Node.js', 'JavaScript', 'TypeScript',
+          'Java', 'Spring Boot', 'C++', 'C#', '.NET', 'SQL', 'PostgreSQL', 'MongoDB',
+          'Docker', 'Kubernetes', 'AWS', 'Azure', 'Git', 'Linux', 'REST API', 'GraphQL',
+          'Machine Learning', 'TensorFlow', 'Pandas', 'NumPy', 'Scikit-learn', 'Redis',
+          'Kafka', 'Jenkins', 'CI/CD', 'HTML', 'CSS', 'Angular', 'Vue', 'Flutter',
+          'Communication', 'Leadership', 'Teamwork', 'English', 'MS Excel']
+VERBS = ['Developed', 'Led', 'Implemented', 'Designed', 'Optimized', 'Built', 'Automated',
+         'Migrated', 'Mentored', 'Delivered', 'Integrated', 'Reduced', 'Improved']
+OBJECTS = ['a payments service', 'the reporting pipeline', 'REST APIs for mobile clients',
+           'an internal admin dashboard', 'CI/CD pipelines', 'the search feature',
+           'a recommendation engine', 'data ingestion jobs', 'the authentication flow',
+           'microservices on Kubernetes', 'unit and integration tests']
+OUTCOMES = ['cutting latency by 40%', 'serving 2M requests per day', 'for 12 enterprise clients',
+            'reducing costs by 25%', 'with 99.9% uptime', 'ahead of schedule', '']
+
+
+class CorpusDocument(NamedTuple):
+    """One synthetic resume rendered to a file format"""
+    name: str
+    format: str
+    size: str
+    data: bytes
+    text: str
+
+
+def build_resume_text(rng: random.Random, size: str) -> str:
+    """Plain-text resume with contact header, summary, skills, experience, projects, education"""
+    spec = SIZES[size]
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    title = rng.choice(TITLES)
+    skills = rng.sample(SKILLS, min(spec['skills'], len(SKILLS)))
+
+    lines = [
+        f"{first} {last}",
+        f"{first.lower()}.{last.lower()}@example.com",
+        f"+92-3{rng.randint(0, 49):02d}-{rng.randint(1000000, 9999999)}",
+        f"linkedin.com/in/{first.lower()}{last.lower()}",
+        "",
+        "Summary",
+        f"{title} with {spec['roles'] + 1} years of experience building reliable software. "
+        f"Focused on {skills[0]} and {skills[1]}, clean code and measurable results.",
+        "",
+        "Technical Skills: " + ", ".join(skills[:spec['skills'] // 2]),
+        ", ".join(skills[spec['skills'] // 2:]),
+        "",
+        "Work Experience",
+    ]
+
+    year = 2024
+    for _ in range(spec['roles']):
+        start = year - rng.randint(1, 3)
+        lines.append(rng.choice(TITLES))
+        lines.append(f"{rng.choice(COMPANIES)}, {start} - {year if year < 2024 else 'present'}")
+        for _ in range(spec['bullets']):
+            outcome = rng.choice(OUTCOMES)
+            lines.append(f"• {rng.choice(VERBS)} {rng.choice(OBJECTS)}"
+                         f"{' ' + outcome if outcome else ''}.")
+        lines.append("")
+        year = start
+
+    lines.append("Projects")
+    for n in range(spec['projects']):
+        used = ", ".join(rng.sample(skills, 3))
+        lines.append(f"Project {n + 1}: {rng.choice(OBJECTS).capitalize()} ({used})")
+        lines.append(f"• {rng.choice(VERBS)} {rng.choice(OBJECTS)} using {used}.")
+    lines.append("")
+
+    lines.append("Education")
+    lines.append(rng.choice(DEGREES))
+    lines.append(f"{rng.choice(UNIVERSITIES)} {year - rng.randint(0, 2)}")
+    lines.append("")
+    lines.append("Languages")
+    lines.append("English, Urdu")
+    return "\n".join(lines)
+
+
+def render_pdf(text: str, lines_per_page: int = 50) -> bytes:
+    """One text box per page, lines_per_page lines each"""
+    lines = text.split("\n")
+    doc = fitz.open()
+    for start in range(0, len(lines), lines_per_page):
+        page = doc.new_page()
+        page.insert_textbox(fitz.Rect(50, 50, 560, 800),
+                            "\n".join(lines[start:start + lines_per_page]), fontsize=9)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+def render_docx(text: str) -> bytes:
+    """Paragraph per line; the skills lines are put in a two-column table"""
+    doc = Document()
+    for line in text.split("\n"):
+        if line.startswith("Technical Skills: "):
+            doc.add_paragraph("Technical Skills")
+            items = [s.strip() for s in line.split(":", 1)[1].split(",")]
+            table = doc.add_table(rows=(len(items) + 1) // 2, cols=2)
+            for cell, item in zip(table._cells, items):
+                cell.text = item
+        else:
+            doc.add_paragraph(line)
+    buf = io.BytesIO()
+    doc.save(buf)
+    return buf.getvalue()
+
+
+def generate_corpus(count: int = 30, seed: int = 42,
+                    formats: Sequence[str] = FORMATS,
+                    sizes: Sequence[str] = tuple(SIZES)) -> List[CorpusDocument]:
+    """count resumes cycling through every format x size combination"""
+    rng = random.Random(seed)
+    combos = [(fmt, size) for size in sizes for fmt in formats]
+    corpus = []
+    for n in range(count):
+        fmt, size = combos[n % len(combos)]
+        text = build_resume_text(rng, size)
+        if fmt == 'pdf':
+            data = render_pdf(text)
+        elif fmt == 'docx':
+            data = render_docx(text)
+        else:
+            data = text.encode('utf-8')
+        corpus.append(CorpusDocument(f"resume-{n:04d}-{size}.{fmt}", fmt, size, data, text))
+    return corpus
+
+
+def generate_jobs(count: int = 200, seed: int = 7) -> List[Dict]:
+    """Scraped-job shaped dicts (title, company, location, description, url)"""
+    rng = random.Random(seed)
+    jobs = []
+    for n in range(count):
+        title = rng.choice(TITLES)
+        skills = rng.sample(SKILLS, rng.randint(4, 10))
+        years = rng.randint(1, 8)
+        description = (
+            f"We are hiring a {title} to join {rng.choice(COMPANIES)}. "
+            f"Requirements: {years}+ years of experience with {', '.join(skills)}. "
+            f"You will {rng.choice(VERBS).lower()} {rng.choice(OBJECTS)} and "
+            f"{rng.choice(VERBS).lower()} {rng.choice(OBJECTS)}. "
+            "Strong communication skills and ownership are expected."
+        )
+        jobs.append({
+            'title': title,
+            'company': rng.choice(COMPANIES),
+            'location': rng.choice(['Lahore', 'Karachi', 'Islamabad', 'Remote']),
+            'description': description,
+            'source': 'synthetic',
+            'url': f"https://jobs.example.com/{seed}/{n}",
+        })
+    return jobs
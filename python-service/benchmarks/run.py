@@ -0,0 +1,269 @@
+"""
+VeriResume Benchmarks - Runner
+Times every pipeline stage over the synthetic corpus and writes a JSON report
+
+Stages (each fed by the previous one, per document):
+    extract_text      ResumeParser.extract_text on the raw file bytes
+    fields            ResumeParser field extraction on the extracted text
+    anomaly_detector  AnomalyDetector.detect_anomalies on the parsed fields
+    deep_analyzer     DeepResumeAnalyzer.analyze against a fixed job description
+    job_matcher       JobMatcher.match_resume_to_jobs against the synthetic job list
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.corpus import generate_corpus, generate_jobs
+from modules.resume_parser import ResumeParser
+from modules.anomaly_detector import AnomalyDetector
+from modules.deep_analyzer import DeepResumeAnalyzer
+from modules.job_matcher import JobMatcher
+
+STAGES = ('extract_text', 'fields', 'anomaly_detector', 'deep_analyzer', 'job_matcher')
+
+JOB_DESCRIPTION = (
+    "We are looking for a Senior Python Developer with 4+ years of experience in Django, "
+    "REST API design, PostgreSQL, Docker and AWS. Experience with React, CI/CD and "
+    "Kubernetes is a plus. Strong communication and leadership skills required."
+)
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+
+# Summary fields compared run to run (higher is better only for docs_per_s)
+COMPARED_METRICS = ('p50_ms', 'p95_ms', 'docs_per_s')
+
+
+def summarize(samples_ms: Sequence[float], total_bytes: int = 0) -> Dict:
+    """Latency percentiles and throughput for one stage"""
+    values = np.asarray(samples_ms, dtype=float)
+    if values.size == 0:
+        return {'count': 0}
+    total_s = float(values.sum()) / 1000
+    p50, p90, p95, p99 = np.percentile(values, [50, 90, 95, 99])
+    summary = {
+        'count': int(values.size),
+        'total_s': round(total_s, 4),
+        'docs_per_s': round(values.size / total_s, 2) if total_s else None,
+        'mean_ms': round(float(values.mean()), 3),
+        'p50_ms': round(float(p50), 3),
+        'p90_ms': round(float(p90), 3),
+        'p95_ms': round(float(p95), 3),
+        'p99_ms': round(float(p99), 3),
+        'max_ms': round(float(values.max()), 3),
+    }
+    if total_bytes:
+        summary['mb_per_s'] = round(total_bytes / 1e6 / total_s, 3) if total_s else None
+    return summary
+
+
+def _timed(func, *args, **kwargs):
+    started = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, (time.perf_counter() - started) * 1000
+
+
+def _experience_years(parsed: Dict) -> int:
+    return max(1, len(parsed.get('experience', [])))
+
+
+def run_benchmark(count: int = 30, seed: int = 42, repeat: int = 1, job_count: int = 200,
+                  stages: Sequence[str] = STAGES, quiet: bool = True) -> Dict:
+    """
+    Build the corpus, run every stage over it `repeat` times and return the report.
+
+    The first document is run once untimed through every stage so lazy
+    initialization (spaCy, regex compilation) does not land in the percentiles.
+    """
+    corpus = generate_corpus(count=count, seed=seed)
+    jobs = generate_jobs(count=job_count, seed=seed + 1)
+
+    parser = ResumeParser(use_cache=False)
+    detector = AnomalyDetector()
+    analyzer = DeepResumeAnalyzer()
+    matcher = JobMatcher()
+
+    samples: Dict[str, List[float]] = defaultdict(list)
+    by_group: Dict[str, Dict[str, List[float]]] = defaultdict(lambda: defaultdict(list))
+    stage_bytes: Dict[str, int] = defaultdict(int)
+
+    def run_document(doc, record: bool):
+        timings = {}
+        text, timings['extract_text'] = _timed(parser.extract_text, doc.data, doc.name)
+        parsed, timings['fields'] = _timed(parser._parse_fields, text, doc.name)
+        if 'anomaly_detector' in stages:
+            _, timings['anomaly_detector'] = _timed(detector.detect_anomalies, parsed)
+        if 'deep_analyzer' in stages:
+            _, timings['deep_analyzer'] = _timed(analyzer.analyze, text, JOB_DESCRIPTION)
+        if 'job_matcher' in stages:
+            title = parsed['experience'][0]['title'] if parsed['experience'] else ''
+            _, timings['job_matcher'] = _timed(
+                matcher.match_resume_to_jobs,
+                resume_skills=parsed['skills'], resume_title=title,
+                resume_summary=text[:1000], resume_experience_years=_experience_years(parsed),
+                jobs=jobs, min_score=0)
+        if not record:
+            return
+        for stage, ms in timings.items():
+            if stage not in stages:
+                continue
+            samples[stage].append(ms)
+            by_group[stage][f"format:{doc.format}"].append(ms)
+            by_group[stage][f"size:{doc.size}"].append(ms)
+        stage_bytes['extract_text'] += len(doc.data)
+        stage_bytes['fields'] += len(text.encode('utf-8'))
+
+    # Parser / matcher chatter would dominate the output (and the timings of print)
+    matcher_logger = logging.getLogger('modules.job_matcher')
+    previous_level = matcher_logger.level
+    matcher_logger.setLevel(logging.WARNING)
+    sink = io.StringIO() if quiet else sys.stdout
+    started = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(sink):
+            if corpus:
+                run_document(corpus[0], record=False)
+            for _ in range(repeat):
+                for doc in corpus:
+                    run_document(doc, record=True)
+    finally:
+        matcher_logger.setLevel(previous_level)
+    wall_s = time.perf_counter() - started
+
+    report_stages = {}
+    for stage in stages:
+        summary = summarize(samples[stage], stage_bytes.get(stage, 0))
+        summary['groups'] = {group: summarize(values) for group, values in sorted(by_group[stage].items())}
+        report_stages[stage] = summary
+
+    return {
+        'meta': {
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'git_commit': _git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'wall_s': round(wall_s, 3),
+        },
+        'config': {
+            'count': count, 'seed': seed, 'repeat': repeat, 'jobs': job_count,
+            'stages': list(stages),
+        },
+        'corpus': {
+            'documents': len(corpus),
+            'bytes': sum(len(doc.data) for doc in corpus),
+            'formats': sorted({doc.format for doc in corpus}),
+            'sizes': sorted({doc.size for doc in corpus}),
+        },
+        'stages': report_stages,
+    }
+
+
+def compare_results(current: Dict, baseline: Dict, threshold: float = 0.10) -> List[Dict]:
+    """
+    Per-stage deltas against a previous report.
+
+    A row is a regression when p50/p95 latency grows, or docs/s drops, by
+    more than `threshold` (relative).
+    """
+    rows = []
+    for stage, summary in current.get('stages', {}).items():
+        base = baseline.get('stages', {}).get(stage)
+        if not base or not base.get('count'):
+            continue
+        for metric in COMPARED_METRICS:
+            now, before = summary.get(metric), base.get(metric)
+            if not now or not before:
+                continue
+            change = (now - before) / before
+            worse = -change if metric == 'docs_per_s' else change
+            rows.append({
+                'stage': stage, 'metric': metric,
+                'baseline': before, 'current': now,
+                'change_pct': round(change * 100, 1),
+                'regression': worse > threshold,
+            })
+    return rows
+
+
+def print_report(report: Dict, comparison: Optional[List[Dict]] = None):
+    print("=" * 70)
+    print(f"BENCHMARK  {report['corpus']['documents']} docs x {report['config']['repeat']} "
+          f"({report['corpus']['bytes'] / 1e6:.2f} MB)  wall {report['meta']['wall_s']}s")
+    print("=" * 70)
+    print(f"{'stage':<18}{'docs/s':>10}{'p50 ms':>10}{'p90 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for stage, s in report['stages'].items():
+        if not s.get('count'):
+            continue
+        print(f"{stage:<18}{s['docs_per_s']:>10}{s['p50_ms']:>10}{s['p90_ms']:>10}"
+              f"{s['p95_ms']:>10}{s['p99_ms']:>10}")
+
+    if comparison:
+        print("-" * 70)
+        for row in comparison:
+            flag = '❌ REGRESSION' if row['regression'] else ''
+            print(f"{row['stage']:<18}{row['metric']:<12}{row['baseline']:>10} -> "
+                  f"{row['current']:<10} ({row['change_pct']:+.1f}%) {flag}")
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, timeout=5,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except Exception:
+        return None
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="VeriResume pipeline benchmark")
+    parser.add_argument('--count', type=int, default=30, help="resumes in the corpus")
+    parser.add_argument('--seed', type=int, default=42, help="corpus seed")
+    parser.add_argument('--repeat', type=int, default=1, help="passes over the corpus")
+    parser.add_argument('--jobs', type=int, default=200, help="jobs for the JobMatcher stage")
+    parser.add_argument('--stages', nargs='+', choices=STAGES, default=list(STAGES))
+    parser.add_argument('--out', help="JSON report path (default: benchmarks/results/bench-<time>.json)")
+    parser.add_argument('--compare', help="previous JSON report to diff against")
+    parser.add_argument('--threshold', type=float, default=0.10, help="relative regression threshold")
+    parser.add_argument('--fail-on-regression', action='store_true')
+    parser.add_argument('--verbose', action='store_true', help="keep parser output")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(count=args.count, seed=args.seed, repeat=args.repeat,
+                           job_count=args.jobs, stages=args.stages, quiet=not args.verbose)
+
+    comparison = None
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            comparison = compare_results(report, json.load(f), args.threshold)
+        report['comparison'] = {'baseline': args.compare, 'rows': comparison}
+
+    out = args.out or os.path.join(RESULTS_DIR, f"bench-{datetime.now():%Y%m%d-%H%M%S}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    with open(out, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+    print_report(report, comparison)
+    print(f"\n💾 Saved: {out}")
+
+    if args.fail_on_regression and comparison and any(row['regression'] for row in comparison):
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""
+VeriResume - Analysis Result Cache
+Results of the expensive /api/analyze-resume stages, keyed by the SHA-256 of
+everything the stage reads:
+
+  - "groq":   the LLM resume review (model + prompt)
+  - "hrcode": the HRCode analysis (resume text, JD, thresholds), which
+              includes its anomaly detection
+
+A resubmitted resume, or an edit that leaves a stage's inputs unchanged,
+is answered from memory instead of another LLM round-trip / full analysis.
+The deep analyzer's own block cache (modules.deep_analyzer) covers the
+structural scores.
+"""
+
+import copy
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+class AnalysisCache:
+    """Bounded LRU of per-stage analysis results, with per-stage hit / miss counters."""
+
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self._results: "OrderedDict[str, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[str, int]] = {}
+
+    @staticmethod
+    def key(stage: str, *parts: Any) -> str:
+        """Cache key of a stage over its inputs (stage name is part of the key)."""
+        digest = hashlib.sha256(stage.encode("utf-8"))
+        for part in parts:
+            digest.update(b"\0")
+            digest.update(str(part).encode("utf-8"))
+        return f"{stage}:{digest.hexdigest()}"
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return a private copy of the cached result, or None on a miss."""
+        stage = key.split(":", 1)[0]
+        with self._lock:
+            counters = self._counters.setdefault(stage, {"hits": 0, "misses": 0})
+            value = self._results.get(key)
+            if value is None:
+                counters["misses"] += 1
+                return None
+            self._results.move_to_end(key)
+            counters["hits"] += 1
+            return copy.deepcopy(value)
+
+    def put(self, key: str, value: Dict) -> None:
+        if self.max_entries <= 0:
+            return
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._results[key] = value
+            self._results.move_to_end(key)
+            while len(self._results) > self.max_entries:
+                self._results.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def clear(self):
+        with self._lock:
+            self._results.clear()
+            self._counters.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stages = {}
+            for stage, counters in self._counters.items():
+                lookups = counters["hits"] + counters["misses"]
+                stages[stage] = dict(counters, hit_rate=round(counters["hits"] / lookups, 4) if lookups else 0.0)
+            return {
+                "entries": len(self._results),
+                "max_entries": self.max_entries,
+                "stages": stages,
+            }
+
+
+# Shared cache (ANALYSIS_CACHE_SIZE results)
+analysis_cache = AnalysisCache(int(os.getenv("ANALYSIS_CACHE_SIZE", "512")))
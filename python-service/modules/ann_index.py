@@ -0,0 +1,312 @@
+# -*- coding: utf-8 -*-
+"""
+VeriResume - Approximate Nearest-Neighbour Job Index
+Candidate generation for large job pools (tens of thousands of postings).
+
+  - job vectors: TF-IDF reduced with TruncatedSVD (or an embedding backend),
+    L2-normalized, so inner product = cosine
+  - IVF: k-means centroids partition the jobs into inverted lists; a query
+    scans only its closest lists (nprobe, widened until ~scan_factor x k
+    vectors have been compared)
+  - jobs are inserted / deleted incrementally from the job index's change
+    log; the projection and centroids are refitted on a background thread
+    once the pool has grown past rebuild_growth x its size at the last build
+
+JobMatcher re-scores the returned candidates exactly.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+from sklearn.cluster import MiniBatchKMeans
+from sklearn.decomposition import TruncatedSVD
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from modules.job_index import TFIDF_PARAMS, JobFeatureIndex, JobFeatures
+
+logger = logging.getLogger(__name__)
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return (vectors / np.where(norms == 0, 1, norms)).astype(np.float32)
+
+
+class SVDProjection:
+    """TF-IDF (fitted on the job texts) followed by TruncatedSVD, frozen after fit"""
+
+    def __init__(self, texts: List[str], n_components: int = 128, seed: int = 0):
+        self.vectorizer = TfidfVectorizer(**TFIDF_PARAMS)
+        matrix = self.vectorizer.fit_transform(texts)
+        components = max(1, min(n_components, matrix.shape[1] - 1, matrix.shape[0] - 1))
+        self.svd = TruncatedSVD(n_components=components, random_state=seed)
+        self.svd.fit(matrix)
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        return _normalize(self.svd.transform(self.vectorizer.transform(texts)))
+
+
+class IVFIndex:
+    """Inverted-file index of unit vectors with swap-remove deletes"""
+
+    def __init__(self, centroids: np.ndarray):
+        self.centroids = _normalize(centroids)
+        dim = self.centroids.shape[1]
+        self._vectors = [np.empty((0, dim), dtype=np.float32) for _ in range(len(self.centroids))]
+        self._sizes = [0] * len(self.centroids)
+        self._ids: List[List[str]] = [[] for _ in range(len(self.centroids))]
+        self._where: Dict[str, tuple] = {}          # id -> (list, slot)
+
+    @classmethod
+    def train(cls, vectors: np.ndarray, nlist: Optional[int] = None, seed: int = 0) -> "IVFIndex":
+        # ~4 sqrt(n) lists keeps both the centroid scan and each list scan short
+        nlist = nlist or max(1, min(len(vectors), int(4 * np.sqrt(len(vectors)))))
+        kmeans = MiniBatchKMeans(n_clusters=nlist, random_state=seed, n_init=3,
+                                 batch_size=max(1024, nlist * 4))
+        kmeans.fit(vectors)
+        return cls(kmeans.cluster_centers_)
+
+    def add(self, ids: Sequence[str], vectors: np.ndarray) -> None:
+        self.remove([i for i in ids if i in self._where])
+        lists = np.argmax(vectors @ self.centroids.T, axis=1)
+        for entry_id, vector, list_no in zip(ids, vectors, lists.tolist()):
+            size = self._sizes[list_no]
+            store = self._vectors[list_no]
+            if size == len(store):
+                grown = np.empty((max(8, 2 * size), store.shape[1]), dtype=np.float32)
+                grown[:size] = store[:size]
+                store = self._vectors[list_no] = grown
+            store[size] = vector
+            self._ids[list_no].append(entry_id)
+            self._where[entry_id] = (list_no, size)
+            self._sizes[list_no] = size + 1
+
+    def remove(self, ids: Sequence[str]) -> None:
+        for entry_id in ids:
+            located = self._where.pop(entry_id, None)
+            if located is None:
+                continue
+            list_no, slot = located
+            last = self._sizes[list_no] - 1
+            if slot != last:
+                # Move the last vector into the hole
+                moved = self._ids[list_no][last]
+                self._vectors[list_no][slot] = self._vectors[list_no][last]
+                self._ids[list_no][slot] = moved
+                self._where[moved] = (list_no, slot)
+            self._ids[list_no].pop()
+            self._sizes[list_no] = last
+
+    def search(self, query: np.ndarray, k: int, nprobe: int = 8, min_scan: int = 0) -> List[str]:
+        """
+        Ids of the (approximately) k most similar vectors, best first.
+
+        Lists are scanned closest centroid first: at least nprobe of them, and
+        more until min_scan vectors have been compared.
+        """
+        order = np.argsort(-(self.centroids @ query), kind="stable")
+        ids: List[str] = []
+        scores = []
+        for probed, list_no in enumerate(order.tolist()):
+            if probed >= nprobe and len(ids) >= min_scan:
+                break
+            size = self._sizes[list_no]
+            if size:
+                scores.append(self._vectors[list_no][:size] @ query)
+                ids.extend(self._ids[list_no])
+        if not ids:
+            return []
+        scores = np.concatenate(scores)
+        if len(ids) > k:
+            top = np.argpartition(-scores, k - 1)[:k]
+        else:
+            top = np.arange(len(ids))
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [ids[i] for i in top.tolist()]
+
+    def ids(self):
+        return self._where.keys()
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def __contains__(self, entry_id: str) -> bool:
+        return entry_id in self._where
+
+    @property
+    def list_sizes(self) -> List[int]:
+        return list(self._sizes)
+
+
+class JobVectorIndex:
+    """
+    ANN candidate generator kept in sync with a JobFeatureIndex.
+
+    encoder: None for the TF-IDF + SVD projection (fitted on the indexed jobs
+    at each build), or an EmbeddingBackend (anything with encode(texts)).
+
+    Syncing replays the job index's change log. Fits (the first build, and a
+    refit after enough growth) run on a background thread: callers match
+    exactly until ready(), and the current IVF keeps serving during a refit.
+    """
+
+    def __init__(self, n_components: int = 128, nprobe: int = 8, scan_factor: float = 4.0,
+                 rebuild_growth: float = 1.0, encoder: Any = None, seed: int = 0,
+                 background_rebuild: bool = True):
+        self.n_components = n_components
+        self.nprobe = nprobe
+        self.scan_factor = scan_factor
+        self.rebuild_growth = rebuild_growth
+        self.encoder = encoder
+        self.seed = seed
+        self.background_rebuild = background_rebuild
+
+        self._projection = None
+        self._ivf: Optional[IVFIndex] = None
+        self._built_size = 0
+        self._synced_version = None
+        self._lock = threading.RLock()
+        self._rebuild_thread: Optional[threading.Thread] = None
+
+        self.builds = 0
+        self.inserts = 0
+        self.deletes = 0
+
+    def sync(self, index: JobFeatureIndex) -> None:
+        """Apply the job index's inserts / deletes (and start a refit after enough growth)."""
+        if self._synced_version == index.version:
+            return
+        with self._lock:
+            if self._synced_version == index.version:
+                return
+            if self._ivf is None:
+                # Nothing to serve yet: callers stay exact until the first build lands
+                self._start_rebuild(index)
+                return
+            version, added, removed = self._changes(index, self._ivf, self._synced_version)
+            inserted, deleted = self._apply(self._ivf, self._projection, added, removed)
+            self.inserts += inserted
+            self.deletes += deleted
+            self._synced_version = version
+            if len(self._ivf) > self._built_size * (1 + self.rebuild_growth):
+                self._start_rebuild(index)
+
+    def build(self, features: List[JobFeatures]) -> None:
+        with self._lock:
+            self._projection, self._ivf = self._train(features)
+            self._built_size = len(features)
+            if self._ivf is not None:
+                self.builds += 1
+
+    def ready(self) -> bool:
+        """Whether an IVF has been built (search() answers candidates)."""
+        return self._ivf is not None
+
+    def wait_for_rebuild(self, timeout: Optional[float] = None) -> bool:
+        """Block until a running background refit has been swapped in; False on timeout."""
+        thread = self._rebuild_thread
+        if thread is not None:
+            thread.join(timeout)
+            return not thread.is_alive()
+        return True
+
+    def search(self, text: str, k: int) -> List[str]:
+        """Entry ids of the ~k jobs closest to text."""
+        with self._lock:
+            if self._ivf is None or not text.strip() or k <= 0:
+                return []
+            return self._ivf.search(self._encode([text])[0], k, self.nprobe, int(k * self.scan_factor))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            sizes = self._ivf.list_sizes if self._ivf is not None else []
+            return {
+                "jobs": sum(sizes),
+                "lists": len(sizes),
+                "largest_list": max(sizes) if sizes else 0,
+                "nprobe": self.nprobe,
+                "scan_factor": self.scan_factor,
+                "builds": self.builds,
+                "rebuilding": self._rebuild_thread is not None and self._rebuild_thread.is_alive(),
+                "inserts": self.inserts,
+                "deletes": self.deletes,
+            }
+
+    # ─────────────────────────────────────────────────────────────────
+    #  Internals
+    # ─────────────────────────────────────────────────────────────────
+    def _train(self, features: List[JobFeatures]) -> tuple:
+        """(projection, IVF) fitted on features; reads no mutable state, so runs off the lock."""
+        if not features:
+            return None, None
+        started = time.perf_counter()
+        texts = [f.text for f in features]
+        projection = SVDProjection(texts, self.n_components, self.seed) if self.encoder is None else None
+        vectors = self._encode(texts, projection)
+        ivf = IVFIndex.train(vectors, seed=self.seed)
+        ivf.add([f.entry_id for f in features], vectors)
+        logger.info(f"[JobANN] Built IVF over {len(features)} jobs, {len(ivf.centroids)} lists "
+                    f"in {time.perf_counter() - started:.1f}s")
+        return projection, ivf
+
+    def _start_rebuild(self, index: JobFeatureIndex) -> None:
+        if self._rebuild_thread is not None and self._rebuild_thread.is_alive():
+            return
+        if not self.background_rebuild:
+            self._rebuild(index)
+            return
+        self._rebuild_thread = threading.Thread(target=self._rebuild, args=(index,),
+                                                name="job-ann-rebuild", daemon=True)
+        self._rebuild_thread.start()
+
+    def _rebuild(self, index: JobFeatureIndex) -> None:
+        """Refit from a snapshot of the job index, then swap in, replaying what changed meanwhile."""
+        try:
+            version = index.version
+            features = [f for f in index.all_features() if f.text.strip()]
+            projection, ivf = self._train(features)
+            if ivf is None:
+                with self._lock:
+                    if self._ivf is None:
+                        self._synced_version = version  # nothing to index yet
+                return
+            with self._lock:
+                version, added, removed = self._changes(index, ivf, version)
+                self._apply(ivf, projection, added, removed)
+                self._projection, self._ivf = projection, ivf
+                self._built_size = len(features)
+                self._synced_version = version
+                self.builds += 1
+        except Exception as e:
+            logger.warning(f"[JobANN] Rebuild failed, keeping the current IVF: {e}")
+
+    @staticmethod
+    def _changes(index: JobFeatureIndex, ivf: IVFIndex, since: Optional[int]) -> tuple:
+        """(version, added features, removed ids) of the job index since `since`."""
+        changes = index.changes_since(since)
+        if changes is not None:
+            return changes
+        # Change log does not reach back (trimmed, or the index was reloaded): diff the ids
+        version = index.version
+        features = index.all_features()
+        current = {f.entry_id for f in features}
+        removed = [entry_id for entry_id in ivf.ids() if entry_id not in current]
+        added = [f for f in features if f.entry_id not in ivf]
+        return version, added, removed
+
+    def _apply(self, ivf: IVFIndex, projection, added: List[JobFeatures], removed: List[str]) -> tuple:
+        """Insert / delete into ivf; returns (inserted, deleted)."""
+        deleted = sum(1 for entry_id in removed if entry_id in ivf)
+        ivf.remove(removed)
+        added = [f for f in added if f.text.strip()]
+        if added:
+            ivf.add([f.entry_id for f in added], self._encode([f.text for f in added], projection))
+        return len(added), deleted
+
+    def _encode(self, texts: List[str], projection=None) -> np.ndarray:
+        if self.encoder is not None:
+            return _normalize(np.asarray(self.encoder.encode(texts), dtype=np.float32))
+        return (projection or self._projection).encode(texts)
@@ -0,0 +1,507 @@
+# -*- coding: utf-8 -*-
+"""
+VeriResume - Anomaly Rules
+Anomaly checks declared as data, compiled once into matchers and evaluated
+per resume by a RuleEngine (used by AnomalyDetector).
+
+Rule kinds:
+    missing     candidate_info key empty or one of the placeholder `terms`
+    terms       an entry's normalized text equals one of `terms`
+    indicators  named groups of substring indicators (Terms), each looked for in
+                one part of the entry (title, company, degree, ...); the rule
+                fires when every group of one `match` alternative has a hit
+    duplicate   an entry's `key` was already seen in this resume
+
+Compilation turns exact terms into frozensets and folds every indicator
+substring of a field into one SkillLexicon, so each experience / education
+entry is scanned once however many indicator rules exist; hits are attributed
+to entry parts by offset.
+
+Normalized entries and their indicator hits are memoized per entry content
+(ENTRY_CACHE_SIZE), so a resubmitted or edited resume only scans the entries
+that changed.
+
+Per-rule evaluations, hits and time, plus the per-field scan time, are
+accumulated for /api/anomaly-rule-stats.
+"""
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from modules.skill_taxonomy import NONE, SkillLexicon
+
+MISSING = 'missing'
+TERMS = 'terms'
+INDICATORS = 'indicators'
+DUPLICATE = 'duplicate'
+
+SEVERITY_WEIGHTS = {'high': 15, 'medium': 8, 'low': 3}
+
+# ─────────────────────────────────────────────────────────────────────
+#  Vocabularies
+# ─────────────────────────────────────────────────────────────────────
+
+NAME_PLACEHOLDERS = (
+    'Unknown Candidate', 'EDUCATION', 'Contact', 'Phone', 'SUMMARY', 'Profile',
+    'Resume', 'CERTIFICATIONS', 'Personal Information:', 'EXPERIENCE',
+)
+
+# Spoken languages (should NOT be in technical skills)
+SPOKEN_LANGUAGES = (
+    'english', 'urdu', 'punjabi', 'sindhi', 'pashto', 'hindi',
+    'arabic', 'french', 'spanish', 'german', 'chinese',
+)
+
+# Generic software (low-value skills)
+GENERIC_SOFTWARE = (
+    'ms word', 'microsoft word', 'word',
+    'ms excel', 'microsoft excel', 'excel',
+    'ms powerpoint', 'powerpoint', 'ppt',
+    'ms office', 'microsoft office',
+    'windows', 'outlook', 'internet', 'email',
+)
+
+# Degree types / institutions that betray education inside experience
+# (plain substrings: "bs " and "ms " keep their trailing space)
+DEGREE_INDICATORS = (
+    'bachelor', 'master', 'phd', 'doctorate',
+    'bs ', 'ms ', 'mba', 'bba', 'bcs', 'mcs',
+    'matriculation', 'intermediate', 'fsc', 'ics',
+)
+INSTITUTION_INDICATORS = ('university', 'college', 'school', 'institute')
+COMPANY_WORK_WORDS = ('solutions', 'systems', 'technologies', 'consulting', 'software')
+
+# Experience keywords - STRICT (only clear job indicators)
+EXPERIENCE_JOB_TITLES = (
+    'software engineer', 'data analyst', 'project manager', 'team lead',
+    'senior developer', 'junior developer', 'intern at', 'trainee at',
+    'consultant at', 'analyst at', 'engineer at', 'manager at',
+    'developer at', 'designer at', 'coordinator at', 'specialist at',
+    'associate at', 'executive at', 'director at', 'ceo', 'cto',
+)
+
+# Work-specific phrases (not common in education)
+EXPERIENCE_PHRASES = (
+    'employed at', 'worked at', 'working at', 'hired by',
+    'full-time position', 'part-time position', 'contract position',
+    'remote position', 'on-site position', 'employment period',
+    'job responsibilities', 'reported to', 'supervised team',
+    'company:', 'employer:', 'organization:', 'firm:',
+)
+
+
+# ─────────────────────────────────────────────────────────────────────
+#  Rule declarations
+# ─────────────────────────────────────────────────────────────────────
+
+class Terms(NamedTuple):
+    """Substring indicators looked for in one part of an entry ('text' = the whole entry)."""
+    terms: Tuple[str, ...]
+    part: str = 'text'
+    unless: Tuple[str, ...] = ()  # no hits at all if any of these is in the part
+
+
+class AnomalyRule(NamedTuple):
+    """
+    One anomaly check. `value`, `details` and `message` are str.format
+    templates over the entry (skill / title / company / degree / institution,
+    or the candidate_info key), the joined hits of each indicator group and
+    `indicator_text` (hits of the `indicators` groups, all groups if empty;
+    also available as the list `indicators`). Issues with a `record` key
+    append the entry (or its `record_fields`) to anomalies['details'][record].
+    """
+    type: str
+    field: str                  # candidate_info | skills | experience | education
+    severity: str               # high | medium | low
+    kind: str                   # missing | terms | indicators | duplicate
+    message: str
+    details: str
+    value: str
+    record: Optional[str] = None
+    record_fields: Tuple[str, ...] = ()
+    key: str = 'key'            # candidate_info key / entry key for duplicates
+    terms: Tuple[str, ...] = ()
+    groups: Tuple[Tuple[str, Terms], ...] = ()
+    match: Tuple[Tuple[str, ...], ...] = ()
+    indicators: Tuple[str, ...] = ()
+    ignore: Tuple[str, ...] = ()
+
+
+ANOMALY_RULES: Tuple[AnomalyRule, ...] = (
+    # Missing critical contact information - HIGH SEVERITY
+    AnomalyRule(
+        'missing_name', 'candidate_info', 'high', MISSING,
+        key='name', terms=NAME_PLACEHOLDERS, value='{value}',
+        details='Candidate name is missing or unclear. This shows lack of professionalism and basic resume knowledge. A professional candidate always clearly states their name at the top.',
+        message='Missing/unclear candidate name: "{name}"',
+    ),
+    AnomalyRule(
+        'missing_email', 'candidate_info', 'high', MISSING,
+        key='email', value='{value}',
+        details='Email address is missing. This is a critical contact method and shows lack of basic resume sense. No email = cannot contact for interviews. This indicates the candidate does not understand professional job application standards.',
+        message='Missing email address',
+    ),
+    AnomalyRule(
+        'missing_phone', 'candidate_info', 'high', MISSING,
+        key='phone', value='{value}',
+        details='Phone number is missing. This is essential for urgent communication and interview scheduling. Missing contact info shows the candidate lacks basic understanding of job application requirements and professionalism.',
+        message='Missing phone number',
+    ),
+    AnomalyRule(
+        'language_as_skill', 'skills', 'medium', TERMS,
+        terms=SPOKEN_LANGUAGES, record='languages_in_skills', value='{skill}',
+        details='Spoken language "{skill}" listed as technical skill - should be in separate Languages section',
+        message='Language as skill: {skill}',
+    ),
+    AnomalyRule(
+        'generic_software', 'skills', 'low', TERMS,
+        terms=GENERIC_SOFTWARE, record='generic_software_in_skills', value='{skill}',
+        details='Generic software "{skill}" has low value for technical roles',
+        message='Generic software: {skill}',
+    ),
+    # Flag only if BOTH a degree and an institution are found,
+    # OR a degree type is explicitly mentioned in the job title
+    AnomalyRule(
+        'education_in_experience', 'experience', 'high', INDICATORS,
+        groups=(
+            ('degrees', Terms(DEGREE_INDICATORS)),
+            ('institutions', Terms(INSTITUTION_INDICATORS, 'company', unless=COMPANY_WORK_WORDS)),
+            ('degree_in_title', Terms(DEGREE_INDICATORS, 'title')),
+        ),
+        match=(('degrees', 'institutions'), ('degree_in_title',)),
+        indicators=('degrees', 'institutions'),
+        record='education_in_experience', record_fields=('title', 'company', 'indicators'),
+        value='{title} at {company}',
+        details='Education content found in work experience: degree "{degrees}" or institution "{institutions}"',
+        message='Education in experience: {title}',
+    ),
+    # Only clear job indicators (not generic action words)
+    AnomalyRule(
+        'experience_in_education', 'education', 'high', INDICATORS,
+        groups=(
+            ('job_titles', Terms(EXPERIENCE_JOB_TITLES)),
+            ('work_phrases', Terms(EXPERIENCE_PHRASES)),
+        ),
+        match=(('job_titles',), ('work_phrases',)),
+        record='experience_in_education', record_fields=('degree', 'institution', 'indicators'),
+        value='{degree} at {institution}',
+        details='Work position/company name found in education: "{indicator_text}"',
+        message='Experience in education: {degree}',
+    ),
+    AnomalyRule(
+        'duplicate_skill', 'skills', 'low', DUPLICATE,
+        record='duplicate_skills', value='{skill}',
+        details='Duplicate skill "{skill}" found',
+        message='Duplicate: {skill}',
+    ),
+    AnomalyRule(
+        'duplicate_experience', 'experience', 'medium', DUPLICATE,
+        ignore=('_',), record='duplicate_experiences', value='{title} at {company}',
+        details='Duplicate experience entry found',
+        message='Duplicate: {title}',
+    ),
+)
+
+
+# ─────────────────────────────────────────────────────────────────────
+#  Entries
+# ─────────────────────────────────────────────────────────────────────
+# Each entry of a list field is normalized once into a context dict shared by
+# every rule: the raw parts (for templates), 'text' (lowercase parts joined by
+# a space; indicator scans), 'key' (duplicate detection), 'item' (the entry
+# itself, recorded by rules without record_fields), 'cut' (end of the first
+# part in 'text') and, for fields with
+# indicator rules, 'hits' (term -> the parts it occurs in, 'text' always).
+ENTRY_PARTS = {
+    'experience': ('title', 'company'),
+    'education': ('degree', 'institution'),
+}
+
+
+def _entry(field: str, item: Any) -> Dict[str, Any]:
+    if field == 'skills':
+        text = item.lower().strip()
+        return {'item': item, 'skill': item, 'text': text, 'key': text}
+    first, second = ENTRY_PARTS[field]
+    a, b = item.get(first, ''), item.get(second, '')
+    a_lower, b_lower = a.lower(), b.lower()
+    return {'item': item, first: a, second: b,
+            'text': f"{a_lower} {b_lower}", 'key': f"{a_lower}_{b_lower}", 'cut': len(a_lower)}
+
+
+_PLACEHOLDER = re.compile(r'\{(\w+)\}')
+
+
+def _template(template: str) -> Callable[[Dict[str, Any]], Any]:
+    """Formatter of a template; a lone '{name}' passes the value through unformatted."""
+    lone = _PLACEHOLDER.fullmatch(template)
+    if lone:
+        name = lone.group(1)
+        return lambda context: context[name]
+    return lambda context: template.format(**context)
+
+
+class _CompiledRule(NamedTuple):
+    rule: AnomalyRule
+    evaluate: Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]]
+    value: Callable
+    details: Callable
+    message: Callable
+
+
+# ─────────────────────────────────────────────────────────────────────
+#  Engine
+# ─────────────────────────────────────────────────────────────────────
+
+class RuleEngine:
+    """Compiled anomaly rules, with per-rule hit / timing counters."""
+
+    # Normalized list-field entries (with their indicator hits) kept across resumes
+    ENTRY_CACHE_SIZE = 4096
+
+    def __init__(self, rules: Tuple[AnomalyRule, ...] = ANOMALY_RULES):
+        self.rules = tuple(rules)
+        self.fields = tuple(dict.fromkeys(rule.field for rule in self.rules))
+        self.records = tuple(dict.fromkeys(rule.record for rule in self.rules if rule.record))
+
+        # One substring lexicon per field, covering every indicator of every rule
+        indicator_terms: Dict[str, set] = {}
+        for rule in self.rules:
+            for _, group in rule.groups:
+                indicator_terms.setdefault(rule.field, set()).update(group.terms, group.unless)
+        self._lexicons = {field: SkillLexicon(terms, boundary=NONE, strip=False)
+                          for field, terms in indicator_terms.items()}
+
+        self._compiled = [self._compile(rule) for rule in self.rules]
+
+        self._entry_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    # ─────────────────────────────────────────────────────────────────
+    #  Evaluation
+    # ─────────────────────────────────────────────────────────────────
+    def evaluate(self, parsed_data: Dict) -> Tuple[List[Dict[str, Any]], Dict[str, List]]:
+        """Issues (in rule order) and per-record details of one parsed resume."""
+        issues: List[Dict[str, Any]] = []
+        details: Dict[str, List] = {record: [] for record in self.records}
+        entries: Dict[str, List[Dict[str, Any]]] = {}
+        scans: Dict[str, float] = {}
+        timings = []
+        clock = time.perf_counter
+
+        for compiled in self._compiled:
+            rule = compiled.rule
+            field_entries = entries.get(rule.field)
+            if field_entries is None:
+                start = clock()
+                field_entries = entries[rule.field] = self._entries(rule.field, parsed_data)
+                scans[rule.field] = clock() - start
+
+            start = clock()
+            hits = compiled.evaluate(field_entries)
+            for context in hits:
+                if rule.record:
+                    details[rule.record].append(
+                        {name: context[name] for name in rule.record_fields}
+                        if rule.record_fields else context['item'])
+                issues.append({
+                    'type': rule.type,
+                    'severity': rule.severity,
+                    'field': rule.field,
+                    'value': compiled.value(context),
+                    'details': compiled.details(context),
+                    'message': compiled.message(context),
+                })
+            timings.append((len(field_entries), len(hits), clock() - start))
+
+        with self._lock:
+            self.resumes += 1
+            for counters, (evaluations, hits, seconds) in zip(self._rule_counters, timings):
+                counters[0] += evaluations
+                counters[1] += hits
+                counters[2] += seconds
+            for field, seconds in scans.items():
+                counters = self._field_counters[field]
+                counters[0] += len(entries[field])
+                counters[1] += seconds
+
+        return issues, details
+
+    def _entries(self, field: str, parsed_data: Dict) -> List[Dict[str, Any]]:
+        if field == 'candidate_info':
+            return [parsed_data.get('candidate_info', {})]
+        return [self._cached_entry(field, item) for item in parsed_data.get(field, [])]
+
+    def _cached_entry(self, field: str, item: Any) -> Dict[str, Any]:
+        """Context of one entry, from the entry cache when an entry with the same content was seen."""
+        if field == 'skills':
+            key = (field, item)
+        else:
+            first, second = ENTRY_PARTS[field]
+            key = (field, item.get(first, ''), item.get(second, ''))
+        try:
+            with self._lock:
+                cached = self._entry_cache.get(key)
+                if cached is not None:
+                    self._entry_cache.move_to_end(key)
+                    self.entry_hits += 1
+                    return dict(cached, item=item)
+                self.entry_misses += 1
+        except TypeError:  # unhashable parts: not cached
+            key = None
+
+        context = _entry(field, item)
+        lexicon = self._lexicons.get(field)
+        if lexicon is not None:
+            first, second = ENTRY_PARTS[field]
+            hits: Dict[str, set] = {}
+            cut = context['cut']  # offset of the space joining the two parts
+            for start, term in lexicon.occurrences(context['text']):
+                parts = hits.get(term)
+                if parts is None:
+                    parts = hits[term] = {'text'}
+                if start + len(term) <= cut:
+                    parts.add(first)
+                elif start > cut:
+                    parts.add(second)
+            context['hits'] = hits
+
+        if key is not None and self.ENTRY_CACHE_SIZE > 0:
+            with self._lock:
+                self._entry_cache[key] = {name: value for name, value in context.items() if name != 'item'}
+                while len(self._entry_cache) > self.ENTRY_CACHE_SIZE:
+                    self._entry_cache.popitem(last=False)
+        return context
+
+    # ─────────────────────────────────────────────────────────────────
+    #  Compilation
+    # ─────────────────────────────────────────────────────────────────
+    def _compile(self, rule: AnomalyRule) -> _CompiledRule:
+        compilers = {
+            MISSING: self._compile_missing,
+            TERMS: self._compile_terms,
+            INDICATORS: self._compile_indicators,
+            DUPLICATE: self._compile_duplicate,
+        }
+        if rule.kind not in compilers:
+            raise ValueError(f"Unknown anomaly rule kind: {rule.kind}")
+        return _CompiledRule(rule, compilers[rule.kind](rule),
+                             _template(rule.value), _template(rule.details), _template(rule.message))
+
+    @staticmethod
+    def _compile_missing(rule: AnomalyRule):
+        placeholders = rule.terms  # tuple: membership by equality, values need not be hashable
+
+        def evaluate(entries):
+            info = entries[0]
+            present = info.get(rule.key)
+            if not present or present in placeholders:
+                return [{rule.key: info.get(rule.key, ''), 'value': present or 'Not provided'}]
+            return []
+        return evaluate
+
+    @staticmethod
+    def _compile_terms(rule: AnomalyRule):
+        terms = frozenset(rule.terms)
+
+        def evaluate(entries):
+            return [context for context in entries if context['text'] in terms]
+        return evaluate
+
+    @staticmethod
+    def _compile_duplicate(rule: AnomalyRule):
+        key, ignore = rule.key, frozenset(rule.ignore)
+
+        def evaluate(entries):
+            seen = set()
+            duplicates = []
+            for context in entries:
+                value = context[key]
+                if value in seen and value not in ignore:
+                    duplicates.append(context)
+                else:
+                    seen.add(value)
+            return duplicates
+        return evaluate
+
+    @staticmethod
+    def _compile_indicators(rule: AnomalyRule):
+        # Terms of each group ranked by declaration, so hits keep a stable order
+        groups = [(name, group, {term: rank for rank, term in enumerate(group.terms)}, frozenset(group.unless))
+                  for name, group in rule.groups]
+        reported = rule.indicators or tuple(name for name, _ in rule.groups)
+
+        def evaluate(entries):
+            fired = []
+            for context in entries:
+                hits = context['hits']
+                if not hits:
+                    continue
+                found = {}
+                for name, group, ranks, unless in groups:
+                    part = group.part
+                    if unless and any(term in unless and part in parts for term, parts in hits.items()):
+                        found[name] = []
+                        continue
+                    terms = [term for term, parts in hits.items() if term in ranks and part in parts]
+                    if len(terms) > 1:
+                        terms.sort(key=ranks.__getitem__)
+                    found[name] = terms
+                if any(all(found[name] for name in alternative) for alternative in rule.match):
+                    indicators = [term for name in reported for term in found[name]]
+                    hit = dict(context, indicators=indicators, indicator_text=", ".join(indicators))
+                    hit.update((name, ", ".join(terms)) for name, terms in found.items())
+                    fired.append(hit)
+            return fired
+        return evaluate
+
+    # ─────────────────────────────────────────────────────────────────
+    #  Stats
+    # ─────────────────────────────────────────────────────────────────
+    def reset_stats(self):
+        with self._lock:
+            self.resumes = 0
+            self.entry_hits = 0
+            self.entry_misses = 0
+            self._rule_counters = [[0, 0, 0.0] for _ in self.rules]
+            self._field_counters = {field: [0, 0.0] for field in self.fields}
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-rule evaluations / hits / time and per-field entry normalization + scan time."""
+        with self._lock:
+            rules = {}
+            for rule, (evaluations, hits, seconds) in zip(self.rules, self._rule_counters):
+                rules[rule.type] = {
+                    'field': rule.field,
+                    'kind': rule.kind,
+                    'severity': rule.severity,
+                    'evaluations': evaluations,
+                    'hits': hits,
+                    'hit_rate': round(hits / evaluations, 4) if evaluations else 0.0,
+                    'total_ms': round(seconds * 1000, 3),
+                    'avg_us': round(seconds * 1e6 / self.resumes, 2) if self.resumes else 0.0,
+                }
+            fields = {
+                field: {
+                    'entries': entries,
+                    'total_ms': round(seconds * 1000, 3),
+                    'avg_us': round(seconds * 1e6 / self.resumes, 2) if self.resumes else 0.0,
+                }
+                for field, (entries, seconds) in self._field_counters.items()
+            }
+            lookups = self.entry_hits + self.entry_misses
+            entry_cache = {
+                'entries': len(self._entry_cache),
+                'hits': self.entry_hits,
+                'misses': self.entry_misses,
+                'hit_rate': round(self.entry_hits / lookups, 4) if lookups else 0.0,
+            }
+            return {'resumes': self.resumes, 'rules': rules, 'fields': fields, 'entry_cache': entry_cache}
+
+
+# Shared engine (every AnomalyDetector evaluates through it unless given another)
+anomaly_rule_engine = RuleEngine()
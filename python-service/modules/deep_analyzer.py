@@ -7,44 +7,25 @@ and extracts recommended keywords from the resume.
 
 import re
 import math
+import os
 import logging
-from typing import Dict, List, Tuple
+import threading
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from modules.skill_taxonomy import TECH_SKILLS, SOFT_SKILLS, ANALYZER_LEXICON
+from modules.resume_document import ResumeDocument, SENTENCE_SPLIT
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # ------------------------------------------------------------------ #
 #  Skill / Keyword database
+#  (TECH_SKILLS / SOFT_SKILLS are defined in modules.skill_taxonomy)
 # ------------------------------------------------------------------ #
-TECH_SKILLS = {
-    "python", "java", "javascript", "typescript", "c++", "c#", "ruby", "go",
-    "rust", "swift", "kotlin", "php", "scala", "r", "matlab", "perl",
-    "react", "angular", "vue", "next.js", "node.js", "express", "django",
-    "flask", "spring", "spring boot", ".net", "laravel", "rails",
-    "html", "css", "sass", "tailwind", "bootstrap",
-    "sql", "mysql", "postgresql", "mongodb", "redis", "firebase",
-    "aws", "azure", "gcp", "docker", "kubernetes", "terraform",
-    "git", "github", "gitlab", "ci/cd", "jenkins", "devops",
-    "machine learning", "deep learning", "nlp", "computer vision",
-    "tensorflow", "pytorch", "scikit-learn", "pandas", "numpy",
-    "data science", "data analysis", "data engineering", "big data",
-    "rest api", "graphql", "microservices", "agile", "scrum",
-    "linux", "unix", "bash", "powershell",
-    "figma", "photoshop", "illustrator", "ui/ux",
-    "jira", "confluence", "trello", "slack",
-    "selenium", "cypress", "jest", "pytest", "junit",
-    "blockchain", "web3", "solidity", "ethereum",
-    "power bi", "tableau", "excel", "sap", "oracle",
-}
-
-SOFT_SKILLS = {
-    "leadership", "communication", "teamwork", "problem solving",
-    "critical thinking", "time management", "project management",
-    "mentoring", "presentation", "negotiation", "collaboration",
-    "adaptability", "creativity", "attention to detail", "analytical",
-    "strategic thinking", "decision making", "conflict resolution",
-}
-
 ACTION_VERBS = {
     "achieved", "managed", "developed", "implemented", "designed",
     "led", "created", "built", "delivered", "optimized", "improved",
@@ -54,6 +35,24 @@ ACTION_VERBS = {
     "established", "generated", "transformed", "collaborated",
 }
 
+# Informal words, matched as whole words ("etc." counts as "etc")
+INFORMAL_WORDS = ("gonna", "wanna", "gotta", "stuff", "things", "etc")
+
+_VOWEL_GROUP = re.compile(r'[aeiouy]+')
+_ASCII_WORD = re.compile(r'[a-z]{3,}')
+_JD_WORD = re.compile(r'\b[a-z]{3,}\b')
+
+# Skills a job description is scanned for (one fixed order for every JD)
+ALL_SKILLS = tuple(TECH_SKILLS | SOFT_SKILLS)
+
+
+@lru_cache(maxsize=65536)
+def syllable_count(word: str) -> int:
+    """Rough syllable count: vowel groups after dropping trailing e / s."""
+    word = word.lower().rstrip("es").rstrip("e")
+    return max(1, len(_VOWEL_GROUP.findall(word)))
+
+
 SECTION_KEYWORDS = {
     "education": ["education", "academic", "degree", "university", "college",
                   "bachelor", "master", "phd", "diploma", "certification"],
@@ -67,15 +66,212 @@ SECTION_KEYWORDS = {
     "certifications": ["certifications", "licenses", "credentials", "awards"],
 }
 
+# Section-level feature cache (incremental re-analysis of edited resumes)
+SECTION_CACHE_SIZE = int(os.getenv("ANALYZER_SECTION_CACHE_SIZE", "4096"))
+
+
+# ------------------------------------------------------------------ #
+#  Text statistics behind every score
+# ------------------------------------------------------------------ #
+def _sentence_counts(sentences: List[str], sentence_words: List[List[str]]) -> Tuple[int, int, int, int]:
+    """(sentences, long sentences, short fragments, repeated-word instances)"""
+    long_sentences = short_fragments = repeated = 0
+    for sentence, words in zip(sentences, sentence_words):
+        if len(words) > 35:
+            long_sentences += 1
+        if len(words) < 3 and not sentence.isupper():
+            short_fragments += 1
+        # words of 5+ letters used 3+ times in the same sentence
+        repeated += sum(1 for w, count in Counter(words).items() if count > 2 and len(w) > 4)
+    return len(sentences), long_sentences, short_fragments, repeated
+
+
+def _mentions(lower: str) -> Tuple[frozenset, frozenset]:
+    """Action verbs and SECTION_KEYWORDS sections mentioned in lowercase text"""
+    verbs = frozenset(v for v in ACTION_VERBS if v in lower)
+    sections = frozenset(section for section, keywords in SECTION_KEYWORDS.items()
+                         if any(kw in lower for kw in keywords))
+    return verbs, sections
+
+
+def _word_stats(word_counts: Counter, term_counts: Counter) -> tuple:
+    """
+    (informal words, past-tense terms, present-participle terms, complex words,
+     lowercase vocabulary of 4+ character words, 3+ letter ASCII terms)
+    """
+    informal = sum(term_counts[w] for w in INFORMAL_WORDS)
+    past = sum(count for term, count in term_counts.items() if len(term) > 2 and term.endswith("ed"))
+    present = sum(count for term, count in term_counts.items() if len(term) > 3 and term.endswith("ing"))
+    # >3 syllables approximation, counted once per distinct word
+    complex_words = sum(count for w, count in word_counts.items() if syllable_count(w) >= 4)
+    vocabulary = frozenset(w.lower() for w in word_counts if len(w) > 3)
+    terms = frozenset(term for term in term_counts if _ASCII_WORD.fullmatch(term))
+    return informal, past, present, complex_words, vocabulary, terms
+
+
+class DocumentStats(NamedTuple):
+    """Whole-resume statistics the grammar / structure / readability / ATS scores read"""
+    sentence_count: int
+    long_sentences: int        # > 35 words
+    short_fragments: int       # < 3 words, not all caps
+    repeated_words: int        # 5+ letter words used 3+ times in one sentence
+    word_count: int
+    informal_words: int
+    past_tense: int
+    present_tense: int
+    complex_words: int
+    vocabulary: frozenset
+    terms: frozenset
+    action_verbs: frozenset
+    section_keywords: frozenset
+    skills: Iterable[str]
+
+    @classmethod
+    def of(cls, doc: ResumeDocument) -> "DocumentStats":
+        """Statistics of the whole document, from its shared views"""
+        verbs, sections = _mentions(doc.lower)
+        return cls(*_sentence_counts(doc.sentences, doc.sentence_words), len(doc.words),
+                   *_word_stats(doc.word_counts, doc.term_counts), verbs, sections,
+                   ANALYZER_LEXICON.scan(doc.lower))
+
+    @classmethod
+    def merge(cls, parts: List["BlockFeatures"]) -> "DocumentStats":
+        """
+        Statistics of the document made of these consecutive blocks (joined
+        by newlines); equal to DocumentStats.of(document).
+        """
+        totals = [0, 0, 0, 0]
+
+        def close(piece: str):
+            sentence = piece.strip()
+            if len(sentence) > 5:
+                for i, n in enumerate(_sentence_counts([sentence], [sentence.lower().split()])):
+                    totals[i] += n
+
+        pending = None  # sentence still open at the end of the previous block
+        for part in parts:
+            head = part.head if pending is None else f"{pending}\n{part.head}"
+            if part.broken:
+                close(head)
+                for i, n in enumerate(part.sentences):
+                    totals[i] += n
+                pending = part.tail
+            else:
+                pending = head
+        if pending is not None:
+            close(pending)
+
+        def total(field):
+            return sum(getattr(part, field) for part in parts)
+
+        def union(field):
+            return frozenset().union(*(getattr(part, field) for part in parts))
+
+        return cls(*totals, total("word_count"), total("informal_words"), total("past_tense"),
+                   total("present_tense"), total("complex_words"), union("vocabulary"), union("terms"),
+                   union("action_verbs"), union("section_keywords"), union("skills"))
+
+
+class BlockFeatures(NamedTuple):
+    """
+    Statistics of one block of lines (a paragraph of a section), combinable
+    with its neighbours' by DocumentStats.merge.
+
+    Sentences may run across blocks, so only the complete sentences inside
+    the block are counted; the text before its first and after its last
+    sentence break is kept for the merge to join with the neighbours.
+    """
+    head: str                  # text before the first sentence break
+    tail: str                  # text after the last sentence break
+    broken: bool               # any sentence break at all (else head == tail == text)
+    sentences: Tuple[int, int, int, int]  # _sentence_counts of the complete sentences
+    word_count: int
+    informal_words: int
+    past_tense: int
+    present_tense: int
+    complex_words: int
+    vocabulary: frozenset
+    terms: frozenset
+    action_verbs: frozenset
+    section_keywords: frozenset
+    skills: frozenset
+
+
+@lru_cache(maxsize=SECTION_CACHE_SIZE)
+def block_features(text: str) -> BlockFeatures:
+    """Features of one block's text (cached by content: unchanged blocks are never recomputed)"""
+    doc = ResumeDocument(text)
+    pieces = SENTENCE_SPLIT.split(text)
+    inner = [s for s in (part.strip() for part in pieces[1:-1]) if len(s) > 5]
+    return BlockFeatures(
+        pieces[0], pieces[-1], len(pieces) > 1,
+        _sentence_counts(inner, [s.lower().split() for s in inner]),
+        len(doc.words),
+        *_word_stats(doc.word_counts, doc.term_counts),
+        *_mentions(doc.lower),
+        frozenset(ANALYZER_LEXICON.scan(doc.lower)),
+    )
+
+
+def section_cache_stats() -> Dict[str, int]:
+    """Hit / miss counters of the block feature cache"""
+    info = block_features.cache_info()
+    lookups = info.hits + info.misses
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "hit_rate": round(info.hits / lookups, 4) if lookups else 0.0,
+        "entries": info.currsize,
+        "max_entries": info.maxsize,
+    }
+
+
+class JobDescription:
+    """
+    A job description preprocessed once, for scoring any number of resumes:
+    lowercase text, its 3+ letter words (ATS keyword overlap) and the
+    taxonomy skills it mentions (keyword recommendations / missing skills).
+    Plain attributes, so it pickles cheaply to analyze_many workers.
+    """
+
+    def __init__(self, text: str):
+        self.text = text or ""
+        self.lower = self.text.lower()
+        self.words = frozenset(_JD_WORD.findall(self.lower))
+        self.skills = tuple(skill for skill in ALL_SKILLS if skill in self.lower)
+
+    @classmethod
+    def of(cls, source: Union[str, "JobDescription"]) -> "JobDescription":
+        """Return source unchanged if it already is compiled, else compile the text"""
+        return source if isinstance(source, JobDescription) else cls(source)
+
 
 class DeepResumeAnalyzer:
     """Deeply analyzes a resume and returns grammar, structure,
        readability, ATS scores and recommended keywords."""
 
-    def analyze(self, resume_text: str, job_description: str = "") -> Dict:
+    # analyze_many: batches smaller than this are analyzed in-process
+    PARALLEL_MIN_BATCH = 4
+
+    def __init__(self):
+        # Worker pool for analyze_many (created on first parallel batch, then reused)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_workers = 0
+        self._pool_lock = threading.Lock()
+
+    def analyze(self, resume_text: Union[str, ResumeDocument],
+                job_description: Union[str, JobDescription] = "", incremental: bool = False) -> Dict:
         """
         Run all analysis and return a single result dict.
 
+        resume_text may be a prebuilt ResumeDocument (e.g. the one the parser
+        already built) so lines, words and sentences are not derived twice;
+        job_description may be a compiled JobDescription shared across resumes.
+
+        incremental=True (edited resubmissions) derives the statistics block by
+        block (section paragraphs) through the block_features cache, so only
+        the parts whose text changed are recomputed; the result is the same.
+
         Returns:
             {
                 grammar_score, structure_score, readability_score, ats_score,
@@ -84,20 +280,24 @@ class DeepResumeAnalyzer:
                 section_analysis, metrics
             }
         """
-        if not resume_text or len(resume_text.strip()) < 30:
+        doc = self._document(resume_text)
+        if len(doc.text.strip()) < 30:
             return self._empty_result("Resume text too short for analysis")
+        jd = JobDescription.of(job_description)
 
-        text = resume_text.strip()
-        lower = text.lower()
+        if incremental:
+            stats = DocumentStats.merge([block_features(block) for block in doc.section_blocks])
+        else:
+            stats = DocumentStats.of(doc)
 
         # --- individual analyses ---
-        grammar   = self._score_grammar(text)
-        structure = self._score_structure(text, lower)
-        readability = self._score_readability(text)
-        skills_info = self._extract_skills(lower)
-        ats       = self._score_ats(text, lower, skills_info, structure, job_description)
-        keywords  = self._recommend_keywords(skills_info, job_description)
-        job_match = self._match_job(skills_info, job_description)
+        grammar   = self._score_grammar(stats)
+        structure = self._score_structure(doc, stats)
+        readability = self._score_readability(doc, stats)
+        skills_info = self._skills_info(stats.skills)
+        ats       = self._score_ats(doc, stats, skills_info, structure, jd)
+        keywords  = self._recommend_keywords(skills_info, jd)
+        job_match = self._match_job(skills_info, jd)
 
         overall = round(
             ats["score"] * 0.35
@@ -126,7 +326,7 @@ class DeepResumeAnalyzer:
             "suggestions": suggestions[:10],
             "section_analysis": structure["sections"],
             "metrics": {
-                "word_count": len(text.split()),
+                "word_count": stats.word_count,
                 "sentence_count": grammar["sentence_count"],
                 "action_verbs_used": grammar["action_verb_count"],
                 "bullet_points": structure["bullet_count"],
@@ -135,45 +335,140 @@ class DeepResumeAnalyzer:
             },
         }
 
+    def ats_score(self, resume_text: Union[str, ResumeDocument],
+                  job_description: Union[str, JobDescription] = "") -> int:
+        """analyze()'s ats_score alone (no grammar, readability or keyword passes), for ranking"""
+        doc = self._document(resume_text)
+        if len(doc.text.strip()) < 30:
+            return 0
+        stats = DocumentStats.of(doc)
+        structure = self._score_structure(doc, stats)
+        ats = self._score_ats(doc, stats, self._skills_info(stats.skills), structure,
+                              JobDescription.of(job_description))
+        return ats["score"]
+
+    def analyze_many(self, resume_texts: Sequence[Union[str, ResumeDocument]],
+                     job_description: Union[str, JobDescription] = "",
+                     workers: Optional[int] = None) -> List[Dict]:
+        """
+        analyze() for many resumes against one job description, in input order.
+
+        The JD is compiled once and shared by every resume. Batches of at
+        least PARALLEL_MIN_BATCH resumes are spread over a process pool
+        (reused across calls); results equal analyze()'s. If a worker dies,
+        the chunks it took down are retried once on a rebuilt pool, then
+        analyzed in-process; nothing is cancelled on the shared pool.
+        """
+        return self._run_many(resume_texts, job_description, workers,
+                              _analyze_chunk_in_worker, self.analyze)
+
+    def ats_scores(self, resume_texts: Sequence[Union[str, ResumeDocument]],
+                   job_description: Union[str, JobDescription] = "",
+                   workers: Optional[int] = None) -> List[int]:
+        """ats_score() for many resumes, batched like analyze_many()"""
+        return self._run_many(resume_texts, job_description, workers,
+                              _score_chunk_in_worker, self.ats_score)
+
+    def _run_many(self, resume_texts, job_description, workers, chunk_worker, analyze_one) -> List:
+        """analyze_one over every resume: in-process for small batches, else chunked over the pool"""
+        jd = JobDescription.of(job_description)
+        workers = workers or min(4, os.cpu_count() or 1)
+        if len(resume_texts) < self.PARALLEL_MIN_BATCH or workers <= 1:
+            return [analyze_one(text, jd) for text in resume_texts]
+
+        # Ship documents as fresh ones (text only, no cached views)
+        items = [ResumeDocument(t.text) if isinstance(t, ResumeDocument) else t for t in resume_texts]
+        chunk_size = max(1, math.ceil(len(items) / (workers * 4)))
+        chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+        done: List[Optional[List]] = [None] * len(chunks)
+        unfinished = list(range(len(chunks)))
+        for _ in range(2):  # first run + one rebuilt pool
+            pool = self._get_pool(workers)
+            futures = []
+            for c in unfinished:
+                try:
+                    futures.append((c, pool.submit(chunk_worker, chunks[c], jd)))
+                except BrokenProcessPool:
+                    futures.append((c, None))
+            unfinished = []
+            for c, future in futures:
+                try:
+                    if future is None:
+                        raise BrokenProcessPool("pool broken before submit")
+                    done[c] = future.result()
+                except Exception as e:
+                    logger.warning(f"[DeepAnalyzer] Worker failed ({e}) on {len(chunks[c])} resumes")
+                    unfinished.append(c)
+            if not unfinished:
+                break
+            self._discard_pool(pool)
+
+        for c in unfinished:
+            # Still failing on a fresh pool: analyze these chunks here instead
+            done[c] = [analyze_one(text, jd) for text in chunks[c]]
+        return [result for chunk_results in done for result in chunk_results]
+
+    def close(self):
+        """Shut down the analyze_many worker pool"""
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+
+    @staticmethod
+    def _document(resume_text: Union[str, ResumeDocument]) -> ResumeDocument:
+        if isinstance(resume_text, ResumeDocument):
+            return resume_text
+        return ResumeDocument((resume_text or "").strip())
+
+    def _discard_pool(self, pool: ProcessPoolExecutor):
+        """Forget a broken pool (unless a concurrent caller already replaced it)"""
+        with self._pool_lock:
+            if self._pool is pool:
+                self._pool = None
+        pool.shutdown(wait=False)
+
+    def _get_pool(self, workers: int) -> ProcessPoolExecutor:
+        with self._pool_lock:
+            if self._pool is None or self._pool_workers != workers:
+                if self._pool is not None:
+                    self._pool.shutdown(wait=False)
+                self._pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_analyze_worker)
+                self._pool_workers = workers
+            return self._pool
+
     # ================================================================ #
     #  GRAMMAR
     # ================================================================ #
-    def _score_grammar(self, text: str) -> Dict:
+    def _score_grammar(self, stats: DocumentStats) -> Dict:
         score = 85  # start optimistic
         issues: List[str] = []
         suggestions: List[str] = []
 
-        sentences = [s.strip() for s in re.split(r'[.!?]+', text) if len(s.strip()) > 5]
-        sentence_count = len(sentences)
+        sentence_count = stats.sentence_count
 
         # 1. Sentence length distribution
-        long_sentences = [s for s in sentences if len(s.split()) > 35]
+        long_sentences = stats.long_sentences
         if long_sentences:
-            penalty = min(len(long_sentences) * 3, 15)
+            penalty = min(long_sentences * 3, 15)
             score -= penalty
-            issues.append(f"{len(long_sentences)} overly long sentences (>35 words)")
+            issues.append(f"{long_sentences} overly long sentences (>35 words)")
             suggestions.append("Break long sentences into shorter, clearer ones")
 
-        short_fragments = [s for s in sentences if len(s.split()) < 3 and not s.isupper()]
-        if len(short_fragments) > 3:
+        short_fragments = stats.short_fragments
+        if short_fragments > 3:
             score -= 5
-            issues.append(f"{len(short_fragments)} very short fragments detected")
-
-        # 2. Repeated words (within same sentence)
-        repeated = 0
-        for s in sentences:
-            words = s.lower().split()
-            for w in set(words):
-                if len(w) > 4 and words.count(w) > 2:
-                    repeated += 1
+            issues.append(f"{short_fragments} very short fragments detected")
+
+        # 2. Repeated words (within same sentence): words of 5+ letters used 3+ times
+        repeated = stats.repeated_words
         if repeated > 3:
             score -= min(repeated * 2, 10)
             issues.append(f"Repetitive wording detected ({repeated} instances)")
             suggestions.append("Vary vocabulary to make the resume more engaging")
 
         # 3. Action verbs bonus
-        text_lower = text.lower()
-        action_count = sum(1 for v in ACTION_VERBS if v in text_lower)
+        action_count = len(stats.action_verbs)
         if action_count >= 8:
             score += 5
         elif action_count < 3:
@@ -182,15 +477,14 @@ class DeepResumeAnalyzer:
             suggestions.append("Start bullet points with action verbs like 'Developed', 'Led', 'Implemented'")
 
         # 4. Spelling-like heuristics (common typos / informal)
-        informal = re.findall(r'\b(gonna|wanna|gotta|stuff|things|etc\.?)\b', text_lower)
+        informal = stats.informal_words
         if informal:
-            score -= len(informal) * 2
+            score -= informal * 2
             issues.append("Informal language detected")
             suggestions.append("Replace informal words with professional alternatives")
 
         # 5. Consistent tense (past tense verbs ending in -ed vs present gerunds)
-        past = len(re.findall(r'\b\w+ed\b', text_lower))
-        present = len(re.findall(r'\b\w+ing\b', text_lower))
+        past, present = stats.past_tense, stats.present_tense
         if past > 0 and present > 0:
             ratio = min(past, present) / max(past, present)
             if ratio > 0.6:
@@ -210,16 +504,16 @@ class DeepResumeAnalyzer:
     # ================================================================ #
     #  STRUCTURE
     # ================================================================ #
-    def _score_structure(self, text: str, lower: str) -> Dict:
+    def _score_structure(self, doc: ResumeDocument, stats: DocumentStats) -> Dict:
+        text = doc.text
         score = 70
         issues: List[str] = []
         suggestions: List[str] = []
         sections_found: Dict[str, bool] = {}
 
         # Check which sections exist
-        for section, keywords in SECTION_KEYWORDS.items():
-            found = any(kw in lower for kw in keywords)
-            sections_found[section] = found
+        for section in SECTION_KEYWORDS:
+            sections_found[section] = section in stats.section_keywords
 
         present = [k for k, v in sections_found.items() if v]
         missing = [k for k, v in sections_found.items() if not v]
@@ -249,7 +543,7 @@ class DeepResumeAnalyzer:
             suggestions.append("Use bullet points to list achievements and responsibilities")
 
         # Length check
-        word_count = len(text.split())
+        word_count = stats.word_count
         if word_count < 150:
             score -= 10
             issues.append(f"Resume is too short ({word_count} words)")
@@ -272,15 +566,14 @@ class DeepResumeAnalyzer:
     # ================================================================ #
     #  READABILITY
     # ================================================================ #
-    def _score_readability(self, text: str) -> Dict:
+    def _score_readability(self, doc: ResumeDocument, stats: DocumentStats) -> Dict:
+        text = doc.text
         score = 80
         issues: List[str] = []
         suggestions: List[str] = []
 
-        words = text.split()
-        word_count = len(words)
-        sentences = [s.strip() for s in re.split(r'[.!?]+', text) if len(s.strip()) > 5]
-        sentence_count = max(len(sentences), 1)
+        word_count = stats.word_count
+        sentence_count = max(stats.sentence_count, 1)
 
         # Average sentence length
         avg_sentence_len = word_count / sentence_count
@@ -292,11 +585,7 @@ class DeepResumeAnalyzer:
             score -= 3
 
         # Complex words (>3 syllables approximation)
-        def syllable_count(w):
-            w = w.lower().rstrip("es").rstrip("e")
-            return max(1, len(re.findall(r'[aeiouy]+', w)))
-
-        complex_words = sum(1 for w in words if syllable_count(w) >= 4)
+        complex_words = stats.complex_words
         complex_ratio = complex_words / max(word_count, 1)
         if complex_ratio > 0.15:
             score -= 7
@@ -313,7 +602,7 @@ class DeepResumeAnalyzer:
             suggestions.append("Break content into clear paragraphs and sections")
 
         # Vocabulary diversity
-        unique_words = len(set(w.lower() for w in words if len(w) > 3))
+        unique_words = len(stats.vocabulary)
         diversity = unique_words / max(word_count, 1)
         if diversity > 0.55:
             score += 5  # rich vocabulary
@@ -329,9 +618,10 @@ class DeepResumeAnalyzer:
     #  ATS SCORE
     # ================================================================ #
     def _score_ats(
-        self, text: str, lower: str, skills_info: Dict, structure: Dict,
-        job_description: str
+        self, doc: ResumeDocument, stats: DocumentStats, skills_info: Dict, structure: Dict,
+        jd: JobDescription
     ) -> Dict:
+        text, lower = doc.text, doc.lower
         score = 60
         issues: List[str] = []
         suggestions: List[str] = []
@@ -368,10 +658,9 @@ class DeepResumeAnalyzer:
         score += core_present * 3
 
         # 4. Keyword match to job description
-        if job_description and len(job_description) > 20:
-            jd_lower = job_description.lower()
-            jd_words = set(re.findall(r'\b[a-z]{3,}\b', jd_lower))
-            resume_words = set(re.findall(r'\b[a-z]{3,}\b', lower))
+        if len(jd.text) > 20:
+            jd_words = jd.words
+            resume_words = stats.terms
             overlap = jd_words & resume_words
             if len(jd_words) > 0:
                 match_pct = len(overlap) / len(jd_words) * 100
@@ -386,7 +675,7 @@ class DeepResumeAnalyzer:
             issues.append("Special box-drawing characters detected (ATS unfriendly)")
             suggestions.append("Use simple formatting, avoid tables and text boxes")
 
-        if len(re.findall(r'\t', text)) > 10:
+        if text.count('\t') > 10:
             score -= 3
             issues.append("Excessive tabs detected")
 
@@ -397,37 +686,30 @@ class DeepResumeAnalyzer:
     #  SKILLS EXTRACTION
     # ================================================================ #
     def _extract_skills(self, lower: str) -> Dict:
-        # Use word-boundary matching to avoid false positives
-        # (e.g., "r" matching inside "experienced", "go" inside "google",
-        #  "java" inside "javascript", "scala" inside "scalable")
-        SUBSTR_CONFLICTS = {"java", "scala", "r", "go", "c#", "c++", "ruby", "rust", "swift", "sass"}
-        tech = []
-        for s in TECH_SKILLS:
-            if s in SUBSTR_CONFLICTS or len(s) <= 3:
-                # Strict word-boundary match
-                pattern = r'(?<![a-zA-Z/])' + re.escape(s) + r'(?![a-zA-Z])'
-                if re.search(pattern, lower):
-                    tech.append(s)
-            else:
-                if s in lower:
-                    tech.append(s)
-        tech = sorted(set(tech))
-        soft = sorted(s for s in SOFT_SKILLS if s in lower)
+        # One pass over the text; short / ambiguous skills are matched on
+        # letter boundaries (e.g., "r" must not match inside "experienced",
+        # "go" inside "google", "java" inside "javascript")
+        return self._skills_info(ANALYZER_LEXICON.scan(lower))
+
+    @staticmethod
+    def _skills_info(found: Iterable[str]) -> Dict:
+        found = set(found)
+        tech = sorted(s for s in found if s in TECH_SKILLS)
+        soft = sorted(s for s in found if s in SOFT_SKILLS)
         return {"tech": tech, "soft": soft, "all": tech + soft}
 
     # ================================================================ #
     #  KEYWORD RECOMMENDATIONS
     # ================================================================ #
-    def _recommend_keywords(self, skills_info: Dict, job_description: str) -> List[str]:
+    def _recommend_keywords(self, skills_info: Dict, jd: JobDescription) -> List[str]:
         """Return keywords the candidate should highlight or add."""
         found = set(s.lower() for s in skills_info["all"])
         recommendations: List[str] = []
 
         # If there is a job description, suggest missing JD keywords
-        if job_description and len(job_description) > 20:
-            jd_lower = job_description.lower()
-            for skill in TECH_SKILLS | SOFT_SKILLS:
-                if skill in jd_lower and skill not in found:
+        if len(jd.text) > 20:
+            for skill in jd.skills:
+                if skill not in found:
                     recommendations.append(skill)
 
         # Always return the skills already in the resume as "recommended keywords"
@@ -441,14 +723,12 @@ class DeepResumeAnalyzer:
     # ================================================================ #
     #  JOB MATCHING
     # ================================================================ #
-    def _match_job(self, skills_info: Dict, job_description: str) -> Dict:
-        if not job_description or len(job_description) < 20:
+    def _match_job(self, skills_info: Dict, jd: JobDescription) -> Dict:
+        if len(jd.text) < 20:
             return {"matched": skills_info["all"], "missing": [], "score": 0}
 
-        jd_lower = job_description.lower()
-        matched = [s for s in skills_info["all"] if s in jd_lower]
-        jd_skills = [s for s in TECH_SKILLS | SOFT_SKILLS if s in jd_lower]
-        missing = [s for s in jd_skills if s not in skills_info["all"]]
+        matched = [s for s in skills_info["all"] if s in jd.lower]
+        missing = [s for s in jd.skills if s not in skills_info["all"]]
         return {"matched": matched, "missing": missing[:10], "score": len(matched)}
 
     # ================================================================ #
@@ -463,3 +743,22 @@ class DeepResumeAnalyzer:
             "weaknesses": [reason], "suggestions": [],
             "section_analysis": {}, "metrics": {},
         }
+
+
+# ------------------------------------------------------------------ #
+#  analyze_many worker processes
+# ------------------------------------------------------------------ #
+_worker_analyzer: Optional[DeepResumeAnalyzer] = None
+
+
+def _init_analyze_worker():
+    global _worker_analyzer
+    _worker_analyzer = DeepResumeAnalyzer()
+
+
+def _analyze_chunk_in_worker(items: List[Union[str, ResumeDocument]], jd: JobDescription) -> List[Dict]:
+    return [_worker_analyzer.analyze(item, jd) for item in items]
+
+
+def _score_chunk_in_worker(items: List[Union[str, ResumeDocument]], jd: JobDescription) -> List[int]:
+    return [_worker_analyzer.ats_score(item, jd) for item in items]
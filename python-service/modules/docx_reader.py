@@ -0,0 +1,104 @@
+"""
+VeriResume DOCX Reader
+Streams paragraph and table-cell text out of word/document.xml without
+building the python-docx object model
+"""
+
+import io
+import zipfile
+from typing import BinaryIO, Iterator, Optional, Union
+from xml.etree import ElementTree
+
+W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+MC_FALLBACK = '{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback'
+
+W_BODY = W_NS + 'body'
+W_P = W_NS + 'p'
+W_T = W_NS + 't'
+W_TC = W_NS + 'tc'
+W_TBL = W_NS + 'tbl'
+
+# Run-level elements rendered as characters (same mapping as python-docx Run.text)
+W_CHARS = {
+    W_NS + 'tab': '\t',
+    W_NS + 'ptab': '\t',
+    W_NS + 'br': '\n',
+    W_NS + 'cr': '\n',
+    W_NS + 'noBreakHyphen': '-',
+}
+
+DOCUMENT_PART = 'word/document.xml'
+
+
+def iter_docx_paragraphs(source: Union[str, bytes, bytearray, BinaryIO],
+                         max_chars: Optional[int] = None) -> Iterator[str]:
+    """
+    Yield paragraph texts of a DOCX in document order, table cells included.
+
+    word/document.xml is parsed incrementally and every finished paragraph /
+    table is cleared, so memory stays flat however long the document is, and
+    reading stops as soon as max_chars characters have been produced.
+
+    Body paragraphs are yielded even when empty (blank lines separate blocks,
+    like python-docx's doc.paragraphs); empty table-cell paragraphs are skipped.
+    Raises zipfile.BadZipFile / KeyError / ElementTree.ParseError on files
+    that are not a readable DOCX.
+    """
+    if isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(source)
+
+    remaining = max_chars
+    with zipfile.ZipFile(source) as archive, archive.open(DOCUMENT_PART) as xml:
+        runs_stack = []      # text pieces of each open paragraph (text boxes nest)
+        cell_depth = 0       # > 0 while inside a table cell
+        fallback_depth = 0   # > 0 inside mc:Fallback (duplicate of mc:Choice content)
+        body = None
+
+        for event, elem in ElementTree.iterparse(xml, events=('start', 'end')):
+            tag = elem.tag
+            if event == 'start':
+                if tag == MC_FALLBACK:
+                    fallback_depth += 1
+                elif fallback_depth:
+                    continue
+                elif tag == W_P:
+                    runs_stack.append([])
+                elif tag == W_TC:
+                    cell_depth += 1
+                elif tag == W_BODY:
+                    body = elem
+                continue
+
+            if tag == MC_FALLBACK:
+                fallback_depth -= 1
+                elem.clear()
+                continue
+            if fallback_depth:
+                continue
+
+            if tag == W_T:
+                if runs_stack and elem.text:
+                    runs_stack[-1].append(elem.text)
+            elif tag in W_CHARS:
+                if runs_stack:
+                    runs_stack[-1].append(W_CHARS[tag])
+            elif tag == W_P:
+                text = ''.join(runs_stack.pop()) if runs_stack else ''
+                elem.clear()
+                if cell_depth and not text.strip():
+                    continue
+                if remaining is not None:
+                    if len(text) >= remaining:
+                        yield text[:remaining]
+                        return
+                    remaining -= len(text) + 1  # joined with '\n'
+                yield text
+            elif tag == W_TC:
+                cell_depth -= 1
+                elem.clear()
+            elif tag == W_TBL:
+                elem.clear()
+
+            # Drop finished top-level blocks so the tree never grows
+            if body is not None and tag in (W_P, W_TBL) and len(body) > 64:
+                del body[:-1]
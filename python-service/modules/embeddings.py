@@ -0,0 +1,277 @@
+# -*- coding: utf-8 -*-
+"""
+VeriResume - Embedding Backend
+Optional dense-embedding semantic similarity (sentence-transformers) for the
+JobMatcher and resume ranking, with an on-disk embedding cache.
+
+  - the model is loaded lazily, on first encode, on CPU
+  - texts are batch-encoded; every vector is stored as float16 under the
+    SHA-256 of (model name, text), so a job or resume text is encoded once ever
+  - cache tiers: in-process LRU + optional SQLite file (like ParseCache)
+
+TF-IDF (modules.job_index) stays the default: the backend is only used when
+EMBEDDING_MODEL names a local model and sentence-transformers is installed.
+"""
+
+import hashlib
+import importlib.util
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingCache:
+    """Two-tier (memory LRU + optional SQLite) store of float16 vectors."""
+
+    def __init__(self, max_entries: int = 20000, db_path: Optional[str] = None):
+        self.max_entries = max_entries
+        self.db_path = db_path
+
+        self._memory: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        if db_path:
+            self._open_db()
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, np.ndarray]:
+        """Cached float16 vectors for the keys that have one."""
+        found = {}
+        with self._lock:
+            pending = []
+            for key in keys:
+                vector = self._memory.get(key)
+                if vector is not None:
+                    self._memory.move_to_end(key)
+                    found[key] = vector
+                else:
+                    pending.append(key)
+            on_disk = self._db_get_many(pending)
+            for key, vector in on_disk.items():
+                self._memory_put(key, vector)
+                found[key] = vector
+            self.hits += len(found)
+            self.disk_hits += len(on_disk)
+            self.misses += len(pending) - len(on_disk)
+        return found
+
+    def put_many(self, items: Dict[str, np.ndarray]) -> None:
+        items = {key: np.asarray(vector, dtype=np.float16) for key, vector in items.items()}
+        with self._lock:
+            for key, vector in items.items():
+                self._memory_put(key, vector)
+            self._db_put_many(items)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "memory_entries": len(self._memory),
+                "max_entries": self.max_entries,
+                "db_path": self.db_path,
+                "db_entries": self._db_count(),
+            }
+
+    def _memory_put(self, key: str, vector: np.ndarray) -> None:
+        if self.max_entries <= 0:
+            return
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _open_db(self) -> None:
+        try:
+            folder = os.path.dirname(os.path.abspath(self.db_path))
+            os.makedirs(folder, exist_ok=True)
+            self._db = sqlite3.connect(self.db_path, timeout=10, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                " key TEXT PRIMARY KEY,"
+                " vector BLOB NOT NULL,"
+                " created REAL NOT NULL)"
+            )
+            self._db.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"[Embeddings] Disk cache disabled ({self.db_path}): {e}")
+            self._db = None
+
+    def _db_get_many(self, keys: List[str]) -> Dict[str, np.ndarray]:
+        if self._db is None or not keys:
+            return {}
+        found = {}
+        try:
+            # SQLite caps bound parameters per statement
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                rows = self._db.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({','.join('?' * len(chunk))})", chunk
+                )
+                for key, blob in rows:
+                    found[key] = np.frombuffer(blob, dtype=np.float16)
+        except sqlite3.Error as e:
+            logger.warning(f"[Embeddings] Disk read failed: {e}")
+        return found
+
+    def _db_put_many(self, items: Dict[str, np.ndarray]) -> None:
+        if self._db is None or not items:
+            return
+        try:
+            now = time.time()
+            self._db.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector, created) VALUES (?, ?, ?)",
+                [(key, vector.tobytes(), now) for key, vector in items.items()],
+            )
+            self._db.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"[Embeddings] Disk write failed: {e}")
+
+    def _db_count(self) -> int:
+        if self._db is None:
+            return 0
+        try:
+            return self._db.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+        except sqlite3.Error:
+            return 0
+
+
+class EmbeddingBackend:
+    """
+    Lazily loaded sentence-transformers encoder with a content-addressed cache.
+
+    `model` may be passed in (anything with SentenceTransformer's encode());
+    otherwise model_name (a local path or an already-downloaded model) is
+    loaded on the first encode() that misses the cache.
+    """
+
+    def __init__(self, model_name: str, cache: Optional[EmbeddingCache] = None,
+                 batch_size: int = 32, model: Any = None):
+        self.model_name = model_name
+        self.cache = cache if cache is not None else EmbeddingCache()
+        self.batch_size = batch_size
+        self._model = model
+        self._load_lock = threading.Lock()
+        self.encoded = 0
+
+    @staticmethod
+    def installed() -> bool:
+        return importlib.util.find_spec("sentence_transformers") is not None
+
+    def key(self, text: str) -> str:
+        return hashlib.sha256(f"{self.model_name}\0{text}".encode("utf-8")).hexdigest()
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        """L2-normalized float32 embeddings (len(texts) x dim); each distinct text encoded once ever."""
+        keys = [self.key(text) for text in texts]
+        vectors = self.cache.get_many(dict.fromkeys(keys))
+
+        missing = {key: text for key, text in zip(keys, texts) if key not in vectors}
+        if missing:
+            encoded = self.model().encode(
+                list(missing.values()), batch_size=self.batch_size, convert_to_numpy=True,
+                normalize_embeddings=True, show_progress_bar=False,
+            )
+            fresh = dict(zip(missing, np.asarray(encoded, dtype=np.float16)))
+            self.cache.put_many(fresh)
+            vectors.update(fresh)
+            self.encoded += len(fresh)
+
+        if not keys:
+            return np.zeros((0, 0), dtype=np.float32)
+        matrix = np.vstack([vectors[key] for key in keys]).astype(np.float32)
+        # Re-normalize after the float16 round trip
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return matrix / np.where(norms == 0, 1, norms)
+
+    def similarity(self, query: str, texts: List[str]) -> np.ndarray:
+        """Cosine similarity of query to each text."""
+        if not texts:
+            return np.zeros(0)
+        return self.encode(texts) @ self.encode([query])[0]
+
+    def model(self):
+        if self._model is None:
+            with self._load_lock:
+                if self._model is None:
+                    from sentence_transformers import SentenceTransformer
+                    started = time.perf_counter()
+                    self._model = SentenceTransformer(self.model_name, device="cpu")
+                    logger.info(f"[Embeddings] Loaded {self.model_name} in "
+                                f"{time.perf_counter() - started:.1f}s")
+        return self._model
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "model": self.model_name,
+            "loaded": self._model is not None,
+            "encoded": self.encoded,
+            "cache": self.cache.stats(),
+        }
+
+
+class EmbeddingSemantic:
+    """
+    JobMatcher semantic scorer on embeddings (same interface as JobFeatureIndex).
+
+    Embedding cosines of related texts sit higher than TF-IDF ones, so they are
+    mapped linearly from [FLOOR, CEILING] onto 0-100.
+    """
+
+    FLOOR = 0.15
+    CEILING = 0.75
+
+    def __init__(self, backend: EmbeddingBackend):
+        self.backend = backend
+
+    def semantic_scores(self, resume_text: str, features: List) -> List[float]:
+        return self.semantic_matrix([resume_text], features)[0].tolist()
+
+    def semantic_matrix(self, resume_texts: List[str], features: List):
+        """Scores 0-100 (resumes x jobs); empty texts keep the neutral 50."""
+        scores = np.full((len(resume_texts), len(features)), 50.0)
+        resumes = [i for i, text in enumerate(resume_texts) if text.strip()]
+        present = [i for i, f in enumerate(features) if f.text.strip()]
+        if not resumes or not present:
+            return scores
+
+        job_vectors = self.backend.encode([features[i].text for i in present])
+        resume_vectors = self.backend.encode([resume_texts[i] for i in resumes])
+        sims = resume_vectors @ job_vectors.T
+        scores[np.ix_(resumes, present)] = np.clip(
+            (sims - self.FLOOR) / (self.CEILING - self.FLOOR) * 100, 0, 100)
+        return scores
+
+
+def load_embedding_backend() -> Optional[EmbeddingBackend]:
+    """Backend configured by EMBEDDING_MODEL, or None (TF-IDF only)."""
+    model_name = os.getenv("EMBEDDING_MODEL")
+    if not model_name:
+        return None
+    if not EmbeddingBackend.installed():
+        logger.warning("[Embeddings] EMBEDDING_MODEL set but sentence-transformers is not installed")
+        return None
+    cache = EmbeddingCache(
+        max_entries=int(os.getenv("EMBEDDING_CACHE_SIZE", "20000")),
+        db_path=os.getenv("EMBEDDING_CACHE_DB") or None,
+    )
+    return EmbeddingBackend(model_name, cache, batch_size=int(os.getenv("EMBEDDING_BATCH_SIZE", "32")))
+
+
+# Shared backend (None unless configured)
+embedding_backend = load_embedding_backend()
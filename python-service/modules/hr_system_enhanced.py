@@ -42,20 +42,22 @@ class HRSystem:
         
         print("[HRSystem] ✅ All components initialized successfully")
     
-    def process_resume(self, file_path: str, job_description: str = "") -> Dict[str, Any]:
+    def process_resume(self, file_path, job_description: str = "",
+                       file_name: Optional[str] = None) -> Dict[str, Any]:
         """
         Process resume and provide comprehensive analysis
         
         Args:
-            file_path: Path to resume file
+            file_path: Path to resume file, or its bytes when parsed in memory
             job_description: Job description to match against
+            file_name: Original file name for in-memory data (format detection)
             
         Returns:
             Dict with analysis results
         """
         try:
             # Parse resume
-            parsed_data = self.parser.parse_resume(file_path)
+            parsed_data = self.parser.parse_resume(file_path, file_name=file_name)
             
             # Detect anomalies
             anomalies = self.anomaly_detector.detect_anomalies(parsed_data)
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""
+VeriResume - Job Description Profiles
+A job description compiled once and shared by every endpoint that scores
+resumes against it (/api/analyze-resume, /api/rank-resumes,
+/api/hr/bulk-screen-resumes):
+
+  - lowercase text, word set and taxonomy skills (deep analyzer keyword targets)
+  - its dense embedding, when an embedding backend is configured
+
+Only views an endpoint reads are compiled: HRCode's job matcher (behind
+/api/rank-resumes and the HRCode path of /api/analyze-resume) takes the raw
+JD text.
+
+Profiles live in a bounded in-process LRU keyed by the SHA-256 of the JD
+text, so an HR user screening many batches against one posting pays for
+the JD analysis once.
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List
+
+import numpy as np
+
+from modules.deep_analyzer import JobDescription
+
+
+def jd_key(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class JobDescriptionProfile:
+    """Everything derived from one job description text."""
+
+    def __init__(self, text: str):
+        self.text = text or ""
+        self.key = jd_key(self.text)
+        # Deep analyzer view: lowercase text, 3+ letter words, taxonomy skills
+        self.analysis = JobDescription(self.text)
+        self._embeddings: Dict[str, Any] = {}
+
+    def embedding(self, backend):
+        """L2-normalized embedding of the JD under `backend` (encoded once per model)."""
+        vector = self._embeddings.get(backend.model_name)
+        if vector is None:
+            vector = backend.encode([self.text])[0]
+            self._embeddings[backend.model_name] = vector
+        return vector
+
+    def similarity(self, backend, texts: List[str]) -> np.ndarray:
+        """Cosine similarity of the JD to each text under `backend`."""
+        if not texts:
+            return np.zeros(0)
+        return backend.encode(texts) @ self.embedding(backend)
+
+
+class JobDescriptionCache:
+    """Bounded LRU of compiled JobDescriptionProfiles, with hit / miss counters."""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._profiles: "OrderedDict[str, JobDescriptionProfile]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, text: str) -> JobDescriptionProfile:
+        """Profile of the JD text, compiled on first use."""
+        key = jd_key(text or "")
+        with self._lock:
+            profile = self._profiles.get(key)
+            if profile is not None:
+                self._profiles.move_to_end(key)
+                self.hits += 1
+                return profile
+            self.misses += 1
+
+        # Compile outside the lock; a concurrent miss on the same JD just compiles twice
+        profile = JobDescriptionProfile(text)
+        if self.max_entries > 0:
+            with self._lock:
+                self._profiles[key] = profile
+                self._profiles.move_to_end(key)
+                while len(self._profiles) > self.max_entries:
+                    self._profiles.popitem(last=False)
+        return profile
+
+    def __len__(self) -> int:
+        return len(self._profiles)
+
+    def clear(self):
+        with self._lock:
+            self._profiles.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "entries": len(self._profiles),
+                "max_entries": self.max_entries,
+            }
+
+
+# Shared cache (JD_CACHE_SIZE profiles)
+jd_profiles = JobDescriptionCache(int(os.getenv("JD_CACHE_SIZE", "256")))
@@ -0,0 +1,777 @@
+# -*- coding: utf-8 -*-
+"""
+VeriResume - Job Feature Index
+Precomputed job-side matching features, built when jobs are scraped / ingested
+and reused by every match request.
+
+Each job is stored under its URL / ID plus a hash of its content, with:
+  - skill set (extract_skills_from_text, title-word fallback)
+  - required years of experience
+  - lowercased title
+  - a row of term counts in a corpus-level TF-IDF model over the indexed jobs
+
+The TF-IDF model is maintained incrementally: adding or removing a job only
+updates its counts and the document-frequency table, and IDF weights are
+applied when a request reads the rows. It is refitted from scratch
+(compaction) once enough jobs have come and gone since the last fit, on a
+background thread, while the current model keeps serving.
+
+A match request then only vectorizes the resume and runs one sparse
+matrix-vector product against the stored job rows. The index persists to a
+single .npz file (no pickle) so it survives restarts.
+"""
+
+import bisect
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import Counter, OrderedDict
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from modules.skill_taxonomy import SKILL_ALIASES, MATCHER_LEXICON
+
+logger = logging.getLogger(__name__)
+
+try:
+    import numpy as np
+    from scipy import sparse
+    from sklearn.feature_extraction.text import CountVectorizer
+    from sklearn.preprocessing import normalize
+
+    HAS_SEMANTIC = True
+except ImportError:
+    HAS_SEMANTIC = False
+    logger.warning("[JobIndex] scikit-learn not available, semantic scores disabled")
+
+INDEX_FORMAT_VERSION = 3
+
+# Vectorizer settings for the corpus model
+TFIDF_PARAMS = {
+    'stop_words': 'english',
+    'max_features': 5000,
+    'ngram_range': (1, 2),  # unigrams + bigrams for better context
+}
+
+# Required-experience phrasings, tried in order
+EXPERIENCE_PATTERNS = [
+    re.compile(r'(\d+)\+?\s*(?:years?|yrs?)\s*(?:of)?\s*(?:experience|exp)'),
+    re.compile(r'(?:experience|exp).*?(\d+)\+?\s*(?:years?|yrs?)'),
+    re.compile(r'(\d+)\s*-\s*\d+\s*(?:years?|yrs?)'),
+]
+
+
+class JobFeatures(NamedTuple):
+    """Job-side inputs of every JobMatcher signal"""
+    entry_id: str            # "<key>#<content hash>"
+    key: str                 # job URL / ID (or title|company|location)
+    title: str
+    title_lower: str
+    text: str                # "<title> <description>"
+    skills: frozenset        # normalized skills (title words when none found)
+    required_years: int      # 0 = not stated
+
+
+# ─────────────────────────────────────────────────────────────────
+#  Feature extraction
+# ─────────────────────────────────────────────────────────────────
+def job_text(job: Dict) -> str:
+    """Title + description, the text every job feature is derived from."""
+    title = (job.get("title") or "").strip()
+    description = (job.get("description") or "").strip()
+    return f"{title} {description}"
+
+
+def job_key(job: Dict) -> str:
+    """Stable identity of a job: URL, then ID, then title|company|location."""
+    for field in ("url", "id", "jobId", "_id"):
+        value = job.get(field)
+        if value:
+            return str(value)
+    return "|".join(str(job.get(f) or "").strip().lower() for f in ("title", "company", "location"))
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+
+
+def required_years(text: str) -> int:
+    """Years of experience a job asks for (0 when it does not say)."""
+    lower = text.lower()
+    for pattern in EXPERIENCE_PATTERNS:
+        m = pattern.search(lower)
+        if m:
+            return int(m.group(1))
+    return 0
+
+
+def extract_job_features(job: Dict) -> JobFeatures:
+    text = job_text(job)
+    key = job_key(job)
+    title = (job.get("title") or "").strip()
+    title_lower = title.lower()
+
+    skills = MATCHER_LEXICON.find(text)
+    if not skills:
+        # Fallback: treat words in title as pseudo-skills
+        skills = {SKILL_ALIASES.get(w, w) for w in title_lower.split() if len(w) > 2}
+
+    return JobFeatures(
+        entry_id=f"{key}#{content_hash(text)}",
+        key=key,
+        title=title,
+        title_lower=title_lower,
+        text=text,
+        skills=frozenset(skills),
+        required_years=required_years(text),
+    )
+
+
+class JobColumns(NamedTuple):
+    """Columnar job features (one row per job) for vectorized scoring"""
+    skills: Any                  # CSR 0/1, jobs x skill_vocab
+    skill_vocab: Dict[str, int]
+    skill_counts: Any            # skills per job
+    title_ids: Any               # index into titles
+    titles: List[str]            # distinct title_lower values
+    required_years: Any
+
+    def take(self, rows) -> "JobColumns":
+        """Rows `rows` (in that order), same vocabularies."""
+        rows = np.asarray(rows, dtype=np.intp)
+        return self._replace(
+            skills=self.skills[rows], skill_counts=self.skill_counts[rows],
+            title_ids=self.title_ids[rows], required_years=self.required_years[rows],
+        )
+
+
+def _indicator(rows_of_tokens: List[Iterable], vocab: Dict[str, int]):
+    """CSR 0/1 matrix of tokens per row, growing `vocab` as it goes."""
+    indptr, indices = [0], []
+    for tokens in rows_of_tokens:
+        for token in tokens:
+            indices.append(vocab.setdefault(token, len(vocab)))
+        indptr.append(len(indices))
+    return sparse.csr_matrix((np.ones(len(indices)), indices, indptr),
+                             shape=(len(rows_of_tokens), max(len(vocab), 1)))
+
+
+def build_columns(features: List[JobFeatures]) -> JobColumns:
+    skill_vocab: Dict[str, int] = {}
+    title_vocab: Dict[str, int] = {}
+    return JobColumns(
+        skills=_indicator([f.skills for f in features], skill_vocab),
+        skill_vocab=skill_vocab,
+        skill_counts=np.array([len(f.skills) for f in features], dtype=np.float64),
+        title_ids=np.array([title_vocab.setdefault(f.title_lower, len(title_vocab)) for f in features],
+                           dtype=np.intp),
+        titles=list(title_vocab),
+        required_years=np.array([f.required_years for f in features], dtype=np.float64),
+    )
+
+
+class IncrementalTfidf:
+    """
+    TF-IDF over a changing job corpus, without refitting on every change.
+
+    Stores raw term counts per job, in the chunks they were added in, plus
+    the document frequency of each term. Only the rows a query asks for are
+    weighted (smoothed IDF, L2 norm - as TfidfVectorizer), with the IDF of
+    the moment, so they always reflect the current corpus and no change
+    costs a pass over the whole matrix. The vocabulary is fixed at fit time:
+    terms first seen later are ignored until the next refit, like by a
+    fitted vectorizer. Removed rows stay allocated until then. A query
+    (resume) still counts its out-of-vocabulary terms in its L2 norm, with
+    the IDF of a term no job has, so its cosines are not inflated by the
+    terms the fit never saw.
+
+    Not thread-safe on its own: JobFeatureIndex guards it with its lock.
+    """
+
+    # Chunks added since the fit are merged (never the fitted rows) beyond this many
+    MAX_CHUNKS = 32
+
+    def __init__(self, vocabulary: Dict[str, int], counts, ids: List[str],
+                 fitted_docs: Optional[int] = None, churn: int = 0):
+        self.vocabulary = {term: int(col) for term, col in vocabulary.items()}
+        self.vectorizer = CountVectorizer(**dict(TFIDF_PARAMS, vocabulary=self.vocabulary))
+        self._analyze = self.vectorizer.build_analyzer()
+        counts = sparse.csr_matrix(counts, dtype=np.float64)
+        self._chunks = [counts]
+        self._offsets = [0]                      # first row of each chunk
+        self.rows: Dict[str, int] = {entry_id: row for row, entry_id in enumerate(ids)}
+        self._allocated = len(ids)
+        self.df = np.bincount(counts.indices, minlength=len(self.vocabulary)).astype(np.int64)
+        self.n_docs = len(ids)
+        self.fitted_docs = len(ids) if fitted_docs is None else fitted_docs
+        self.churn = churn                       # jobs added + removed since the fit
+        self._idf = None
+
+    @classmethod
+    def fit(cls, ids: List[str], texts: List[str]) -> "IncrementalTfidf":
+        vectorizer = CountVectorizer(**TFIDF_PARAMS)
+        counts = vectorizer.fit_transform(texts)
+        return cls(vectorizer.vocabulary_, counts, ids)
+
+    @property
+    def drift(self) -> float:
+        """Share of the corpus added or removed since the fit."""
+        return self.churn / max(self.fitted_docs, 1)
+
+    @property
+    def idf(self):
+        idf = self._idf
+        if idf is None:
+            idf = self._idf = np.log((1 + self.n_docs) / (1 + self.df)) + 1
+        return idf
+
+    def add(self, ids: List[str], texts: List[str]) -> None:
+        counts = sparse.csr_matrix(self.vectorizer.transform(texts), dtype=np.float64)
+        self._chunks.append(counts)
+        self._offsets.append(self._allocated)
+        if len(self._chunks) > self.MAX_CHUNKS:
+            self._chunks = [self._chunks[0], sparse.vstack(self._chunks[1:], format="csr")]
+            self._offsets = self._offsets[:2]
+        for entry_id in ids:
+            self.rows[entry_id] = self._allocated
+            self._allocated += 1
+        self.df += np.bincount(counts.indices, minlength=len(self.df))
+        self.n_docs += len(ids)
+        self.churn += len(ids)
+        self._idf = None
+
+    def remove(self, entry_id: str) -> None:
+        row = self.rows.pop(entry_id, None)
+        if row is None:
+            return
+        c = bisect.bisect_right(self._offsets, row) - 1
+        chunk, local = self._chunks[c], row - self._offsets[c]
+        self.df[chunk.indices[chunk.indptr[local]:chunk.indptr[local + 1]]] -= 1
+        self.n_docs -= 1
+        self.churn += 1
+        self._idf = None
+
+    def counts(self, entry_ids: List[str]):
+        """Raw count rows (a copy) of the given entries, or None if one is not in the model."""
+        rows = [self.rows.get(entry_id) for entry_id in entry_ids]
+        if any(row is None for row in rows):
+            return None
+        return self._take(np.array(rows, dtype=np.int64))
+
+    def tfidf(self, entry_ids: List[str]):
+        """TF-IDF rows of the given entries, or None if one is not in the model."""
+        counts = self.counts(entry_ids)
+        return None if counts is None else self.weigh(counts, self.idf)
+
+    def live(self):
+        """(entry ids, count rows) of the entries still in the model."""
+        ids = sorted(self.rows, key=self.rows.get)
+        return ids, self._take(np.array([self.rows[entry_id] for entry_id in ids], dtype=np.int64))
+
+    def _take(self, rows):
+        """Count rows at allocated positions `rows`, gathered chunk by chunk, in order."""
+        if len(self._chunks) == 1:
+            return self._chunks[0][rows]
+        chunk_of = np.searchsorted(self._offsets, rows, side="right") - 1
+        order = np.argsort(chunk_of, kind="stable")
+        parts = [self._chunks[c][rows[order[chunk_of[order] == c]] - self._offsets[c]]
+                 for c in np.unique(chunk_of)]
+        if not parts:
+            return sparse.csr_matrix((0, len(self.vocabulary)))
+        stacked = sparse.vstack(parts, format="csr")
+        return stacked[np.argsort(order)]
+
+    def queries(self, texts: List[str], idf):
+        """
+        TF-IDF rows of query texts over the vocabulary, L2-normalized by the
+        norm of the full query: out-of-vocabulary terms count with the IDF of
+        a term of document frequency 0.
+        """
+        oov_idf = np.log(1 + self.n_docs) + 1
+        data, indices, indptr, norms = [], [], [0], []
+        for text in texts:
+            terms = Counter(self._analyze(text))
+            oov_sq = 0.0
+            for term, count in terms.items():
+                col = self.vocabulary.get(term)
+                if col is None:
+                    oov_sq += (count * oov_idf) ** 2
+                else:
+                    indices.append(col)
+                    data.append(count * idf[col])
+            row = np.asarray(data[indptr[-1]:], dtype=np.float64)
+            indptr.append(len(data))
+            norm = np.sqrt(row @ row + oov_sq)
+            norms.append(norm if norm > 0 else 1.0)
+        weighted = sparse.csr_matrix((np.asarray(data, dtype=np.float64), indices, indptr),
+                                     shape=(len(texts), len(self.vocabulary)))
+        weighted.sort_indices()
+        return sparse.diags(1 / np.asarray(norms)) @ weighted
+
+    @staticmethod
+    def weigh(counts, idf):
+        """TF-IDF rows from count rows (modified in place)."""
+        counts.data *= idf[counts.indices]
+        return normalize(counts, norm="l2", copy=False)
+
+
+# ─────────────────────────────────────────────────────────────────
+#  Index
+# ─────────────────────────────────────────────────────────────────
+class JobFeatureIndex:
+    """Thread-safe, LRU-bounded, persistent store of JobFeatures + corpus TF-IDF."""
+
+    CHANGE_LOG_SIZE = 50000     # inserts / removes kept for changes_since()
+
+    def __init__(self, path: Optional[str] = None, max_entries: int = 20000, compact_drift: float = 0.5):
+        self.path = path
+        self.max_entries = max_entries
+        self.compact_drift = compact_drift
+
+        self._entries: "OrderedDict[str, JobFeatures]" = OrderedDict()
+        self._by_key: Dict[str, str] = {}
+        self._postings: Dict[str, Set[str]] = {}   # skill -> entry ids
+        self._model: Optional[IncrementalTfidf] = None
+        self._columns = None                        # (JobColumns, entry_id -> row) snapshot
+        self._version = 0                           # bumped on every insert / remove
+        self._changes: List[Tuple[bool, str]] = []  # (inserted, entry id) of versions _changes_base+1..
+        self._changes_base = 0
+        self._compaction: Optional[threading.Thread] = None   # background refit
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._last_saved = 0.0
+
+        self.hits = 0
+        self.misses = 0
+        self.fits = 0
+        self.evictions = 0
+
+        if path and os.path.exists(path):
+            self.load(path)
+
+    # ─────────────────────────────────────────────────────────────────
+    #  Ingest / lookup
+    # ─────────────────────────────────────────────────────────────────
+    def add_jobs(self, jobs: Iterable[Dict], fit: bool = True) -> List[JobFeatures]:
+        """Index jobs (e.g. right after scraping); fit the corpus model unless fit=False."""
+        features = self.features_for(jobs)
+        if fit:
+            self._ensure_model(features)
+        return features
+
+    def features_for(self, jobs: Iterable[Dict]) -> List[JobFeatures]:
+        """Features of each job, from the index when its content is unchanged."""
+        results = []
+        with self._lock:
+            for job in jobs:
+                text = job_text(job)
+                entry_id = f"{job_key(job)}#{content_hash(text)}"
+                features = self._entries.get(entry_id)
+                if features is not None:
+                    self._entries.move_to_end(entry_id)
+                    self.hits += 1
+                else:
+                    features = extract_job_features(job)
+                    self._insert(features)
+                    self.misses += 1
+                results.append(features)
+        return results
+
+    def skill_candidates(self, skills: Set[str], features: List[JobFeatures]) -> List[int]:
+        """
+        Positions in `features` of jobs sharing at least one skill with `skills`.
+
+        Walks the inverted skill index instead of every job's skill set.
+        """
+        positions: Dict[str, List[int]] = {}
+        for pos, f in enumerate(features):
+            positions.setdefault(f.entry_id, []).append(pos)
+        wanted = positions.keys()
+
+        found: Set[str] = set()
+        with self._lock:
+            for skill in skills:
+                posting = self._postings.get(skill)
+                if posting:
+                    found |= posting & wanted
+        return sorted(pos for entry_id in found for pos in positions[entry_id])
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, job: Dict) -> bool:
+        return f"{job_key(job)}#{content_hash(job_text(job))}" in self._entries
+
+    # ─────────────────────────────────────────────────────────────────
+    #  Semantic scoring
+    # ─────────────────────────────────────────────────────────────────
+    def semantic_scores(self, resume_text: str, features: List[JobFeatures]) -> List[float]:
+        """
+        TF-IDF cosine of the resume to each job, scaled to 0-100.
+
+        Uses the corpus model (IDF over the indexed jobs); requested jobs not
+        part of it yet are added incrementally. Jobs with no text, or no
+        usable vocabulary, keep the neutral score 50.
+        """
+        if not HAS_SEMANTIC:
+            return [50.0] * len(features)
+        return self.semantic_matrix([resume_text], features)[0].tolist()
+
+    def semantic_matrix(self, resume_texts: List[str], features: List[JobFeatures]):
+        """semantic_scores for several resumes at once: array (resumes x jobs)."""
+        scores = np.full((len(resume_texts), len(features)), 50.0)
+        resumes = [i for i, text in enumerate(resume_texts) if text.strip()]
+        if not resumes:
+            return scores
+
+        present = [i for i, f in enumerate(features) if f.text.strip()]
+        if not present:
+            return scores
+
+        with self._lock:
+            model = self._ensure_model(features)
+            if model is None:
+                return scores
+            idf = model.idf
+            job_counts = model.counts([features[i].entry_id for i in present])
+        # Weighted outside the lock: only these rows, with the IDF read above
+        job_matrix = None if job_counts is None else model.weigh(job_counts, idf)
+        if job_matrix is None:
+            # Entry replaced mid-request (same key, new content): vectorize on the fly
+            job_matrix = model.weigh(
+                model.vectorizer.transform([features[i].text for i in present]).astype(np.float64), idf)
+        resume_matrix = model.queries([resume_texts[i] for i in resumes], idf)
+
+        # jobs x resumes: each cosine sums over the job row, as in a single mat-vec
+        sims = (job_matrix @ resume_matrix.T).toarray().T
+        # TF-IDF cosine typically 0-0.5 range, scale to 0-100
+        scores[np.ix_(resumes, present)] = np.clip(sims * 200, 0, 100)
+        return scores
+
+    @property
+    def version(self) -> int:
+        """Changes whenever a job is added or removed (for derived indexes to resync)."""
+        return self._version
+
+    def changes_since(self, version: int) -> Optional[Tuple[int, List[JobFeatures], List[str]]]:
+        """
+        (current version, jobs inserted, entry ids removed) since `version`,
+        netted per entry. None when the change log no longer reaches back
+        that far (trimmed, or the index was loaded / cleared): resync fully.
+        """
+        with self._lock:
+            if version is None or not self._changes_base <= version <= self._version:
+                return None
+            latest: Dict[str, bool] = {}
+            for inserted, entry_id in self._changes[version - self._changes_base:]:
+                latest[entry_id] = inserted
+            added = [self._entries[e] for e, inserted in latest.items() if inserted and e in self._entries]
+            removed = [e for e, inserted in latest.items() if not inserted]
+            return self._version, added, removed
+
+    def lookup(self, entry_ids: Iterable[str]) -> List[JobFeatures]:
+        """Features of the given entry ids that are still indexed, in order."""
+        with self._lock:
+            return [self._entries[e] for e in entry_ids if e in self._entries]
+
+    def all_features(self) -> List[JobFeatures]:
+        """Every indexed job, least recently used first."""
+        with self._lock:
+            return list(self._entries.values())
+
+    def columns(self, features: List[JobFeatures]) -> JobColumns:
+        """
+        Columnar features of `features`, in order.
+
+        Rows are gathered from a snapshot over the whole index, rebuilt only
+        when a requested job is not in it yet.
+        """
+        snapshot = self._columns
+        if snapshot is None or any(f.entry_id not in snapshot[1] for f in features):
+            with self._lock:
+                snapshot = self._columns
+                if snapshot is None or any(f.entry_id not in snapshot[1] for f in features):
+                    indexed = list(self._entries.values())
+                    rows = {f.entry_id: row for row, f in enumerate(indexed)}
+                    missing = [f for f in features if f.entry_id not in rows]
+                    for f in missing:
+                        # Replaced mid-request (same key, new content)
+                        rows.setdefault(f.entry_id, len(indexed))
+                        indexed.append(f)
+                    snapshot = self._columns = (build_columns(indexed), rows)
+        columns, rows = snapshot
+        return columns.take([rows[f.entry_id] for f in features])
+
+    def build(self) -> Optional[IncrementalTfidf]:
+        """Refit the corpus model over every indexed job, in the caller (first fit / explicit refit)."""
+        with self._lock:
+            model = self._fit(*self._corpus())
+            self._model = model
+            if model is not None:
+                self.fits += 1
+                self._dirty = True
+            return model
+
+    def wait_for_compaction(self, timeout: Optional[float] = None) -> bool:
+        """Block until a running background compaction has been swapped in; False on timeout."""
+        thread = self._compaction
+        if thread is not None:
+            thread.join(timeout)
+            return not thread.is_alive()
+        return True
+
+    def _ensure_model(self, features: List[JobFeatures]) -> Optional[IncrementalTfidf]:
+        """Corpus model covering `features`: added incrementally, refitted once drift is large."""
+        if not HAS_SEMANTIC:
+            return None
+        with self._lock:
+            model = self._model
+            if model is None:
+                return self.build()
+            missing = {f.entry_id: f.text for f in features
+                       if f.entry_id not in model.rows and f.entry_id in self._entries and f.text.strip()}
+            if missing:
+                model.add(list(missing), list(missing.values()))
+                self._dirty = True
+            if model.drift > self.compact_drift:
+                self._start_compaction()
+            return model
+
+    def _start_compaction(self):
+        """Refit on a background thread; the current model keeps answering (and taking changes) meanwhile."""
+        if self._compaction is not None and self._compaction.is_alive():
+            return
+        self._compaction = threading.Thread(target=self._compact, name="job-index-compaction", daemon=True)
+        self._compaction.start()
+
+    def _compact(self):
+        """Fit a snapshot off the lock, then swap it in, replaying the jobs added / removed meanwhile."""
+        try:
+            with self._lock:
+                version = self._version
+                ids, texts = self._corpus()
+            model = self._fit(ids, texts)
+            with self._lock:
+                changes = self.changes_since(version)
+                if model is None or changes is None:
+                    return  # nothing to fit, or the index was reloaded / cleared meanwhile
+                _, added, removed = changes
+                for entry_id in removed:
+                    model.remove(entry_id)
+                added = [f for f in added if f.text.strip() and f.entry_id not in model.rows]
+                if added:
+                    model.add([f.entry_id for f in added], [f.text for f in added])
+                self._model = model
+                self.fits += 1
+                self._dirty = True
+        except Exception as e:
+            logger.warning(f"[JobIndex] Compaction failed, keeping the current model: {e}")
+
+    def _corpus(self) -> Tuple[List[str], List[str]]:
+        """(entry ids, texts) of every indexed job with text; caller holds the lock."""
+        ids, texts = [], []
+        for entry_id, features in self._entries.items():
+            if features.text.strip():
+                ids.append(entry_id)
+                texts.append(features.text)
+        return ids, texts
+
+    @staticmethod
+    def _fit(ids: List[str], texts: List[str]) -> Optional[IncrementalTfidf]:
+        if not texts:
+            return None
+        try:
+            model = IncrementalTfidf.fit(ids, texts)
+        except ValueError:
+            # Empty vocabulary (e.g. only stop words)
+            return None
+        logger.info(f"[JobIndex] Fitted corpus model: {len(ids)} jobs, {len(model.vocabulary)} terms")
+        return model
+
+    # ─────────────────────────────────────────────────────────────────
+    #  Persistence
+    # ─────────────────────────────────────────────────────────────────
+    def save(self, path: Optional[str] = None) -> Optional[str]:
+        """Write entries + corpus model to one .npz (atomic replace)."""
+        path = path or self.path
+        if not path:
+            return None
+        with self._lock:
+            model = self._model
+            meta = {
+                "version": INDEX_FORMAT_VERSION,
+                "tfidf_params": {k: list(v) if isinstance(v, tuple) else v for k, v in TFIDF_PARAMS.items()},
+                "entries": [self._features_to_json(f) for f in self._entries.values()],
+                "model": None,
+            }
+            arrays = {}
+            if model is not None:
+                ids, counts = model.live()
+                meta["model"] = {
+                    "rows": ids,
+                    "vocabulary": model.vocabulary,
+                    "fitted_docs": model.fitted_docs,
+                    "churn": model.churn,
+                }
+                arrays = {
+                    "data": counts.data, "indices": counts.indices,
+                    "indptr": counts.indptr, "shape": np.array(counts.shape),
+                }
+            folder = os.path.dirname(os.path.abspath(path))
+            os.makedirs(folder, exist_ok=True)
+            tmp = f"{path}.tmp-{os.getpid()}.npz"
+            np.savez_compressed(tmp, meta=np.array(json.dumps(meta)), **arrays)
+            os.replace(tmp, path)
+            self._dirty = False
+            self._last_saved = time.time()
+        return path
+
+    def save_if_dirty(self, min_interval: float = 0.0) -> bool:
+        """Persist pending changes, at most once per min_interval seconds."""
+        if not self.path or not self._dirty or time.time() - self._last_saved < min_interval:
+            return False
+        try:
+            self.save()
+            return True
+        except OSError as e:
+            logger.warning(f"[JobIndex] Save failed ({self.path}): {e}")
+            return False
+
+    def load(self, path: Optional[str] = None) -> bool:
+        """Replace the in-memory index with the saved one (False if unreadable)."""
+        path = path or self.path
+        try:
+            with np.load(path, allow_pickle=False) as saved:
+                meta = json.loads(str(saved["meta"]))
+                if meta.get("version") != INDEX_FORMAT_VERSION:
+                    logger.warning(f"[JobIndex] Ignoring index with format {meta.get('version')}: {path}")
+                    return False
+                entries = [self._features_from_json(e) for e in meta["entries"]]
+                model = None
+                if meta.get("model"):
+                    saved_model = meta["model"]
+                    counts = sparse.csr_matrix((saved["data"], saved["indices"], saved["indptr"]),
+                                               shape=tuple(saved["shape"]))
+                    model = IncrementalTfidf(saved_model["vocabulary"], counts, saved_model["rows"],
+                                             saved_model["fitted_docs"], saved_model["churn"])
+        except (OSError, KeyError, ValueError) as e:
+            logger.warning(f"[JobIndex] Could not load {path}: {e}")
+            return False
+
+        with self._lock:
+            self._entries = OrderedDict((f.entry_id, f) for f in entries)
+            self._by_key = {f.key: f.entry_id for f in entries}
+            self._postings = {}
+            for f in entries:
+                for skill in f.skills:
+                    self._postings.setdefault(skill, set()).add(f.entry_id)
+            self._model = model
+            self._columns = None
+            self._version += 1
+            self._reset_changes()
+            self._dirty = False
+            self._last_saved = time.time()
+        logger.info(f"[JobIndex] Loaded {len(entries)} jobs from {path}")
+        return True
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._by_key.clear()
+            self._postings.clear()
+            self._columns = None
+            self._version += 1
+            self._reset_changes()
+            self._model = None
+            self._dirty = True
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            model = self._model
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "skills": len(self._postings),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "fits": self.fits,
+                "model_rows": model.n_docs if model is not None else 0,
+                "model_terms": len(model.vocabulary) if model is not None else 0,
+                "model_drift": round(model.drift, 4) if model is not None else 0.0,
+                "path": self.path,
+                "dirty": self._dirty,
+            }
+
+    # ─────────────────────────────────────────────────────────────────
+    #  Internals
+    # ─────────────────────────────────────────────────────────────────
+    def _insert(self, features: JobFeatures):
+        # A job whose content changed replaces its previous version
+        previous = self._by_key.get(features.key)
+        if previous is not None and previous != features.entry_id:
+            self._remove(previous)
+        self._entries[features.entry_id] = features
+        self._by_key[features.key] = features.entry_id
+        for skill in features.skills:
+            self._postings.setdefault(skill, set()).add(features.entry_id)
+        self._dirty = True
+        self._version += 1
+        self._log_change(True, features.entry_id)
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def _remove(self, entry_id: str):
+        features = self._entries.pop(entry_id, None)
+        if features is None:
+            return
+        if self._by_key.get(features.key) == entry_id:
+            del self._by_key[features.key]
+        self._version += 1
+        self._log_change(False, entry_id)
+        if self._model is not None:
+            self._model.remove(entry_id)
+        for skill in features.skills:
+            posting = self._postings.get(skill)
+            if posting is not None:
+                posting.discard(entry_id)
+                if not posting:
+                    del self._postings[skill]
+
+    def _log_change(self, inserted: bool, entry_id: str):
+        self._changes.append((inserted, entry_id))
+        if len(self._changes) > self.CHANGE_LOG_SIZE:
+            # Drop the older half: readers that far behind resync fully
+            drop = len(self._changes) // 2
+            del self._changes[:drop]
+            self._changes_base += drop
+
+    def _reset_changes(self):
+        self._changes = []
+        self._changes_base = self._version
+
+    @staticmethod
+    def _features_to_json(f: JobFeatures) -> Dict:
+        data = f._asdict()
+        data["skills"] = sorted(f.skills)
+        return data
+
+    @staticmethod
+    def _features_from_json(data: Dict) -> JobFeatures:
+        data = dict(data)
+        data["skills"] = frozenset(data["skills"])
+        return JobFeatures(**data)
+
+
+# Shared index used by the JobMatcher singleton
+default_job_index = JobFeatureIndex(
+    path=os.getenv("JOB_INDEX_PATH") or None,
+    max_entries=int(os.getenv("JOB_INDEX_MAX_ENTRIES", "20000")),
+    compact_drift=float(os.getenv("JOB_INDEX_COMPACT_DRIFT", "0.5")),
+)
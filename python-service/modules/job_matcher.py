@@ -5,74 +5,46 @@ Uses NLP and semantic similarity to match resumes with job listings.
 
 Techniques:
   - Skill-based matching (Jaccard + weighted overlap)
-  - Semantic similarity using TF-IDF + Cosine Similarity (scikit-learn)
+  - Semantic similarity using TF-IDF + Cosine Similarity (scikit-learn),
+    or dense embeddings (modules.embeddings) when a model is configured
   - Job title relevance scoring
   - Experience level matching
   - Composite weighted scoring
 """
 
-import re
+import heapq
 import logging
-from typing import List, Dict, Optional, Set
-from difflib import SequenceMatcher
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, NamedTuple, Optional, Set, Tuple
 
-logger = logging.getLogger(__name__)
+from modules.skill_taxonomy import SKILL_ALIASES, HIGH_VALUE_SKILLS, MATCHER_LEXICON
+from modules.job_index import (
+    HAS_SEMANTIC, JobColumns, JobFeatureIndex, JobFeatures, default_job_index, required_years,
+)
+from modules.title_similarity import TitleSimilarity, title_similarity
+from modules.embeddings import EmbeddingSemantic, embedding_backend
+
+try:
+    from modules.ann_index import JobVectorIndex
+except ImportError:
+    JobVectorIndex = None
 
-# TF-IDF based semantic matching (lightweight, no GPU required)
 try:
-    from sklearn.feature_extraction.text import TfidfVectorizer
-    from sklearn.metrics.pairwise import cosine_similarity
     import numpy as np
+except ImportError:
+    np = None
 
-    _tfidf_vectorizer = TfidfVectorizer(
-        stop_words='english',
-        max_features=5000,
-        ngram_range=(1, 2),  # unigrams + bigrams for better context
-    )
-    HAS_SEMANTIC = True
+logger = logging.getLogger(__name__)
+
+if HAS_SEMANTIC:
     logger.info("[JobMatcher] TF-IDF semantic matching available")
-except ImportError:
-    HAS_SEMANTIC = False
+else:
     logger.warning("[JobMatcher] scikit-learn not available, using keyword matching only")
 
 # ─────────────────────────────────────────────────────────────────────
-#  Common skill aliases / normalization
+#  Skill normalization (aliases / high-value skills: modules.skill_taxonomy)
 # ─────────────────────────────────────────────────────────────────────
-SKILL_ALIASES = {
-    "js": "javascript", "ts": "typescript", "py": "python",
-    "react.js": "react", "reactjs": "react", "react js": "react",
-    "node.js": "node", "nodejs": "node", "node js": "node",
-    "vue.js": "vue", "vuejs": "vue",
-    "next.js": "nextjs", "next js": "nextjs",
-    "c#": "csharp", "c sharp": "csharp",
-    "c++": "cpp", "cplusplus": "cpp",
-    ".net": "dotnet", "dot net": "dotnet",
-    "mongo": "mongodb", "mongo db": "mongodb",
-    "postgres": "postgresql", "pg": "postgresql",
-    "ms sql": "mssql", "sql server": "mssql",
-    "amazon web services": "aws",
-    "google cloud platform": "gcp", "google cloud": "gcp",
-    "ml": "machine learning", "dl": "deep learning",
-    "ai": "artificial intelligence",
-    "ci/cd": "cicd", "ci cd": "cicd",
-    "devops": "devops", "dev ops": "devops",
-    "ui/ux": "uiux", "ui ux": "uiux",
-    "power bi": "powerbi",
-    "ms office": "microsoft office",
-    "ms excel": "excel",
-}
-
-# High-value tech skills (weighted higher in matching)
-HIGH_VALUE_SKILLS = {
-    "python", "javascript", "react", "node", "typescript", "java", "csharp",
-    "aws", "azure", "gcp", "docker", "kubernetes", "sql", "mongodb",
-    "machine learning", "deep learning", "tensorflow", "pytorch",
-    "flutter", "swift", "kotlin", "golang", "rust",
-    "graphql", "rest api", "microservices", "cicd",
-    "postgresql", "redis", "elasticsearch",
-}
-
-
 def normalize_skill(skill: str) -> str:
     """Normalize a skill name for consistent comparison."""
     s = skill.strip().lower()
@@ -84,18 +56,30 @@ def extract_skills_from_text(text: str) -> Set[str]:
     if not text:
         return set()
 
-    text_lower = text.lower()
-    found: Set[str] = set()
+    # Known skills / aliases, word-boundary matched in a single pass
+    return MATCHER_LEXICON.find(text)
 
-    # Check for known skills / aliases
-    all_known = set(SKILL_ALIASES.values()) | HIGH_VALUE_SKILLS | set(SKILL_ALIASES.keys())
-    for skill in all_known:
-        # Word boundary match to avoid partial matches
-        pattern = r'\b' + re.escape(skill) + r'\b'
-        if re.search(pattern, text_lower):
-            found.add(normalize_skill(skill))
 
-    return found
+# Threads for match_many blocks (NumPy / SciPy kernels release the GIL)
+MATCH_WORKERS = int(os.getenv('MATCH_WORKERS', '0')) or min(4, os.cpu_count() or 1)
+
+
+class ResumeQuery(NamedTuple):
+    """Resume-side inputs of every JobMatcher signal"""
+    skills: Set[str]          # normalized
+    title: str                # lowercased
+    text: str                 # title + summary + skills, for semantic similarity
+    experience_years: float
+
+    @classmethod
+    def of(cls, resume_skills: List[str], resume_title: str, resume_summary: str,
+           resume_experience_years: float) -> "ResumeQuery":
+        return cls(
+            skills={normalize_skill(s) for s in resume_skills if s},
+            title=(resume_title or "").lower().strip(),
+            text=f"{resume_title} {resume_summary} {' '.join(resume_skills)}",
+            experience_years=resume_experience_years,
+        )
 
 
 class JobMatcher:
@@ -114,8 +98,30 @@ class JobMatcher:
     WEIGHT_TITLE    = 0.20
     WEIGHT_EXP      = 0.10
 
-    def __init__(self):
-        logger.info("[JobMatcher] Initialized")
+    # Per-result explanation of a matchScore (left out beyond `explain`)
+    EXPLANATION_FIELDS = ("matchedSkills", "missingSkills", "skillScore", "semanticScore",
+                          "titleScore", "experienceScore")
+
+    # Best title / experience scores, used as upper bounds while pruning
+    MAX_TITLE_SCORE = TitleSimilarity.NEAR_EXACT_SCORE
+    MAX_EXP_SCORE   = 95
+
+    def __init__(self, index: Optional[JobFeatureIndex] = None, vectorized: bool = False,
+                 titles: Optional[TitleSimilarity] = None, semantic: Optional[EmbeddingSemantic] = None,
+                 ann: Optional[JobVectorIndex] = None, ann_min_jobs: int = 5000):
+        # Job-side features (skills, years, TF-IDF rows) live in the index,
+        # so a match call only does resume-side work + lookups.
+        self.index = index if index is not None else JobFeatureIndex()
+        # Semantic scorer: the index's TF-IDF model unless an embedding backend is given
+        self.semantic = semantic if semantic is not None else self.index
+        # ANN candidate generation for large indexed pools (None = always exact)
+        self.ann = ann
+        self.ann_min_jobs = ann_min_jobs
+        # Memoized title signatures / pair scores, shared across matchers by default
+        self.titles = titles if titles is not None else title_similarity
+        # Columnar NumPy scoring of the whole job set instead of the per-job loop
+        self.vectorized = vectorized and np is not None and HAS_SEMANTIC
+        logger.info(f"[JobMatcher] Initialized ({'vectorized' if self.vectorized else 'per-job'} scoring)")
 
     # ─────────────────────────────────────────────────────────────────
     #  Public API
@@ -128,163 +134,467 @@ class JobMatcher:
         resume_experience_years: int,
         jobs: List[Dict],
         min_score: int = 30,
+        top_k: Optional[int] = None,
+        explain: Optional[int] = None,
+        stats: Optional[Dict] = None,
     ) -> List[Dict]:
         """
         Score and rank a list of jobs against a resume.
 
-        Returns list of dicts sorted by matchScore (descending),
-        each containing the original job data plus:
+        Returns list of dicts sorted by matchScore (descending, ties in input
+        order), at most top_k of them, each containing the original job data plus:
             matchScore, matchedSkills, missingSkills,
             skillScore, semanticScore, titleScore, experienceScore
+        Only the first `explain` results (None = all) carry the
+        EXPLANATION_FIELDS; the rest have matchScore only.
+
+        Jobs sharing a skill with the resume are taken from the inverted skill
+        index first. A job is only fully scored when an upper bound on its
+        score can still reach min_score / the current top-k, and the jobs
+        without any shared skill (skill score 0) are skipped together when
+        their ceiling cannot. Output dicts are built for returned jobs only.
+
+        stats: optional dict filled with totals over every job >= min_score
+        (matched, scoreSum, topScore), so a caller paging with top_k still
+        reports exact statistics. Jobs then skip the top-k bound and are
+        scored exactly; only their output dicts are saved.
+
+        With top_k set (and no stats), a list of at least ann_min_jobs jobs
+        from an indexed pool that large is ranked on the resume's ANN
+        candidates instead, re-scored exactly (see match_many).
         """
-        if not jobs:
+        if not jobs or (top_k is not None and top_k <= 0):
             return []
 
-        norm_resume_skills = {normalize_skill(s) for s in resume_skills if s}
-        resume_title_lower = (resume_title or "").lower().strip()
-        resume_text = f"{resume_title} {resume_summary} {' '.join(resume_skills)}"
+        norm_resume_skills, resume_title_lower, resume_text, _ = ResumeQuery.of(
+            resume_skills, resume_title, resume_summary, resume_experience_years)
+
+        features = self.index.features_for(jobs)
+        if stats is None and self._use_ann(top_k, len(jobs)):
+            query = ResumeQuery(norm_resume_skills, resume_title_lower, resume_text, resume_experience_years)
+            return self._match_many_ann([query], min_score, top_k, self._ann_candidates(top_k, len(features)),
+                                        1, jobs, features, explain)[0]
+        if self.vectorized:
+            return self._match_vectorized(jobs, features, norm_resume_skills, resume_title_lower,
+                                          resume_text, resume_experience_years, min_score, top_k, explain,
+                                          stats)
+
+        candidates = self.index.skill_candidates(norm_resume_skills, features)
+
+        # (matchScore, -position, position, parts): a min-heap when top_k is set
+        ranked: List[tuple] = []
+        if stats is not None:
+            stats.update(matched=0, scoreSum=0, topScore=0)
+        context = (features, norm_resume_skills, resume_title_lower, resume_text,
+                   resume_experience_years, min_score, top_k, ranked, stats)
+        scored = self._scan(candidates, *context)
+
+        no_skill_ceiling = self._final_score(
+            0 * self.WEIGHT_SKILLS
+            + 100 * self.WEIGHT_SEMANTIC
+            + self.MAX_TITLE_SCORE * self.WEIGHT_TITLE
+            + self.MAX_EXP_SCORE * self.WEIGHT_EXP
+        )
+        heap_full = top_k is not None and len(ranked) >= top_k and stats is None
+        if no_skill_ceiling >= min_score and not (heap_full and ranked[0][0] > no_skill_ceiling):
+            matched = set(candidates)
+            scored += self._scan([i for i in range(len(jobs)) if i not in matched], *context)
+
+        ranked.sort(reverse=True)
+        results = [
+            self._result(jobs[pos], features[pos], norm_resume_skills, final_score, parts,
+                         explain is None or rank < explain)
+            for rank, (final_score, _, pos, parts) in enumerate(ranked)
+        ]
+        logger.info(f"[JobMatcher] Matched {len(results)}/{len(jobs)} jobs (>= {min_score}%), "
+                    f"fully scored {scored}")
+        return results
+
+    def match_page(
+        self,
+        resume_skills: List[str],
+        resume_title: str,
+        resume_summary: str,
+        resume_experience_years: int,
+        jobs: List[Dict],
+        min_score: int = 30,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        explain: Optional[int] = None,
+        totals: bool = False,
+    ) -> Tuple[List[Dict], Optional[Dict]]:
+        """
+        The ranking behind one page (offset, limit) of match_resume_to_jobs.
+
+        Returns (ranked, totals). With a limit, only the best offset + limit + 1
+        jobs are ranked (the extra one tells whether more follow), so the top-k
+        bound keeps pruning; totals is then None unless totals=True, which
+        scores every job able to reach min_score for exact matched / scoreSum /
+        topScore. Without a limit every job is ranked and totals come for free.
+        """
+        stats = {} if totals or limit is None else None
+        ranked = self.match_resume_to_jobs(
+            resume_skills, resume_title, resume_summary, resume_experience_years, jobs,
+            min_score=min_score, top_k=None if limit is None else offset + limit + 1,
+            explain=explain, stats=stats)
+        return ranked, stats
+
+    def match_many(
+        self,
+        resumes: List[Dict],
+        jobs: Optional[List[Dict]] = None,
+        min_score: int = 30,
+        top_k: Optional[int] = 10,
+        block_size: int = 64,
+        workers: Optional[int] = None,
+        candidates: Optional[int] = None,
+    ) -> List[List[Dict]]:
+        """
+        Top-k jobs for each of many resumes.
+
+        resumes: dicts with resume_skills, resume_title, resume_summary,
+            resume_experience_years (the match_resume_to_jobs arguments).
+        jobs: job dicts, or None to match against every indexed job (results
+            then carry jobKey / title instead of the original job data).
 
-        results: List[Dict] = []
+        Scores equal match_resume_to_jobs'. Resumes are scored in blocks of
+        block_size as sparse matrix products (resumes x jobs) on a thread pool.
 
-        for job in jobs:
-            try:
-                scored = self._score_single_job(
-                    job=job,
-                    norm_resume_skills=norm_resume_skills,
-                    resume_title_lower=resume_title_lower,
-                    resume_text=resume_text,
-                    resume_experience_years=resume_experience_years,
-                )
-                if scored["matchScore"] >= min_score:
-                    results.append(scored)
-            except Exception as e:
-                logger.warning(f"[JobMatcher] Error scoring job '{job.get('title', '?')}': {e}")
-                continue
+        Against an indexed pool of at least ann_min_jobs jobs (and with top_k
+        set), each resume is instead scored exactly on its `candidates` nearest
+        jobs from the ANN index (default max(500, 50 x top_k)), once the index
+        has been built in the background; until then matching stays exact.
+        """
+        if not resumes:
+            return []
+        if jobs is None and self._use_ann(top_k, len(self.index)):
+            return self._match_many_ann([ResumeQuery.of(**r) for r in resumes], min_score, top_k,
+                                        candidates or self._ann_candidates(top_k, len(self.index)), workers)
+
+        if jobs is None:
+            features = self.index.all_features()
+            jobs = [{"jobKey": f.key, "title": f.title} for f in features]
+        else:
+            features = self.index.features_for(jobs)
+        if not features or (top_k is not None and top_k <= 0):
+            return [[] for _ in resumes]
+        if np is None or not HAS_SEMANTIC:
+            return [self.match_resume_to_jobs(**r, jobs=jobs, min_score=min_score, top_k=top_k)
+                    for r in resumes]
+
+        columns = self.index.columns(features)
+        queries = [ResumeQuery.of(**r) for r in resumes]
+        blocks = [queries[i:i + block_size] for i in range(0, len(queries), block_size)]
+
+        def run_block(block):
+            scores = self._score_block(columns, features, block)
+            return [self._ranked_results(jobs, features, query, [s[r] for s in scores], min_score, top_k)
+                    for r, query in enumerate(block)]
+
+        workers = workers or min(len(blocks), MATCH_WORKERS)
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                block_results = list(pool.map(run_block, blocks))
+        else:
+            block_results = [run_block(block) for block in blocks]
 
-        # Sort by match score descending
-        results.sort(key=lambda x: x["matchScore"], reverse=True)
-        logger.info(f"[JobMatcher] Matched {len(results)}/{len(jobs)} jobs (>= {min_score}%)")
+        results = [matches for block in block_results for matches in block]
+        logger.info(f"[JobMatcher] Batch matched {len(resumes)} resumes x {len(features)} jobs "
+                    f"({len(blocks)} blocks, {workers} workers)")
         return results
 
     # ─────────────────────────────────────────────────────────────────
     #  Internal scoring
     # ─────────────────────────────────────────────────────────────────
-    def _score_single_job(
+    def _use_ann(self, top_k: Optional[int], jobs_count: int) -> bool:
+        """Whether a top_k ranking over jobs_count jobs goes through the ANN index."""
+        if self.ann is None or top_k is None or top_k <= 0 or np is None or not HAS_SEMANTIC:
+            return False
+        if jobs_count < self.ann_min_jobs or len(self.index) < self.ann_min_jobs:
+            return False
+        self.ann.sync(self.index)  # builds / refits run in the background
+        return self.ann.ready()
+
+    def _ann_candidates(self, top_k: int, jobs_count: int) -> int:
+        """ANN candidates per resume: max(500, 50 x top_k) of the requested jobs, scaled up when
+        they are only part of the indexed pool."""
+        share = len(self.index) / max(jobs_count, 1)
+        return min(len(self.index), int(max(500, 50 * top_k) * max(1.0, share)))
+
+    def _match_many_ann(self, queries: List["ResumeQuery"], min_score: int, top_k: int, candidates: int,
+                        workers: Optional[int], jobs: Optional[List[Dict]] = None,
+                        features: Optional[List[JobFeatures]] = None,
+                        explain: Optional[int] = None) -> List[List[Dict]]:
+        """
+        Each query's ranking over its ANN candidates, re-scored exactly.
+
+        jobs / features: rank only these (results carry the job dicts, ties in
+        their order); None = every indexed job (results carry jobKey / title).
+        """
+        positions = None if features is None else {f.entry_id: i for i, f in enumerate(features)}
+
+        def candidates_of(query):
+            if not query.text.strip():
+                # No text to embed: score every job exactly (skills / title / experience)
+                chosen = features if features is not None else self.index.all_features()
+                return jobs, chosen
+            found = self.ann.search(query.text, candidates)
+            if positions is None:
+                return None, self.index.lookup(found)
+            picked = sorted({positions[e] for e in found if e in positions})
+            return [jobs[i] for i in picked], [features[i] for i in picked]
+
+        def run_query(query):
+            chosen_jobs, chosen = candidates_of(query)
+            if not chosen:
+                return []
+            if chosen_jobs is None:
+                chosen_jobs = [{"jobKey": f.key, "title": f.title} for f in chosen]
+            scores = self._score_block(self.index.columns(chosen), chosen, [query])
+            return self._ranked_results(chosen_jobs, chosen, query, [s[0] for s in scores], min_score, top_k,
+                                        explain)
+
+        workers = workers or min(len(queries), MATCH_WORKERS)
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(run_query, queries))
+        else:
+            results = [run_query(query) for query in queries]
+        logger.info(f"[JobMatcher] ANN matched {len(queries)} resumes against "
+                    f"{len(features) if features is not None else len(self.index)} jobs "
+                    f"({candidates} candidates each)")
+        return results
+
+    def _scan(
+        self,
+        positions: List[int],
+        features: List[JobFeatures],
+        norm_resume_skills: Set[str],
+        resume_title_lower: str,
+        resume_text: str,
+        resume_experience_years: int,
+        min_score: int,
+        top_k: Optional[int],
+        ranked: List[tuple],
+        stats: Optional[Dict] = None,
+    ) -> int:
+        """Score the jobs at `positions` into `ranked` (and `stats`); returns how many were fully scored."""
+        if not positions:
+            return 0
+        # Semantic similarity for these jobs: one sparse mat-vec against the index
+        semantic_scores = self.semantic.semantic_scores(resume_text, [features[i] for i in positions])
+
+        scored = 0
+        for pos, semantic_score in zip(positions, semantic_scores):
+            job_features = features[pos]
+            try:
+                # 1. Skill matching ──────────────────────
+                skill_score, matched = self._skill_score(norm_resume_skills, job_features.skills)
+
+                # 2. Semantic similarity: computed above for the whole scan
+
+                # 4. Experience match ─────────────────────
+                exp_score = self._experience_score(resume_experience_years, job_features.required_years)
+
+                # Upper bound with the best possible title score
+                title_bound = self.MAX_TITLE_SCORE if resume_title_lower and job_features.title_lower else 50
+                bound = self._final_score(
+                    skill_score * self.WEIGHT_SKILLS
+                    + semantic_score * self.WEIGHT_SEMANTIC
+                    + title_bound * self.WEIGHT_TITLE
+                    + exp_score * self.WEIGHT_EXP
+                )
+                if bound < min_score:
+                    continue
+                if (stats is None and top_k is not None and len(ranked) >= top_k
+                        and (bound, -pos) < ranked[0][:2]):
+                    continue
+
+                # 3. Title relevance ──────────────────────
+                title_score = self._title_relevance(
+                    resume_title_lower, job_features.title_lower)
+                scored += 1
+
+                # Composite score
+                final_score = self._final_score(
+                    skill_score * self.WEIGHT_SKILLS
+                    + semantic_score * self.WEIGHT_SEMANTIC
+                    + title_score * self.WEIGHT_TITLE
+                    + exp_score * self.WEIGHT_EXP
+                )
+                if final_score < min_score:
+                    continue
+                if stats is not None:
+                    stats['matched'] += 1
+                    stats['scoreSum'] += final_score
+                    stats['topScore'] = max(stats['topScore'], final_score)
+
+                entry = (final_score, -pos, pos, (skill_score, semantic_score, title_score, exp_score, matched))
+                if top_k is None or len(ranked) < top_k:
+                    if top_k is None:
+                        ranked.append(entry)
+                    else:
+                        heapq.heappush(ranked, entry)
+                elif entry[:2] > ranked[0][:2]:
+                    heapq.heapreplace(ranked, entry)
+            except Exception as e:
+                logger.warning(f"[JobMatcher] Error scoring job '{job_features.title or '?'}': {e}")
+                continue
+        return scored
+
+    def _match_vectorized(
         self,
-        job: Dict,
+        jobs: List[Dict],
+        features: List[JobFeatures],
         norm_resume_skills: Set[str],
         resume_title_lower: str,
         resume_text: str,
         resume_experience_years: int,
-    ) -> Dict:
-        """Compute composite score for one job."""
+        min_score: int,
+        top_k: Optional[int],
+        explain: Optional[int] = None,
+        stats: Optional[Dict] = None,
+    ) -> List[Dict]:
+        """Same scores and ranking as the per-job path, as array operations over all jobs."""
+        query = ResumeQuery(norm_resume_skills, resume_title_lower, resume_text, resume_experience_years)
+        scores = self._score_block(self.index.columns(features), features, [query])
+        results = self._ranked_results(jobs, features, query, [s[0] for s in scores], min_score, top_k,
+                                       explain, stats)
+        logger.info(f"[JobMatcher] Matched {len(results)}/{len(jobs)} jobs (>= {min_score}%), vectorized")
+        return results
 
-        job_title = (job.get("title") or "").strip()
-        job_desc = (job.get("description") or "").strip()
-        job_text = f"{job_title} {job_desc}"
+    def _score_block(self, columns: JobColumns, features: List[JobFeatures], queries: List["ResumeQuery"]):
+        """final, skill, semantic, title, experience score arrays (resumes x jobs)."""
+        skill = self._skill_scores(columns, [q.skills for q in queries])
+        semantic = self.semantic.semantic_matrix([q.text for q in queries], features)
+        title = np.vstack([self._title_scores(columns, q.title) for q in queries])
+        exp = self._experience_scores(columns, np.array([[q.experience_years] for q in queries], dtype=np.float64))
 
-        # 1. Skill matching ──────────────────────
-        job_skills = extract_skills_from_text(job_text)
-        if not job_skills:
-            # Fallback: treat words in title as pseudo-skills
-            job_skills = {normalize_skill(w) for w in job_title.lower().split() if len(w) > 2}
+        composite = (
+            skill   * self.WEIGHT_SKILLS
+            + semantic * self.WEIGHT_SEMANTIC
+            + title   * self.WEIGHT_TITLE
+            + exp     * self.WEIGHT_EXP
+        )
+        # np.rint rounds half to even, like round()
+        final = np.rint(np.clip(composite, 0, 100)).astype(np.int64)
+        return final, skill, semantic, title, exp
+
+    def _ranked_results(self, jobs: List[Dict], features: List[JobFeatures], query: "ResumeQuery",
+                        scores: List, min_score: int, top_k: Optional[int],
+                        explain: Optional[int] = None, stats: Optional[Dict] = None) -> List[Dict]:
+        """Output dicts for one resume's best jobs (score descending, ties in job order)."""
+        final, skill, semantic, title, exp = scores
+        keep = np.flatnonzero(final >= min_score)
+        if stats is not None:
+            stats.update(matched=len(keep), scoreSum=int(final[keep].sum()),
+                         topScore=int(final[keep].max()) if len(keep) else 0)
+        if top_k is not None and len(keep) > top_k:
+            # Only jobs scoring at least the k-th best can make the cut
+            kth = np.partition(final[keep], len(keep) - top_k)[len(keep) - top_k]
+            keep = keep[final[keep] >= kth]
+        order = keep[np.lexsort((keep, -final[keep]))][:top_k]
+
+        results = []
+        for rank, pos in enumerate(order.tolist()):
+            job_features = features[pos]
+            explained = explain is None or rank < explain
+            parts = (float(skill[pos]), float(semantic[pos]), float(title[pos]), float(exp[pos]),
+                     query.skills & job_features.skills) if explained else None
+            results.append(self._result(jobs[pos], job_features, query.skills, int(final[pos]), parts, explained))
+        return results
 
+    @staticmethod
+    def _skill_scores(columns: JobColumns, resume_skill_sets: List[Set[str]]):
+        """_skill_score for every resume x job: weighted resume-skill matrix x job indicator matrix."""
+        weights = np.zeros((columns.skills.shape[1], len(resume_skill_sets)))
+        for r, skills in enumerate(resume_skill_sets):
+            for skill in skills:
+                col = columns.skill_vocab.get(skill)
+                if col is not None:
+                    # High-value matches count 1.5
+                    weights[col, r] = 1.5 if skill in HIGH_VALUE_SKILLS else 1.0
+        weighted_matches = (columns.skills @ weights).T
+        total_possible = np.maximum(columns.skill_counts, 1)
+        return np.minimum(100, (weighted_matches / total_possible) * 100)
+
+    def _title_scores(self, columns: JobColumns, resume_title: str):
+        """_title_relevance for every job: scored once per distinct title, then gathered."""
+        distinct, inverse = np.unique(columns.title_ids, return_inverse=True)
+        scores = np.array([self._title_relevance(resume_title, columns.titles[i]) for i in distinct.tolist()],
+                          dtype=np.float64)
+        return scores[inverse]
+
+    @staticmethod
+    def _experience_scores(columns: JobColumns, resume_years):
+        """_experience_score for every job (resume_years: scalar or column of years)."""
+        required = columns.required_years
+        # Under-qualified
+        under = np.maximum(20, resume_years / np.maximum(required, 1) * 70)
+        return np.where(required == 0, 70.0,                     # can't determine: neutral
+               np.where(resume_years >= required, 95.0,
+               np.where(resume_years >= required - 1, 75.0, under)))
+
+    @staticmethod
+    def _skill_score(norm_resume_skills: Set[str], job_skills: frozenset):
+        """Weighted skill overlap 0-100 and the matched skills."""
         matched = norm_resume_skills & job_skills
-        missing = job_skills - norm_resume_skills
         # Weighted overlap: high-value matches count more
         high_matched = matched & HIGH_VALUE_SKILLS
         regular_matched = matched - HIGH_VALUE_SKILLS
         weighted_matches = len(high_matched) * 1.5 + len(regular_matched)
         total_possible = max(len(job_skills), 1)
-        skill_score = min(100, (weighted_matches / total_possible) * 100)
-
-        # 2. Semantic similarity (TF-IDF + Cosine) ──────────────────
-        semantic_score = 50  # neutral default
-        if HAS_SEMANTIC and resume_text.strip() and job_text.strip():
-            try:
-                tfidf_matrix = _tfidf_vectorizer.fit_transform([resume_text, job_text])
-                sim = float(cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0])
-                # TF-IDF cosine typically 0-0.5 range, scale to 0-100
-                semantic_score = max(0, min(100, sim * 200))
-            except Exception:
-                pass
-
-        # 3. Title relevance ──────────────────────
-        title_score = self._title_relevance(resume_title_lower, job_title.lower())
+        return min(100, (weighted_matches / total_possible) * 100), matched
 
-        # 4. Experience match ─────────────────────
-        exp_score = self._experience_match(resume_experience_years, job_text)
+    @staticmethod
+    def _final_score(composite: float) -> int:
+        return int(round(min(100, max(0, composite))))
 
-        # Composite score
-        composite = (
-            skill_score   * self.WEIGHT_SKILLS
-            + semantic_score * self.WEIGHT_SEMANTIC
-            + title_score   * self.WEIGHT_TITLE
-            + exp_score     * self.WEIGHT_EXP
-        )
-        final_score = int(round(min(100, max(0, composite))))
-
-        return {
+    @staticmethod
+    def _result(job: Dict, features: JobFeatures, norm_resume_skills: Set[str],
+                final_score: int, parts: Optional[tuple], explain: bool = True) -> Dict:
+        """Output dict for a returned job (with its EXPLANATION_FIELDS when explain)."""
+        result = {
             **job,  # Keep all original job fields
             "matchScore": final_score,
-            "matchedSkills": sorted(matched),
-            "missingSkills": sorted(missing),
-            "skillScore": int(round(skill_score)),
-            "semanticScore": int(round(semantic_score)),
-            "titleScore": int(round(title_score)),
-            "experienceScore": int(round(exp_score)),
         }
+        if explain:
+            skill_score, semantic_score, title_score, exp_score, matched = parts
+            result["matchedSkills"] = sorted(matched)
+            result["missingSkills"] = sorted(features.skills - norm_resume_skills)
+            result["skillScore"] = int(round(skill_score))
+            result["semanticScore"] = int(round(semantic_score))
+            result["titleScore"] = int(round(title_score))
+            result["experienceScore"] = int(round(exp_score))
+        return result
 
     def _title_relevance(self, resume_title: str, job_title: str) -> float:
         """Score 0-100 for how relevant the job title is to the resume target role."""
-        if not resume_title or not job_title:
-            return 50
-
-        # Exact or near-exact match
-        ratio = SequenceMatcher(None, resume_title, job_title).ratio()
-        if ratio > 0.8:
-            return 95
-
-        # Check if resume title words appear in job title
-        resume_words = set(resume_title.split()) - {"a", "an", "the", "and", "or", "of", "in", "at", "for"}
-        job_words = set(job_title.split()) - {"a", "an", "the", "and", "or", "of", "in", "at", "for"}
-
-        if not resume_words:
-            return 50
-
-        overlap = len(resume_words & job_words) / len(resume_words)
-        # Scale: 0 overlap -> 20, full overlap -> 95
-        return 20 + overlap * 75
+        return self.titles.score(resume_title, job_title)
 
     def _experience_match(self, resume_years: int, job_text: str) -> float:
         """Estimate how well experience level matches."""
-        # Try to extract required years from job text
-        patterns = [
-            r'(\d+)\+?\s*(?:years?|yrs?)\s*(?:of)?\s*(?:experience|exp)',
-            r'(?:experience|exp).*?(\d+)\+?\s*(?:years?|yrs?)',
-            r'(\d+)\s*-\s*\d+\s*(?:years?|yrs?)',
-        ]
-        required_years = 0
-        job_lower = job_text.lower()
-        for pattern in patterns:
-            m = re.search(pattern, job_lower)
-            if m:
-                required_years = int(m.group(1))
-                break
-
-        if required_years == 0:
+        return self._experience_score(resume_years, required_years(job_text))
+
+    @staticmethod
+    def _experience_score(resume_years: int, required: int) -> float:
+        if required == 0:
             # Can't determine — assume neutral
             return 70
 
-        if resume_years >= required_years:
+        if resume_years >= required:
             return 95
-        elif resume_years >= required_years - 1:
+        elif resume_years >= required - 1:
             return 75
         else:
             # Under-qualified
-            ratio = resume_years / max(required_years, 1)
+            ratio = resume_years / max(required, 1)
             return max(20, ratio * 70)
 
 
 # Singleton for import
-job_matcher = JobMatcher()
+job_matcher = JobMatcher(index=default_job_index,
+                         vectorized=os.getenv('JOB_MATCHER_VECTORIZED', '0') == '1',
+                         semantic=EmbeddingSemantic(embedding_backend) if embedding_backend else None,
+                         ann=JobVectorIndex(encoder=embedding_backend) if JobVectorIndex else None,
+                         ann_min_jobs=int(os.getenv('JOB_ANN_MIN_JOBS', '5000')))
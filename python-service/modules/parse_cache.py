@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+"""
+VeriResume - Parse Cache
+Content-addressed cache for ResumeParser results.
+
+Entries are keyed by the SHA-256 of the file bytes plus a namespace string
+(parser version and extraction options), so an unchanged document re-uploaded
+from Reanalyze / EnhancedResume or re-screened against another job skips text
+extraction and field parsing entirely.
+
+Tiers:
+  - in-process LRU (always on)
+  - optional SQLite file with size-based eviction (shared across restarts
+    and worker processes)
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ParseCache:
+    """Two-tier (memory LRU + optional SQLite) cache of parsed resume dicts."""
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        db_path: Optional[str] = None,
+        max_db_bytes: int = 64 * 1024 * 1024,
+    ):
+        self.max_entries = max_entries
+        self.db_path = db_path
+        self.max_db_bytes = max_db_bytes
+
+        self._memory: "OrderedDict[str, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+
+        self.hits = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        if db_path:
+            self._open_db()
+
+    # ─────────────────────────────────────────────────────────────────
+    #  Keys
+    # ─────────────────────────────────────────────────────────────────
+    @staticmethod
+    def make_key(data: bytes, namespace: str = "") -> str:
+        """SHA-256 of the content, qualified by parser version / options."""
+        digest = hashlib.sha256(data).hexdigest()
+        return f"{digest}:{namespace}" if namespace else digest
+
+    # ─────────────────────────────────────────────────────────────────
+    #  Public API
+    # ─────────────────────────────────────────────────────────────────
+    def get(self, key: str) -> Optional[Dict]:
+        """Return a private copy of the cached value, or None on a miss."""
+        with self._lock:
+            value = self._memory.get(key)
+            if value is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                self.memory_hits += 1
+                return copy.deepcopy(value)
+
+            value = self._db_get(key)
+            if value is not None:
+                self._memory_put(key, value)
+                self.hits += 1
+                self.disk_hits += 1
+                return copy.deepcopy(value)
+
+            self.misses += 1
+            return None
+
+    def put(self, key: str, value: Dict) -> None:
+        """Store a value in every enabled tier."""
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._memory_put(key, value)
+            self._db_put(key, value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM parse_cache")
+                self._db.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit / miss counters and current tier sizes."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            db_entries, db_bytes = self._db_usage()
+            return {
+                "hits": self.hits,
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "memory_entries": len(self._memory),
+                "max_entries": self.max_entries,
+                "db_path": self.db_path,
+                "db_entries": db_entries,
+                "db_bytes": db_bytes,
+                "max_db_bytes": self.max_db_bytes if self.db_path else 0,
+            }
+
+    # ─────────────────────────────────────────────────────────────────
+    #  Memory tier
+    # ─────────────────────────────────────────────────────────────────
+    def _memory_put(self, key: str, value: Dict) -> None:
+        if self.max_entries <= 0:
+            return
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.evictions += 1
+
+    # ─────────────────────────────────────────────────────────────────
+    #  SQLite tier
+    # ─────────────────────────────────────────────────────────────────
+    def _open_db(self) -> None:
+        try:
+            folder = os.path.dirname(os.path.abspath(self.db_path))
+            os.makedirs(folder, exist_ok=True)
+            self._db = sqlite3.connect(self.db_path, timeout=10, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS parse_cache ("
+                " key TEXT PRIMARY KEY,"
+                " value TEXT NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " accessed REAL NOT NULL)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS parse_cache_accessed ON parse_cache (accessed)"
+            )
+            self._db.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"[ParseCache] Disk tier disabled ({self.db_path}): {e}")
+            self._db = None
+
+    def _db_get(self, key: str) -> Optional[Dict]:
+        if self._db is None:
+            return None
+        try:
+            row = self._db.execute(
+                "SELECT value FROM parse_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._db.execute(
+                "UPDATE parse_cache SET accessed = ? WHERE key = ?", (time.time(), key)
+            )
+            self._db.commit()
+            return json.loads(row[0])
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning(f"[ParseCache] Disk read failed: {e}")
+            return None
+
+    def _db_put(self, key: str, value: Dict) -> None:
+        if self._db is None:
+            return
+        try:
+            payload = json.dumps(value, default=str)
+            self._db.execute(
+                "INSERT OR REPLACE INTO parse_cache (key, value, size, accessed) VALUES (?, ?, ?, ?)",
+                (key, payload, len(payload), time.time()),
+            )
+            self._db_evict()
+            self._db.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"[ParseCache] Disk write failed: {e}")
+
+    def _db_evict(self) -> None:
+        """Drop least-recently-used rows until the tier fits in max_db_bytes."""
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM parse_cache").fetchone()[0]
+        if total <= self.max_db_bytes:
+            return
+        rows = self._db.execute("SELECT key, size FROM parse_cache ORDER BY accessed ASC")
+        doomed = []
+        for key, size in rows:
+            if total <= self.max_db_bytes:
+                break
+            doomed.append((key,))
+            total -= size
+        self._db.executemany("DELETE FROM parse_cache WHERE key = ?", doomed)
+        self.evictions += len(doomed)
+
+    def _db_usage(self):
+        if self._db is None:
+            return 0, 0
+        try:
+            count, size = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM parse_cache"
+            ).fetchone()
+            return count, size
+        except sqlite3.Error:
+            return 0, 0
+
+
+# Shared cache used by every ResumeParser unless one is passed explicitly
+default_parse_cache = ParseCache(
+    max_entries=int(os.getenv("PARSE_CACHE_SIZE", "256")),
+    db_path=os.getenv("PARSE_CACHE_DB") or None,
+    max_db_bytes=int(os.getenv("PARSE_CACHE_DB_MAX_MB", "64")) * 1024 * 1024,
+)
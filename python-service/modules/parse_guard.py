@@ -0,0 +1,295 @@
+# -*- coding: utf-8 -*-
+"""
+VeriResume - Parse Guard
+Per-document resource budgets for resume parsing.
+
+A malformed or hostile file can pin a thread inside PyMuPDF or a regex with
+nothing to interrupt it. ParseGuard runs each document in a reusable worker
+process under a wall-clock deadline; a worker that overruns is killed and
+replaced, and the caller gets a ParseBudgetExceeded describing which budget
+was hit. Byte / page / character budgets are enforced by the parser itself.
+
+Batches go through stream(): the worker runs a generator and sends every
+item it yields, and each item must arrive within the deadline, so a batch of
+documents is shipped in one call while every document keeps its own budget.
+"""
+
+import logging
+import multiprocessing
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+class ParseBudgetExceeded(ValueError):
+    """A document exceeded one of its parse budgets (time, bytes, pages, chars)."""
+
+    def __init__(self, budget: str, limit: Any, actual: Any = None,
+                 file_name: Optional[str] = None):
+        self.budget = budget
+        self.limit = limit
+        self.actual = actual
+        self.file_name = file_name
+        detail = f" ({actual} > {limit})" if actual is not None else f" (limit {limit})"
+        super().__init__(f"Parse budget exceeded: {budget}{detail}")
+
+    def __reduce__(self):
+        return (self.__class__, (self.budget, self.limit, self.actual, self.file_name))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Structured form for API responses / parse_many items."""
+        return {
+            "budget": self.budget,
+            "limit": self.limit,
+            "actual": self.actual,
+            "file_name": self.file_name,
+            "message": str(self),
+        }
+
+
+class ParseWorkerCrashed(RuntimeError):
+    """The worker process died while parsing (e.g. a native library crashed)."""
+
+
+# ─────────────────────────────────────────────────────────────────
+#  Worker process
+# ─────────────────────────────────────────────────────────────────
+# Worker -> parent messages: (kind, value)
+_RESULT, _ERROR, _ITEM, _DONE = range(4)
+# How often a waiting parent checks that its worker is still alive (seconds)
+_LIVENESS_POLL = 0.5
+
+
+def _worker_main(conn, initializer: Optional[Callable], initargs: Sequence):
+    """Serve (func, args, streamed) tasks over the pipe until told to stop."""
+    if initializer is not None:
+        initializer(*initargs)
+    while True:
+        try:
+            task = conn.recv()
+        except (EOFError, OSError):
+            return
+        if task is None:
+            return
+        func, args, streamed = task
+        try:
+            if streamed:
+                for item in func(*args):
+                    conn.send((_ITEM, item))
+                conn.send((_DONE, None))
+            else:
+                conn.send((_RESULT, func(*args)))
+        except Exception as e:
+            try:
+                conn.send((_ERROR, e))
+            except Exception:
+                # Exception not picklable: ship its text instead
+                conn.send((_ERROR, RuntimeError(f"{type(e).__name__}: {e}")))
+
+
+class _GuardedWorker:
+    """One long-lived child process fed through a pipe."""
+
+    def __init__(self, ctx, initializer: Optional[Callable], initargs: Sequence):
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(target=_worker_main,
+                                   args=(child_conn, initializer, tuple(initargs)),
+                                   daemon=True)
+        self.process.start()
+        child_conn.close()
+
+    @property
+    def alive(self) -> bool:
+        return self.process.is_alive()
+
+    def call(self, func: Callable, args: Sequence, timeout: Optional[float]):
+        """Run func(*args) in the child; raises TimeoutError / ParseWorkerCrashed."""
+        self.conn.send((func, tuple(args), False))
+        kind, value = self._receive(timeout)
+        if kind == _RESULT:
+            return value
+        raise value
+
+    def stream(self, func: Callable, args: Sequence, timeout: Optional[float]) -> Iterator:
+        """Yield every item of the generator func(*args) run in the child, each within timeout."""
+        self.conn.send((func, tuple(args), True))
+        finished = False
+        try:
+            while True:
+                kind, value = self._receive(timeout)
+                if kind == _ITEM:
+                    yield value
+                elif kind == _DONE:
+                    finished = True
+                    return
+                else:
+                    finished = True
+                    raise value
+        finally:
+            if not finished:
+                # Abandoned mid-stream: the child is still sending, it cannot be reused
+                self.kill()
+
+    def _receive(self, timeout: Optional[float]):
+        # timeout None waits indefinitely (isolation without a deadline). A
+        # sibling forked at the same moment may hold copies of the child's pipe
+        # end and sentinel, so a dead child is also detected by polling its pid.
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            step = _LIVENESS_POLL if deadline is None else \
+                max(0.0, min(_LIVENESS_POLL, deadline - time.monotonic()))
+            if self.conn.poll(step) or not self.process.is_alive() and self.conn.poll(0):
+                try:
+                    return self.conn.recv()
+                except (EOFError, OSError):
+                    break
+            if not self.process.is_alive():
+                break
+            if deadline is not None and time.monotonic() >= deadline:
+                self.kill()
+                raise TimeoutError(f"no result within {timeout}s")
+        self.kill()
+        raise ParseWorkerCrashed(f"parse worker exited with code {self.process.exitcode}")
+
+    def kill(self):
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join(timeout=5)
+        self.conn.close()
+
+    @property
+    def usable(self) -> bool:
+        return self.process.is_alive() and not self.conn.closed
+
+    def stop(self):
+        try:
+            self.conn.send(None)
+            self.process.join(timeout=1)
+        except (OSError, ValueError):
+            pass
+        self.kill()
+
+
+class ParseGuard:
+    """Bounded set of killable worker processes with a per-call deadline."""
+
+    def __init__(self, workers: int = 2, initializer: Optional[Callable] = None,
+                 initargs: Sequence = ()):
+        self.workers = max(1, workers)
+        self.initializer = initializer
+        self.initargs = tuple(initargs)
+
+        self._ctx = multiprocessing.get_context()
+        self._idle: List[_GuardedWorker] = []
+        self._lock = threading.Lock()
+        # Worker slots: at most `workers` calls in flight (grown by ensure_workers)
+        self._slots = threading.Condition(self._lock)
+        self._busy = 0
+
+        self.calls = 0
+        self.timeouts = 0
+        self.crashes = 0
+        self.spawned = 0
+
+    def run(self, func: Callable, args: Sequence, timeout: float,
+            file_name: Optional[str] = None):
+        """
+        Run func(*args) in a worker, killing it if it runs past timeout seconds.
+
+        Raises ParseBudgetExceeded('time', ...) on a timeout, ParseWorkerCrashed
+        if the worker died, or whatever func raised inside the worker.
+        """
+        worker = self._checkout()
+        try:
+            return worker.call(func, args, timeout)
+        except TimeoutError:
+            self._timed_out(timeout, file_name)
+        except ParseWorkerCrashed:
+            self._crashed()
+            raise
+        finally:
+            self._checkin(worker)
+
+    def stream(self, func: Callable, args: Sequence, timeout: Optional[float],
+               file_name: Optional[str] = None) -> Iterator:
+        """
+        Yield the items of the generator func(*args) run in a worker; each item
+        must arrive within timeout seconds of the previous one (None = no deadline).
+
+        Raises like run(). The worker is held until the stream is exhausted or
+        closed; a stream abandoned early kills its worker.
+        """
+        worker = self._checkout()
+        try:
+            yield from worker.stream(func, args, timeout)
+        except TimeoutError:
+            self._timed_out(timeout, file_name)
+        except ParseWorkerCrashed:
+            self._crashed()
+            raise
+        finally:
+            self._checkin(worker)
+
+    def ensure_workers(self, workers: int):
+        """Allow at least `workers` concurrent calls (parse_many sizes the guard from its workers)."""
+        with self._slots:
+            if workers > self.workers:
+                self.workers = workers
+                self._slots.notify_all()
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for worker in idle:
+            worker.stop()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "idle_workers": len(self._idle),
+                "calls": self.calls,
+                "timeouts": self.timeouts,
+                "crashes": self.crashes,
+                "spawned": self.spawned,
+            }
+
+    # ─────────────────────────────────────────────────────────────────
+    #  Worker bookkeeping
+    # ─────────────────────────────────────────────────────────────────
+    def _checkout(self) -> _GuardedWorker:
+        with self._slots:
+            while self._busy >= self.workers:
+                self._slots.wait()
+            self._busy += 1
+            self.calls += 1
+            while self._idle:
+                worker = self._idle.pop()
+                if worker.alive:
+                    return worker
+                worker.kill()
+            self.spawned += 1
+        try:
+            return _GuardedWorker(self._ctx, self.initializer, self.initargs)
+        except Exception:
+            self._checkin(None)
+            raise
+
+    def _checkin(self, worker: Optional[_GuardedWorker]):
+        with self._slots:
+            self._busy -= 1
+            self._slots.notify()
+            if worker is not None and worker.usable:
+                self._idle.append(worker)
+
+    def _timed_out(self, timeout: Optional[float], file_name: Optional[str]):
+        with self._lock:
+            self.timeouts += 1
+        logger.warning(f"[ParseGuard] Killed worker after {timeout}s: {file_name}")
+        raise ParseBudgetExceeded("time", timeout, file_name=file_name) from None
+
+    def _crashed(self):
+        with self._lock:
+            self.crashes += 1
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""
+VeriResume - Response Fields
+Field projection, pagination and explanation limits for ranked list responses
+(/api/match-resume-to-jobs, /api/hr/bulk-screen-resumes).
+
+Request options:
+    fields   "title,company,matchScore" or a list; dotted paths select nested
+             keys ("parsed_data.candidate_info"). Omitted = every field.
+    limit    page size (omitted = everything after offset)
+    offset   number of ranked items to skip (default 0)
+    explain  "top-k" (e.g. "top-10" or 10): only the k best-ranked items carry
+             their explanation fields; "none" = no item, "all" (default) = every item
+
+Malformed options raise ValueError (the endpoints answer 400).
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+# {"key": None} keeps the whole value, {"key": {...}} projects it further
+FieldTree = Dict[str, Optional[dict]]
+
+_EXPLAIN_PATTERN = re.compile(r'(?:top-?)?(\d+)')
+
+
+def parse_fields(value: Any) -> Optional[FieldTree]:
+    """Projection tree of a `fields` option; None keeps every field."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        paths = value.split(',')
+    elif isinstance(value, list) and all(isinstance(path, str) for path in value):
+        paths = value
+    else:
+        raise ValueError("fields must be a comma-separated string or a list of strings")
+
+    tree: FieldTree = {}
+    for path in paths:
+        parts = [part for part in path.strip().split('.') if part]
+        if not parts:
+            continue
+        node = tree
+        for part in parts[:-1]:
+            if part in node and node[part] is None:
+                break  # parent already kept whole
+            node = node.setdefault(part, {})
+        else:
+            node[parts[-1]] = None
+    return tree or None
+
+
+def parse_page(limit: Any, offset: Any) -> Tuple[int, Optional[int]]:
+    """(offset, limit) of the limit / offset options; limit None = no limit."""
+    offset = _non_negative_int('offset', offset) if offset not in (None, '') else 0
+    limit = _non_negative_int('limit', limit) if limit not in (None, '') else None
+    return offset, limit
+
+
+def parse_explain(value: Any) -> Optional[int]:
+    """How many top-ranked items get explanations; None = all of them."""
+    if value is None or value is True or value in ('', 'all'):
+        return None
+    if value is False or value == 'none':
+        return 0
+    match = _EXPLAIN_PATTERN.fullmatch(value.strip().lower()) if isinstance(value, str) else None
+    if isinstance(value, int):
+        count = value
+    elif match:
+        count = int(match.group(1))
+    else:
+        raise ValueError("explain must be 'all', 'none' or 'top-<k>'")
+    if count < 0:
+        raise ValueError("explain must not be negative")
+    return count
+
+
+def wants(fields: Optional[FieldTree], *keys: str) -> bool:
+    """Whether the projection keeps any of these top-level keys."""
+    return fields is None or any(key in fields for key in keys)
+
+
+def project(item: Any, fields: Optional[FieldTree]) -> Any:
+    """Copy of item with only the selected fields (lists of dicts are projected element-wise)."""
+    if fields is None:
+        return item
+    if isinstance(item, list):
+        return [project(element, fields) for element in item]
+    if not isinstance(item, dict):
+        return item
+    projected = {}
+    for key, sub in fields.items():
+        if key in item:
+            projected[key] = item[key] if sub is None else project(item[key], sub)
+    return projected
+
+
+def paginate(items: List, offset: int, limit: Optional[int]) -> List:
+    return items[offset:] if limit is None else items[offset:offset + limit]
+
+
+def pagination(total: Optional[int], offset: int, limit: Optional[int], returned: int,
+               has_more: Optional[bool] = None) -> Dict[str, Any]:
+    """`pagination` block of a paged response (total None = not counted, has_more then required)."""
+    return {
+        'offset': offset,
+        'limit': limit,
+        'returned': returned,
+        'total': total,
+        'hasMore': has_more if total is None else offset + returned < total,
+    }
+
+
+def _non_negative_int(name: str, value: Any) -> int:
+    if isinstance(value, (bool, float)):
+        raise ValueError(f"{name} must be an integer")
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{name} must be an integer")
+    if number < 0:
+        raise ValueError(f"{name} must not be negative")
+    return number
@@ -0,0 +1,201 @@
+"""
+VeriResume Resume Document
+Single-pass view of one resume's text, built once and shared by the parser's
+field extractors and the analyzers (lines, lowercase view, words, sentences,
+word frequencies, section spans and token offsets)
+"""
+
+import re
+from collections import Counter
+from functools import cached_property
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple, Union
+
+# Section heading lines: optional qualifier, heading word, optional ": inline content"
+SECTION_HEADING_LINE = re.compile(
+    r'^(?:(?:work|professional|technical|core|key|relevant|academic)\s+)?'
+    r'(experience|employment(?:\s+history)?|work\s+history|education|academics?|'
+    r'qualifications?|skills?|competencies|summary|objective|profile|projects?|'
+    r'certifications?|languages?|achievements|awards)'
+    r'\s*(?::.*)?$',
+    re.IGNORECASE
+)
+
+SECTION_NAMES = {
+    'experience': 'experience', 'employment': 'experience', 'work history': 'experience',
+    'education': 'education', 'academic': 'education', 'academics': 'education',
+    'qualification': 'education', 'qualifications': 'education',
+    'skill': 'skills', 'skills': 'skills', 'competencies': 'skills',
+    'summary': 'summary', 'objective': 'summary', 'profile': 'summary',
+    'project': 'projects', 'projects': 'projects',
+    'certification': 'certifications', 'certifications': 'certifications',
+    'language': 'languages', 'languages': 'languages',
+    'achievements': 'achievements', 'awards': 'achievements',
+}
+
+# Sentence splitting shared by every sentence-level metric
+SENTENCE_SPLIT = re.compile(r'[.!?]+')
+WORD_SPAN = re.compile(r'\S+')
+# Maximal word-character runs: the tokens a \b\w+\b pattern can match
+TERM = re.compile(r'\w+')
+
+
+class SectionSpan(NamedTuple):
+    """A detected section: heading line index and body lines [start, end)"""
+    name: str
+    heading_line: int
+    start: int
+    end: int
+    inline: str  # content after "Heading:" on the heading line itself
+
+
+class ResumeDocument:
+    """
+    Parsed view of a resume, computed lazily and at most once per view.
+
+    Build one per resume and hand it to every extractor / analyzer instead of
+    the raw string; each view (lowercase text, lines, words, sentences,
+    sections, token offsets) is derived on first use and then reused.
+    """
+
+    def __init__(self, text: str):
+        self.text = text or ''
+        self.lines: List[str] = self.text.split('\n')
+
+    @classmethod
+    def of(cls, source: Union[str, 'ResumeDocument']) -> 'ResumeDocument':
+        """Return source unchanged if it already is a document, else wrap the text"""
+        return source if isinstance(source, ResumeDocument) else cls(source)
+
+    # ─────────────────────────────────────────────────────────────────
+    #  Text views
+    # ─────────────────────────────────────────────────────────────────
+    @cached_property
+    def lower(self) -> str:
+        return self.text.lower()
+
+    @cached_property
+    def lower_lines(self) -> List[str]:
+        return self.lower.split('\n')
+
+    @cached_property
+    def stripped_lines(self) -> List[str]:
+        return [line.strip() for line in self.lines]
+
+    @cached_property
+    def line_offsets(self) -> List[int]:
+        """Character offset of the start of each line"""
+        offsets, pos = [], 0
+        for line in self.lines:
+            offsets.append(pos)
+            pos += len(line) + 1
+        return offsets
+
+    # ─────────────────────────────────────────────────────────────────
+    #  Tokens / sentences
+    # ─────────────────────────────────────────────────────────────────
+    @cached_property
+    def words(self) -> List[str]:
+        """Whitespace tokens (same as text.split())"""
+        return self.text.split()
+
+    @cached_property
+    def lower_words(self) -> List[str]:
+        return self.lower.split()
+
+    @cached_property
+    def word_spans(self) -> List[Tuple[int, int]]:
+        """(start, end) character offsets of each whitespace token"""
+        return [m.span() for m in WORD_SPAN.finditer(self.text)]
+
+    @cached_property
+    def sentences(self) -> List[str]:
+        """Sentences longer than 5 characters, stripped"""
+        return [s for s in (part.strip() for part in SENTENCE_SPLIT.split(self.text)) if len(s) > 5]
+
+    @cached_property
+    def sentence_words(self) -> List[List[str]]:
+        """Lowercase whitespace tokens of each sentence"""
+        return [s.lower().split() for s in self.sentences]
+
+    @cached_property
+    def word_counts(self) -> Counter:
+        """Occurrences of each whitespace token (case kept)"""
+        return Counter(self.words)
+
+    @cached_property
+    def term_counts(self) -> Counter:
+        """Occurrences of each lowercase word-character run"""
+        return Counter(TERM.findall(self.lower))
+
+    # ─────────────────────────────────────────────────────────────────
+    #  Sections
+    # ─────────────────────────────────────────────────────────────────
+    @cached_property
+    def sections(self) -> List[SectionSpan]:
+        """Sections in document order, each running until the next heading"""
+        headings = []
+        for i, line in enumerate(self.stripped_lines):
+            if not line or len(line) > 80:
+                continue
+            m = SECTION_HEADING_LINE.match(line)
+            if m:
+                key = re.sub(r'\s+', ' ', m.group(1).lower())
+                inline = line.split(':', 1)[1].strip() if ':' in line else ''
+                headings.append((i, SECTION_NAMES[key], inline))
+
+        spans = []
+        for n, (i, name, inline) in enumerate(headings):
+            end = headings[n + 1][0] if n + 1 < len(headings) else len(self.lines)
+            spans.append(SectionSpan(name, i, i + 1, end, inline))
+        return spans
+
+    @cached_property
+    def section_blocks(self) -> List[str]:
+        """
+        The text in consecutive line blocks: a new block starts at every
+        section heading and after every blank line (sections split into
+        paragraphs). Joined with newlines they give back the text.
+        """
+        headings = {span.heading_line for span in self.sections}
+        cuts = [0]
+        for i in range(1, len(self.lines)):
+            if i in headings or not self.stripped_lines[i - 1]:
+                cuts.append(i)
+        cuts.append(len(self.lines))
+        return ['\n'.join(self.lines[start:end]) for start, end in zip(cuts, cuts[1:])]
+
+    @cached_property
+    def section_names(self) -> Set[str]:
+        return {span.name for span in self.sections}
+
+    def section(self, name: str) -> Optional[SectionSpan]:
+        """First section with this name, if any"""
+        for span in self.sections:
+            if span.name == name:
+                return span
+        return None
+
+    def section_lines(self, name: str) -> List[str]:
+        """Stripped body lines of the first section with this name (inline content first)"""
+        span = self.section(name)
+        if span is None:
+            return []
+        body = [span.inline] if span.inline else []
+        return body + self.stripped_lines[span.start:span.end]
+
+    def section_of_line(self, index: int) -> Optional[str]:
+        """Name of the section a line belongs to (None before the first heading)"""
+        name = None
+        for span in self.sections:
+            if span.heading_line > index:
+                break
+            name = span.name
+        return name
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'lines': len(self.lines),
+            'words': len(self.words),
+            'sentences': len(self.sentences),
+            'sections': len(self.sections),
+        }
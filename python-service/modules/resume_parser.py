@@ -3,11 +3,25 @@ VeriResume Resume Parser
 Extracts text and structured data from resume files (PDF, DOCX, TXT)
 """
 
+import io
+import math
 import os
 import re
+import threading
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Sequence, Set, Tuple, Union
 from pathlib import Path
+from xml.etree import ElementTree
+
+from modules.skill_taxonomy import RESUME_SKILLS, RESUME_LEXICON
+from modules.parse_cache import ParseCache, default_parse_cache
+from modules.resume_document import ResumeDocument
+from modules.docx_reader import iter_docx_paragraphs
+from modules.parse_guard import ParseBudgetExceeded, ParseGuard
 
 # File processing
 try:
@@ -20,128 +34,327 @@ try:
 except ImportError:
     Document = None
 
-# NLP libraries
-nlp = None
-try:
-    import spacy
+# NLP libraries (spaCy is loaded lazily on first use, NER components only)
+SPACY_MODEL = "en_core_web_sm"
+# Pipeline components name extraction never reads (only doc.ents is consulted)
+SPACY_UNUSED_COMPONENTS = ["tagger", "parser", "attribute_ruler", "lemmatizer", "senter"]
+
+_nlp = None
+_nlp_loaded = False
+_nlp_lock = threading.Lock()
+
+
+def get_nlp():
+    """Return the shared spaCy pipeline, loading it on first call (None if unavailable)"""
+    global _nlp, _nlp_loaded
+    if not _nlp_loaded:
+        with _nlp_lock:
+            if not _nlp_loaded:
+                _nlp = _load_nlp()
+                _nlp_loaded = True
+    return _nlp
+
+
+def _load_nlp():
     try:
-        # Use a shorter timeout to avoid hanging
-        import signal
-        
-        class TimeoutError(Exception):
-            pass
-        
-        def timeout_handler(signum, frame):
-            raise TimeoutError("spaCy model loading timed out")
-        
-        # Try to load with timeout (skip on Windows or if it takes too long)
-        nlp = spacy.load("en_core_web_sm")
+        import spacy
+    except ImportError:
+        print("⚠️ spaCy not installed, skipping NLP features")
+        return None
+    
+    try:
+        model = spacy.load(SPACY_MODEL, exclude=SPACY_UNUSED_COMPONENTS)
+        # The shared tok2vec only matters if NER listens to it (en_core_web_sm's NER does not)
+        if 'tok2vec' in model.pipe_names:
+            listeners = getattr(model.get_pipe('tok2vec'), 'listening_components', [])
+            if 'ner' not in listeners:
+                model.remove_pipe('tok2vec')
+        print(f"✅ spaCy loaded: {SPACY_MODEL} ({', '.join(model.pipe_names)})")
+        return model
     except Exception as e:
         print(f"⚠️ spaCy model not available: {e}")
         print("   Continuing without NLP features (name extraction may be less accurate)")
-        nlp = None
-except ImportError:
-    print("⚠️ spaCy not installed, skipping NLP features")
-    nlp = None
+        return None
+
+
+# A resume can be given as a file path, raw bytes or a binary file-like object
+ResumeSource = Union[str, Path, bytes, bytearray, BinaryIO]
+
+# Employment date range, e.g. "2019 - 2021" / "2020 to present"
+DURATION_PATTERN = re.compile(r'((?:19|20)\d{2})\s*[-–to]+\s*((?:19|20)\d{2}|present)', re.IGNORECASE)
+
+# A resume's text or its prebuilt ResumeDocument (field extractors accept both)
+ResumeText = Union[str, ResumeDocument]
 
 
 class ResumeParser:
     """Extracts text and structured data from resume files"""
     
-    def __init__(self):
-        self.nlp = nlp
+    # Bump whenever extraction or field parsing changes output (invalidates the parse cache)
+    PARSER_VERSION = '5'
+    
+    # Extraction budgets: oversized uploads cost a bounded amount of CPU / RAM
+    MAX_PAGES = 15
+    MAX_CHARS = 100_000
+    MAX_BYTES = 10 * 1024 * 1024
+    
+    # Sections the field extractors need (used by stop_after_sections)
+    REQUIRED_SECTIONS = ('experience', 'education', 'skills')
+    # Pages still read after the last required heading (section bodies spill over)
+    SECTION_TAIL_PAGES = 1
+    
+    # Header lines examined for the candidate name
+    NAME_SCAN_LINES = 5
+    
+    # parse_many: batches smaller than this are parsed in-process (pool overhead dominates)
+    PARALLEL_MIN_BATCH = 4
+    
+    # Guarded mode: killable worker processes shared by parse_resume / parse_many
+    GUARD_WORKERS = 2
+    
+    def __init__(self, max_pages: Optional[int] = None, max_chars: Optional[int] = None,
+                 stop_after_sections: bool = False, cache: Optional[ParseCache] = None,
+                 use_cache: bool = True, max_bytes: Optional[int] = None,
+                 timeout: Optional[float] = None, guard_workers: Optional[int] = None):
+        """
+        timeout enables guarded mode: every cache miss is extracted and parsed
+        in a worker process that is killed after `timeout` seconds, raising
+        ParseBudgetExceeded instead of pinning the calling thread.
+        """
+        self._nlp_override = None
         self.supported_formats = ['.pdf', '.docx', '.txt']
+        self.max_pages = max_pages if max_pages is not None else self.MAX_PAGES
+        self.max_chars = max_chars if max_chars is not None else self.MAX_CHARS
+        self.max_bytes = max_bytes if max_bytes is not None else self.MAX_BYTES
+        self.stop_after_sections = stop_after_sections
         
-        # Comprehensive skill database
-        self.skill_keywords = {
-            # Programming
-            'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'php', 'ruby',
-            'go', 'rust', 'swift', 'kotlin', 'scala', 'r', 'matlab',
-            
-            # Web Development
-            'html', 'css', 'react', 'angular', 'vue', 'node.js', 'express',
-            'django', 'flask', 'spring', 'asp.net', 'laravel', 'rest api',
-            
-            # Data Science & ML
-            'machine learning', 'deep learning', 'data science', 'data analysis',
-            'ai', 'ml', 'nlp', 'computer vision', 'tensorflow', 'pytorch',
-            'pandas', 'numpy', 'scikit-learn', 'tableau', 'power bi',
-            
-            # Databases
-            'sql', 'mysql', 'postgresql', 'mongodb', 'redis', 'oracle',
-            
-            # Cloud & DevOps
-            'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'git'
-        }
+        # Guarded mode (deadline per document, isolated worker processes)
+        self.timeout = timeout or None
+        self.guard_workers = guard_workers or self.GUARD_WORKERS
+        self._guard: Optional[ParseGuard] = None
+        
+        # Content-addressed result cache (shared across parsers by default)
+        self.cache = (cache or default_parse_cache) if use_cache else None
+        
+        # Worker pool for parse_many (created on first parallel batch, then reused)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_workers = 0
+        self._pool_lock = threading.Lock()
+        
+        # Comprehensive skill database (shared taxonomy, compiled once)
+        self.skill_keywords = set(RESUME_SKILLS)
+        self.skill_lexicon = RESUME_LEXICON
+    
+    @property
+    def nlp(self):
+        """spaCy pipeline used for name extraction (loaded on first access)"""
+        if self._nlp_override is not None:
+            return self._nlp_override
+        return get_nlp()
+    
+    @nlp.setter
+    def nlp(self, value):
+        self._nlp_override = value
     
-    def extract_text_from_pdf(self, file_path: str) -> str:
-        """Extract text from PDF"""
+    def iter_pdf_pages(self, file_path: Union[str, bytes], max_pages: Optional[int] = None,
+                       max_chars: Optional[int] = None) -> Iterator[str]:
+        """
+        Yield the text of each PDF page lazily, stopping at the page / character budget.
+        Pages are loaded one at a time, so nothing past the budget is ever decoded.
+        """
         if not fitz:
             raise ImportError("PyMuPDF not installed")
         
-        text = ""
+        max_pages = self.max_pages if max_pages is None else max_pages
+        max_chars = self.max_chars if max_chars is None else max_chars
+        
+        if isinstance(file_path, (bytes, bytearray)):
+            opened = fitz.open(stream=bytes(file_path), filetype='pdf')
+        else:
+            opened = fitz.open(file_path)
+        
+        with opened as doc:
+            page_limit = min(doc.page_count, max_pages)
+            remaining = max_chars
+            for page_no in range(page_limit):
+                page_text = doc.load_page(page_no).get_text()
+                if len(page_text) >= remaining:
+                    yield page_text[:remaining]
+                    if len(page_text) > remaining or doc.page_count > page_no + 1:
+                        print(f"⚠️ PDF truncated at {max_chars} characters (page {page_no + 1})")
+                    return
+                remaining -= len(page_text)
+                yield page_text
+            if doc.page_count > page_limit:
+                print(f"⚠️ PDF truncated at {page_limit} of {doc.page_count} pages")
+    
+    def find_section_headings(self, text: ResumeText) -> Set[str]:
+        """Return the normalized section names whose headings appear in text"""
+        return ResumeDocument.of(text).section_names
+    
+    def extract_text_from_pdf(self, file_path: Union[str, bytes], max_pages: Optional[int] = None,
+                              max_chars: Optional[int] = None,
+                              stop_after_sections: Optional[bool] = None) -> str:
+        """
+        Extract text from PDF within the page / character budget.
+        
+        With stop_after_sections, reading stops SECTION_TAIL_PAGES pages after
+        every REQUIRED_SECTIONS heading has been seen.
+        """
+        if not fitz:
+            raise ImportError("PyMuPDF not installed")
+        
+        if stop_after_sections is None:
+            stop_after_sections = self.stop_after_sections
+        wanted = set(self.REQUIRED_SECTIONS) if stop_after_sections else None
+        tail_pages = None
+        
+        pages: List[str] = []
         try:
-            with fitz.open(file_path) as doc:
-                for page in doc:
-                    text += page.get_text()
+            for page_text in self.iter_pdf_pages(file_path, max_pages, max_chars):
+                pages.append(page_text)
+                if tail_pages is not None:
+                    tail_pages -= 1
+                elif wanted is not None:
+                    wanted -= self.find_section_headings(page_text)
+                    if not wanted:
+                        tail_pages = self.SECTION_TAIL_PAGES
+                if tail_pages is not None and tail_pages <= 0:
+                    break
         except Exception as e:
             print(f"❌ Error reading PDF: {e}")
         
-        return text.strip()
+        return "".join(pages).strip()
+    
+    def extract_text_from_docx(self, file_path: Union[str, bytes]) -> str:
+        """
+        Extract text from DOCX (path or in-memory bytes).
+        
+        word/document.xml is streamed straight out of the zip (paragraphs and
+        table cells in document order, stopping at the character budget);
+        python-docx is only used when that fails.
+        """
+        try:
+            text = "\n".join(iter_docx_paragraphs(file_path, self.max_chars))
+            return text[:self.max_chars].strip()
+        except (zipfile.BadZipFile, KeyError, ElementTree.ParseError) as e:
+            print(f"⚠️ DOCX stream read failed ({e}), falling back to python-docx")
+        return self._extract_text_from_docx_fallback(file_path)
     
-    def extract_text_from_docx(self, file_path: str) -> str:
-        """Extract text from DOCX"""
+    def _extract_text_from_docx_fallback(self, file_path: Union[str, bytes]) -> str:
+        """python-docx object model (body paragraphs only)"""
         if not Document:
             raise ImportError("python-docx not installed")
         
         try:
+            if isinstance(file_path, (bytes, bytearray)):
+                file_path = io.BytesIO(file_path)
             doc = Document(file_path)
             text = "\n".join([para.text for para in doc.paragraphs])
-            return text.strip()
+            return text[:self.max_chars].strip()
         except Exception as e:
             print(f"❌ Error reading DOCX: {e}")
             return ""
     
-    def extract_text(self, file_path: str) -> str:
-        """Extract text based on file extension"""
-        ext = os.path.splitext(file_path)[1].lower()
+    def extract_text_from_txt(self, file_path: Union[str, bytes]) -> str:
+        """Extract text from a plain-text file (path or in-memory bytes)"""
+        if isinstance(file_path, (bytes, bytearray)):
+            return bytes(file_path).decode('utf-8', errors='replace')[:self.max_chars].strip()
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return f.read(self.max_chars).strip()
+    
+    def detect_format(self, data: bytes, file_name: Optional[str] = None) -> str:
+        """Pick the format of in-memory file data from its name, falling back to magic bytes"""
+        ext = os.path.splitext(file_name or '')[1].lower()
+        if ext in self.supported_formats:
+            return ext
+        if data[:5] == b'%PDF-':
+            return '.pdf'
+        if data[:4] == b'PK\x03\x04':
+            return '.docx'
+        if not ext:
+            return '.txt'
+        raise ValueError(f"Unsupported format: {ext}")
+    
+    def extract_text(self, file_path: ResumeSource, file_name: Optional[str] = None) -> str:
+        """
+        Extract text based on file extension.
+        
+        file_path may also be bytes or a binary file-like object (e.g. a Flask
+        upload); the data is then parsed in memory and file_name, if given, is
+        only used to pick the format.
+        """
+        if hasattr(file_path, 'read'):
+            file_path = file_path.read()
+        
+        if isinstance(file_path, (bytes, bytearray)):
+            ext = self.detect_format(file_path, file_name)
+        else:
+            file_path = str(file_path)
+            ext = os.path.splitext(file_path)[1].lower()
         
         if ext == '.pdf':
             return self.extract_text_from_pdf(file_path)
         elif ext == '.docx':
             return self.extract_text_from_docx(file_path)
         elif ext == '.txt':
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return f.read().strip()
+            return self.extract_text_from_txt(file_path)
         else:
             raise ValueError(f"Unsupported format: {ext}")
     
-    def extract_name(self, text: str) -> str:
+    def extract_name(self, text: ResumeText) -> str:
         """Extract candidate name"""
-        lines = text.split('\n')
-        for line in lines[:5]:
-            line = line.strip()
-            if line and len(line.split()) <= 4:
-                if self.nlp:
-                    try:
-                        doc = self.nlp(line)
-                        if any(ent.label_ == 'PERSON' for ent in doc.ents):
-                            return line
-                    except:
-                        pass
-                # Fallback: capitalized words
-                if all(word[0].isupper() for word in line.split() if word):
-                    return line
-        return "Unknown Candidate"
-    
-    def extract_email(self, text: str) -> Optional[str]:
+        return self.extract_names([text])[0]
+    
+    def extract_names(self, texts: Sequence[ResumeText]) -> List[str]:
+        """
+        Extract candidate names for several resumes with one batched NER pass.
+        
+        The first short header line that is either a PERSON entity or fully
+        capitalized wins. A capitalized line is conclusive on its own, so spaCy
+        only sees the non-capitalized lines above it - all resumes' lines go
+        through a single nlp.pipe call, and resumes whose first candidate line
+        is capitalized never touch NLP at all.
+        """
+        plans = []
+        pending: Dict[str, None] = {}
+        for text in texts:
+            undecided = []
+            fallback = "Unknown Candidate"
+            for line in ResumeDocument.of(text).stripped_lines[:self.NAME_SCAN_LINES]:
+                if not line or len(line.split()) > 4:
+                    continue
+                # Capitalized words: accepted without NLP
+                if all(word[0].isupper() for word in line.split()):
+                    fallback = line
+                    break
+                undecided.append(line)
+                pending[line] = None
+            plans.append((undecided, fallback))
+        
+        persons = set()
+        nlp = self.nlp if pending else None
+        if nlp:
+            try:
+                lines = list(pending)
+                for line, doc in zip(lines, nlp.pipe(lines)):
+                    if any(ent.label_ == 'PERSON' for ent in doc.ents):
+                        persons.add(line)
+            except Exception:
+                pass
+        
+        return [next((line for line in undecided if line in persons), fallback)
+                for undecided, fallback in plans]
+    
+    def extract_email(self, text: ResumeText) -> Optional[str]:
         """Extract email address"""
         pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(pattern, text)
+        emails = re.findall(pattern, ResumeDocument.of(text).text)
         return emails[0] if emails else None
     
-    def extract_phone(self, text: str) -> Optional[str]:
+    def extract_phone(self, text: ResumeText) -> Optional[str]:
         """Extract phone number"""
+        text = ResumeDocument.of(text).text
         patterns = [
             r'\+92[-.\s]?\d{2,3}[-.\s]?\d{7,8}',  # Pakistani
             r'03\d{9}',  # Pakistani mobile
@@ -155,23 +368,18 @@ class ResumeParser:
                 return phones[0].strip()
         return None
     
-    def extract_skills(self, text: str) -> List[str]:
+    def extract_skills(self, text: ResumeText) -> List[str]:
         """Extract technical skills"""
-        text_lower = text.lower()
+        doc = ResumeDocument.of(text)
         found_skills = set()
         
-        # Direct keyword matching
-        for skill in self.skill_keywords:
-            pattern = r'\b' + re.escape(skill.lower()) + r'\b'
-            if re.search(pattern, text_lower):
-                found_skills.add(skill.title())
+        # Direct keyword matching (single pass over the text)
+        for skill in self.skill_lexicon.scan(doc.lower):
+            found_skills.add(skill.title())
         
         # Extract from skills section
-        skills_pattern = r'(?:skills?|technical skills?)[\s:]*([^\n]+(?:\n(?![\n])[^\n]+)*)'
-        skills_match = re.search(skills_pattern, text_lower, re.IGNORECASE)
-        
-        if skills_match:
-            skills_text = skills_match.group(1)
+        skills_text = self._skills_section_text(doc)
+        if skills_text:
             potential_skills = re.split(r'[,|•·\n]', skills_text)
             for skill in potential_skills:
                 skill = skill.strip()
@@ -180,64 +388,506 @@ class ResumeParser:
         
         return list(found_skills)[:50]
     
-    def extract_education(self, text: str) -> List[Dict]:
+    def _skills_section_text(self, doc: ResumeDocument) -> str:
+        """
+        Lowercased body of the skills sections: each detected skills span up to
+        its first blank line, else the first "skills ..." run of lines
+        """
+        spans = [span for span in doc.sections if span.name == 'skills']
+        if spans:
+            body = []
+            for span in spans:
+                block = [span.inline.lower()] if span.inline else []
+                for line in doc.lower_lines[span.start:span.end]:
+                    if line.strip():
+                        block.append(line)
+                    elif block:
+                        break
+                body.extend(block)
+            return '\n'.join(body)
+        
+        skills_match = re.search(r'(?:skills?|technical skills?)[\s:]*([^\n]+(?:\n(?![\n])[^\n]+)*)',
+                                 doc.lower)
+        return skills_match.group(1) if skills_match else ''
+    
+    def extract_education(self, text: ResumeText) -> List[Dict]:
         """Extract education details"""
+        doc = ResumeDocument.of(text)
         education = []
         education_keywords = ['bachelor', 'master', 'phd', 'diploma', 'degree', 
                              'university', 'college', 'bs', 'ms', 'mba', 'bcs']
         
-        lines = text.split('\n')
-        for i, line in enumerate(lines):
-            if any(kw in line.lower() for kw in education_keywords):
-                year_match = re.search(r'\b(19|20)\d{2}\b', line)
+        lines = doc.stripped_lines
+        for i, line_lower in enumerate(doc.lower_lines):
+            if any(kw in line_lower for kw in education_keywords):
+                year_match = re.search(r'\b(19|20)\d{2}\b', lines[i])
                 education.append({
-                    'degree': line.strip(),
-                    'institution': lines[i+1].strip() if i+1 < len(lines) else 'Unknown',
+                    'degree': lines[i],
+                    'institution': lines[i+1] if i+1 < len(lines) else 'Unknown',
                     'year': year_match.group(0) if year_match else None
                 })
         
         return education
     
-    def extract_experience(self, text: str) -> List[Dict]:
+    def extract_experience(self, text: ResumeText) -> List[Dict]:
         """Extract work experience"""
+        doc = ResumeDocument.of(text)
         experience = []
         experience_keywords = ['developer', 'engineer', 'manager', 'analyst', 
                               'consultant', 'intern', 'trainee']
         
-        lines = text.split('\n')
-        for i, line in enumerate(lines):
-            if any(kw in line.lower() for kw in experience_keywords):
-                duration_match = re.search(r'((?:19|20)\d{2})\s*[-–to]+\s*((?:19|20)\d{2}|present)', 
-                                          text[max(0, i-2):min(len(text), i+3)], re.IGNORECASE)
+        for i, line_lower in enumerate(doc.lower_lines):
+            if any(kw in line_lower for kw in experience_keywords):
+                duration_match = self._find_duration(doc, i)
                 experience.append({
-                    'title': line.strip(),
+                    'title': doc.stripped_lines[i],
                     'company': 'Not specified',
                     'duration': duration_match.group(0) if duration_match else 'Unknown'
                 })
         
         return experience[:5]
     
-    def parse_resume(self, file_path: str) -> Dict:
-        """Main parsing function"""
-        print(f"\n📄 Parsing: {os.path.basename(file_path)}")
+    def _find_duration(self, doc: ResumeDocument, index: int):
+        """Nearest 'YYYY - YYYY|present' within two lines of a title (title line first)"""
+        for offset in (0, 1, -1, 2, -2):
+            i = index + offset
+            if 0 <= i < len(doc.lines):
+                match = DURATION_PATTERN.search(doc.lines[i])
+                if match:
+                    return match
+        return None
+    
+    def parse_resume(self, file_path: ResumeSource, file_name: Optional[str] = None) -> Dict:
+        """
+        Main parsing function
+        
+        Accepts a path, raw bytes or a binary file-like object; uploads can be
+        parsed straight from the request body without touching the disk.
+        Results are cached by content hash, so an unchanged file is only parsed once.
+        """
+        in_memory = not isinstance(file_path, (str, Path))
+        display_name = file_name or ('<upload>' if in_memory else os.path.basename(str(file_path)))
+        source_name = file_name if in_memory else str(file_path)
+        print(f"\n📄 Parsing: {display_name}")
+        
+        # Read once (within the byte budget); hash and parse from memory
+        data = self._read_source(file_path, display_name)
+        if self.cache is None:
+            return self._extract_and_parse(data, file_name or source_name, source_name)
+        
+        key = self.cache.make_key(data, self.cache_namespace())
+        cached = self.cache.get(key)
+        if cached is not None:
+            cached['file_path'] = source_name
+            print(f"⚡ Parse cache hit: {cached['candidate_info']['name']}")
+            return cached
+        
+        parsed_data = self._extract_and_parse(data, file_name or source_name, source_name)
+        self.cache.put(key, parsed_data)
+        return parsed_data
+    
+    def _extract_and_parse(self, data: bytes, name: Optional[str],
+                           source_name: Optional[str]) -> Dict:
+        """Text extraction + field parsing, in a guarded worker when a timeout is set"""
+        if self.timeout:
+            parsed_data, _, _ = self._get_guard().run(
+                _guarded_parse, (data, name, source_name), self.timeout, file_name=name)
+            return parsed_data
+        text = self.extract_text(data, name)
+        return self._parse_fields(text, source_name)
+    
+    def parse_text(self, text: ResumeText, file_name: Optional[str] = None) -> Dict:
+        """
+        Parse already-decoded resume text (e.g. resumeText sent by the backend).
+        
+        A ResumeDocument built by the caller is reused as-is when it is already
+        within the character budget, so its views are shared with other analyzers.
+        """
+        doc = ResumeDocument.of(text)
+        clipped = doc.text[:self.max_chars].strip()
+        if clipped != doc.text:
+            doc = ResumeDocument(clipped)
+        if self.cache is None or not doc.text:
+            return self._parse_fields(doc, file_name)
+        
+        key = self.cache.make_key(doc.text.encode('utf-8'), self.cache_namespace('text'))
+        cached = self.cache.get(key)
+        if cached is not None:
+            cached['file_path'] = file_name
+            return cached
+        
+        parsed_data = self._parse_fields(doc, file_name)
+        self.cache.put(key, parsed_data)
+        return parsed_data
+    
+    def cache_namespace(self, kind: str = 'file') -> str:
+        """Cache key suffix: parser version plus every option that changes the output"""
+        return (f"v{self.PARSER_VERSION}:{kind}:{self.max_pages}:{self.max_chars}:"
+                f"{int(self.stop_after_sections)}")
+    
+    def parse_many(self, sources: Sequence[ResumeSource], workers: Optional[int] = None,
+                   file_names: Optional[Sequence[Optional[str]]] = None,
+                   timeout: Optional[float] = None) -> List[Dict]:
+        """
+        Parse many resumes across a process pool.
+        
+        Returns one item per source, in input order:
+            {index, file_name, success, data, error, cached,
+             timings: {read_ms, extract_ms, fields_ms, total_ms}}
+        A failing file yields success=False with its error instead of aborting
+        the batch (plus budget_exceeded details when a budget was hit). Cache
+        hits are answered in this process; only misses are shipped to the
+        workers, each of which builds its parser once. In guarded mode (the
+        parser's timeout, or `timeout` for this batch) the same per-worker
+        batches run in killable workers, and every document keeps its own
+        deadline (see _parse_chunk_guarded).
+        """
+        timeout = timeout or self.timeout
+        workers = workers or min(4, os.cpu_count() or 1)
+        file_names = list(file_names) if file_names else [None] * len(sources)
+        results: List[Optional[Dict]] = [None] * len(sources)
+        pending: List[Tuple[int, bytes, Optional[str], float]] = []
+        keys: Dict[int, str] = {}
         
-        text = self.extract_text(file_path)
-        if not text:
+        for index, (source, file_name) in enumerate(zip(sources, file_names)):
+            started = time.perf_counter()
+            in_memory = not isinstance(source, (str, Path))
+            name = file_name if in_memory else str(source)
+            try:
+                data = self._read_source(source, name)
+            except Exception as e:
+                results[index] = self._batch_item(index, name, error=e, read=started)
+                continue
+            
+            if self.cache is not None:
+                keys[index] = self.cache.make_key(data, self.cache_namespace())
+                cached = self.cache.get(keys[index])
+                if cached is not None:
+                    cached['file_path'] = name
+                    results[index] = self._batch_item(index, name, data=cached, read=started, cached=True)
+                    continue
+            
+            read_ms = (time.perf_counter() - started) * 1000
+            pending.append((index, data, name, read_ms))
+        
+        if timeout and pending:
+            parsed = self._parse_batch_guarded(pending, workers, timeout)
+        elif len(pending) < self.PARALLEL_MIN_BATCH or workers <= 1:
+            parsed = self._parse_batch(pending)
+        else:
+            parsed = self._parse_batch_parallel(pending, workers)
+        
+        for item in parsed:
+            results[item['index']] = item
+            if item['success'] and item['index'] in keys:
+                self.cache.put(keys[item['index']], item['data'])
+        
+        return results
+    
+    def close(self):
+        """Shut down the parse_many worker pool and the guarded workers"""
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+            if self._guard is not None:
+                self._guard.close()
+                self._guard = None
+    
+    def _parse_batch_guarded(self, items: List[Tuple], workers: int,
+                             timeout: Optional[float] = None) -> List[Dict]:
+        """Per-worker chunks through the killable workers, `workers` of them at a time"""
+        guard = self._get_guard(workers)
+        timeout = timeout if timeout is not None else self.timeout
+        chunks = self._chunks(items, workers)
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(chunks)))) as threads:
+            parsed = threads.map(lambda chunk: self._parse_chunk_guarded(guard, chunk, timeout), chunks)
+            return [item for chunk_items in parsed for item in chunk_items]
+    
+    def _parse_chunk_guarded(self, guard: ParseGuard, chunk: List[Tuple],
+                             timeout: Optional[float]) -> List[Dict]:
+        """
+        Parse one chunk in a guarded worker, batched like the process pool
+        (one NER pass), while the worker reports every extracted and every
+        parsed document. Each report must arrive within `timeout`, so each
+        document's extraction and its field parsing get their own deadline.
+        
+        When the worker is killed (deadline) or dies (crash), the document it
+        was working on fails and the rest of the chunk is resubmitted to a
+        fresh worker; if it died during the shared name pass, the remaining
+        documents are retried one by one.
+        """
+        results: Dict[int, Dict] = {}
+        batches = [chunk]
+        while batches:
+            items = batches.pop()
+            extracted: Set[int] = set()
+            names_done = False
+            try:
+                for kind, index, value in guard.stream(_stream_chunk_in_worker, (items,), timeout):
+                    if kind == 'result':
+                        results[index] = value
+                    elif kind == 'extracted':
+                        extracted.add(index)
+                    else:
+                        names_done = True
+                continue
+            except Exception as e:
+                error = e
+            
+            left = [item for item in items if item[0] not in results]
+            if not left:
+                continue
+            if names_done or any(item[0] not in extracted for item in left):
+                # Extraction / fields run in input order: the first unfinished document stalled
+                stalled = next(item for item in left if names_done or item[0] not in extracted)
+            elif len(left) == 1:
+                stalled = left[0]
+            else:
+                batches.extend([item] for item in left)
+                continue
+            
+            index, _, name, read_ms = stalled
+            if isinstance(error, ParseBudgetExceeded):
+                error = ParseBudgetExceeded(error.budget, error.limit, error.actual, name)
+            print(f"❌ Guarded parse failed: {name}: {error}")
+            results[index] = self._batch_item(index, name, error=error, read_ms=read_ms)
+            rest = [item for item in left if item is not stalled]
+            if rest:
+                batches.append(rest)
+        
+        return [results[item[0]] for item in chunk]
+    
+    def _get_guard(self, workers: Optional[int] = None) -> ParseGuard:
+        """The guarded workers, with room for at least `workers` concurrent calls"""
+        with self._pool_lock:
+            if self._guard is None:
+                self._guard = ParseGuard(max(self.guard_workers, workers or 0),
+                                         initializer=_init_parse_worker,
+                                         initargs=(self._worker_options(),))
+            elif workers:
+                self._guard.ensure_workers(workers)
+            return self._guard
+    
+    def _worker_options(self) -> Dict:
+        """Constructor options reproduced in worker processes"""
+        return {'max_pages': self.max_pages, 'max_chars': self.max_chars,
+                'stop_after_sections': self.stop_after_sections}
+    
+    def _parse_batch_parallel(self, items: List[Tuple], workers: int) -> List[Dict]:
+        """
+        Fan chunks of items out to the worker pool.
+        
+        A worker that dies (e.g. crashed inside a native library) breaks the
+        whole pool, failing every chunk still pending on it. Those chunks are
+        resubmitted once to a rebuilt pool; chunks that fail again run in
+        isolated guarded workers, where only the documents that really crash
+        fail. The pool is shared with concurrent callers, so nothing on it is
+        ever cancelled.
+        """
+        parsed: List[Dict] = []
+        unfinished = self._chunks(items, workers)
+        for _ in range(2):  # first run + one rebuilt pool
+            pool = self._get_pool(workers)
+            futures = []
+            for chunk in unfinished:
+                try:
+                    futures.append((chunk, pool.submit(_parse_chunk_in_worker, chunk)))
+                except BrokenProcessPool as e:
+                    futures.append((chunk, e))
+            
+            unfinished = []
+            for chunk, future in futures:
+                try:
+                    if isinstance(future, BrokenProcessPool):
+                        raise future
+                    parsed.extend(future.result())
+                except BrokenProcessPool:
+                    unfinished.append(chunk)
+                except Exception as e:
+                    # The worker survived but the chunk could not be run (e.g. unpicklable result)
+                    print(f"❌ Parse worker failed: {e}")
+                    parsed.extend(self._batch_item(index, name, error=e) for index, _, name, _ in chunk)
+            if not unfinished:
+                return parsed
+            
+            print(f"⚠️ Parse worker died, {len(unfinished)} chunk(s) to retry")
+            self._discard_pool(pool)
+        
+        parsed.extend(self._parse_batch_guarded([item for chunk in unfinished for item in chunk], workers))
+        return parsed
+    
+    @staticmethod
+    def _chunks(items: List[Tuple], workers: int) -> List[List[Tuple]]:
+        """About four chunks per worker: batched NER per chunk, balanced load across workers"""
+        chunk_size = max(1, math.ceil(len(items) / (workers * 4)))
+        return [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+    
+    def _discard_pool(self, pool: ProcessPoolExecutor):
+        """Forget a broken pool (unless a concurrent caller already replaced it)"""
+        with self._pool_lock:
+            if self._pool is pool:
+                self._pool = None
+        pool.shutdown(wait=False)
+    
+    def _get_pool(self, workers: int) -> ProcessPoolExecutor:
+        with self._pool_lock:
+            if self._pool is None or self._pool_workers != workers:
+                if self._pool is not None:
+                    self._pool.shutdown(wait=False)
+                self._pool = ProcessPoolExecutor(max_workers=workers,
+                                                 initializer=_init_parse_worker,
+                                                 initargs=(self._worker_options(),))
+                self._pool_workers = workers
+            return self._pool
+    
+    def _parse_batch(self, items: List[Tuple]) -> List[Dict]:
+        """Parse (index, data, name, read_ms) items in this process with one batched NER pass"""
+        return [item for kind, _, item in self._iter_batch(items) if kind == 'result']
+    
+    def _iter_batch(self, items: List[Tuple]) -> Iterator[Tuple[str, Optional[int], Any]]:
+        """
+        _parse_batch as progress events (kind, index, value):
+            ('extracted', index, extract_ms)  text extracted
+            ('names', None, None)             batched name pass done
+            ('result', index, item)           document finished (parse_many item)
+        """
+        extracted = []
+        for index, data, name, read_ms in items:
+            started = time.perf_counter()
+            try:
+                text = self.extract_text(data, name)
+                if not text:
+                    raise ValueError("Could not extract text")
+            except Exception as e:
+                yield 'result', index, self._batch_item(index, name, error=e, read_ms=read_ms,
+                                                        extract_ms=(time.perf_counter() - started) * 1000)
+                continue
+            extract_ms = (time.perf_counter() - started) * 1000
+            extracted.append((index, name, text, read_ms, extract_ms))
+            yield 'extracted', index, extract_ms
+        
+        started = time.perf_counter()
+        extracted = [(index, name, ResumeDocument(text), read_ms, extract_ms)
+                     for index, name, text, read_ms, extract_ms in extracted]
+        names = self.extract_names([doc for _, _, doc, _, _ in extracted])
+        name_share_ms = (time.perf_counter() - started) * 1000 / max(len(extracted), 1)
+        yield 'names', None, None
+        
+        for (index, name, doc, read_ms, extract_ms), candidate in zip(extracted, names):
+            started = time.perf_counter()
+            try:
+                data = self._parse_fields(doc, name, name=candidate)
+                error = None
+            except Exception as e:
+                data, error = None, e
+            fields_ms = (time.perf_counter() - started) * 1000 + name_share_ms
+            yield 'result', index, self._batch_item(index, name, data=data, error=error, read_ms=read_ms,
+                                                    extract_ms=extract_ms, fields_ms=fields_ms)
+    
+    @staticmethod
+    def _batch_item(index: int, file_name: Optional[str], data: Optional[Dict] = None,
+                    error: Optional[Exception] = None, cached: bool = False,
+                    read: Optional[float] = None, read_ms: float = 0.0,
+                    extract_ms: float = 0.0, fields_ms: float = 0.0) -> Dict:
+        """One parse_many result entry"""
+        if read is not None:
+            read_ms = (time.perf_counter() - read) * 1000
+        return {
+            'index': index,
+            'file_name': file_name,
+            'success': error is None,
+            'data': data if error is None else None,
+            'error': f"{type(error).__name__}: {error}" if error is not None else None,
+            'budget_exceeded': error.to_dict() if isinstance(error, ParseBudgetExceeded) else None,
+            'cached': cached,
+            'timings': {
+                'read_ms': round(read_ms, 2),
+                'extract_ms': round(extract_ms, 2),
+                'fields_ms': round(fields_ms, 2),
+                'total_ms': round(read_ms + extract_ms + fields_ms, 2),
+            },
+        }
+    
+    def _read_source(self, file_path: ResumeSource, name: Optional[str] = None) -> bytes:
+        """
+        Return the raw bytes of a path, bytes or file-like source.
+        Raises ParseBudgetExceeded('bytes') without reading past max_bytes.
+        """
+        if hasattr(file_path, 'read'):
+            data = file_path.read(self.max_bytes + 1)
+            if len(data) > self.max_bytes:
+                raise ParseBudgetExceeded('bytes', self.max_bytes, file_name=name)
+        elif isinstance(file_path, (bytes, bytearray)):
+            data = bytes(file_path)
+        else:
+            size = os.path.getsize(file_path)
+            if size > self.max_bytes:
+                raise ParseBudgetExceeded('bytes', self.max_bytes, size, name)
+            with open(file_path, 'rb') as f:
+                data = f.read()
+        if len(data) > self.max_bytes:
+            raise ParseBudgetExceeded('bytes', self.max_bytes, len(data), name)
+        return data
+    
+    def _parse_fields(self, text: ResumeText, file_path: Optional[str],
+                      name: Optional[str] = None) -> Dict:
+        """
+        Run the field extractors over extracted text (name may come from extract_names).
+        
+        The text is wrapped in one ResumeDocument so every extractor shares the
+        same lines, lowercase view and section spans.
+        """
+        doc = ResumeDocument.of(text)
+        if not doc.text:
             raise ValueError("Could not extract text")
         
         parsed_data = {
-            'raw_text': text,
+            'raw_text': doc.text,
             'candidate_info': {
-                'name': self.extract_name(text),
-                'email': self.extract_email(text),
-                'phone': self.extract_phone(text)
+                'name': name if name is not None else self.extract_name(doc),
+                'email': self.extract_email(doc),
+                'phone': self.extract_phone(doc)
             },
-            'skills': self.extract_skills(text),
-            'education': self.extract_education(text),
-            'experience': self.extract_experience(text),
+            'skills': self.extract_skills(doc),
+            'education': self.extract_education(doc),
+            'experience': self.extract_experience(doc),
             'file_path': file_path,
             'parsed_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         }
         
         print(f"✅ Parsed: {parsed_data['candidate_info']['name']}")
         return parsed_data
+
+
+# ─────────────────────────────────────────────────────────────────────
+#  parse_many worker processes
+# ─────────────────────────────────────────────────────────────────────
+_worker_parser: Optional[ResumeParser] = None
+
+
+def _init_parse_worker(options: Dict):
+    """Build the worker's parser once (results are cached by the parent process)"""
+    global _worker_parser
+    _worker_parser = ResumeParser(use_cache=False, **options)
+
+
+def _parse_chunk_in_worker(items: List[Tuple]) -> List[Dict]:
+    return _worker_parser._parse_batch(items)
+
+
+def _stream_chunk_in_worker(items: List[Tuple]) -> Iterator[Tuple]:
+    """Progress events of one chunk, streamed back by a ParseGuard worker"""
+    return _worker_parser._iter_batch(items)
+
+
+def _guarded_parse(data: bytes, name: Optional[str],
+                   source_name: Optional[str]) -> Tuple[Dict, float, float]:
+    """Extract + parse one document in a ParseGuard worker; returns (data, extract_ms, fields_ms)"""
+    started = time.perf_counter()
+    text = _worker_parser.extract_text(data, name)
+    extracted = time.perf_counter()
+    parsed_data = _worker_parser._parse_fields(text, source_name)
+    return (parsed_data, (extracted - started) * 1000,
+            (time.perf_counter() - extracted) * 1000)
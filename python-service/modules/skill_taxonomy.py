@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+"""
+VeriResume - Skill Taxonomy
+Single home for the skill vocabularies used across the service and a compiled
+multi-pattern matcher that finds every known skill in one pass over the text.
+
+Consumers:
+  - ResumeParser.extract_skills          (RESUME_LEXICON)
+  - job_matcher.extract_skills_from_text (MATCHER_LEXICON, alias-normalized)
+  - DeepResumeAnalyzer._extract_skills   (ANALYZER_LEXICON)
+  - /api/filter-tech-keywords            (ANALYZER_LEXICON.canonical)
+  - anomaly_rules.RuleEngine             (per-field indicator lexicons, occurrences)
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# ─────────────────────────────────────────────────────────────────────
+#  Vocabularies
+# ─────────────────────────────────────────────────────────────────────
+
+# Skills recognised by the resume parser
+RESUME_SKILLS = {
+    # Programming
+    'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'php', 'ruby',
+    'go', 'rust', 'swift', 'kotlin', 'scala', 'r', 'matlab',
+
+    # Web Development
+    'html', 'css', 'react', 'angular', 'vue', 'node.js', 'express',
+    'django', 'flask', 'spring', 'asp.net', 'laravel', 'rest api',
+
+    # Data Science & ML
+    'machine learning', 'deep learning', 'data science', 'data analysis',
+    'ai', 'ml', 'nlp', 'computer vision', 'tensorflow', 'pytorch',
+    'pandas', 'numpy', 'scikit-learn', 'tableau', 'power bi',
+
+    # Databases
+    'sql', 'mysql', 'postgresql', 'mongodb', 'redis', 'oracle',
+
+    # Cloud & DevOps
+    'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'git'
+}
+
+# Technical skills recognised by the deep analyzer
+TECH_SKILLS = {
+    "python", "java", "javascript", "typescript", "c++", "c#", "ruby", "go",
+    "rust", "swift", "kotlin", "php", "scala", "r", "matlab", "perl",
+    "react", "angular", "vue", "next.js", "node.js", "express", "django",
+    "flask", "spring", "spring boot", ".net", "laravel", "rails",
+    "html", "css", "sass", "tailwind", "bootstrap",
+    "sql", "mysql", "postgresql", "mongodb", "redis", "firebase",
+    "aws", "azure", "gcp", "docker", "kubernetes", "terraform",
+    "git", "github", "gitlab", "ci/cd", "jenkins", "devops",
+    "machine learning", "deep learning", "nlp", "computer vision",
+    "tensorflow", "pytorch", "scikit-learn", "pandas", "numpy",
+    "data science", "data analysis", "data engineering", "big data",
+    "rest api", "graphql", "microservices", "agile", "scrum",
+    "linux", "unix", "bash", "powershell",
+    "figma", "photoshop", "illustrator", "ui/ux",
+    "jira", "confluence", "trello", "slack",
+    "selenium", "cypress", "jest", "pytest", "junit",
+    "blockchain", "web3", "solidity", "ethereum",
+    "power bi", "tableau", "excel", "sap", "oracle",
+}
+
+SOFT_SKILLS = {
+    "leadership", "communication", "teamwork", "problem solving",
+    "critical thinking", "time management", "project management",
+    "mentoring", "presentation", "negotiation", "collaboration",
+    "adaptability", "creativity", "attention to detail", "analytical",
+    "strategic thinking", "decision making", "conflict resolution",
+}
+
+# Tech skills that collide with substrings of ordinary words
+# (e.g. "r" inside "experienced", "go" inside "google",
+#  "java" inside "javascript", "scala" inside "scalable")
+SUBSTR_CONFLICTS = {"java", "scala", "r", "go", "c#", "c++", "ruby", "rust", "swift", "sass"}
+
+# Common skill aliases / normalization used by the job matcher
+SKILL_ALIASES = {
+    "js": "javascript", "ts": "typescript", "py": "python",
+    "react.js": "react", "reactjs": "react", "react js": "react",
+    "node.js": "node", "nodejs": "node", "node js": "node",
+    "vue.js": "vue", "vuejs": "vue",
+    "next.js": "nextjs", "next js": "nextjs",
+    "c#": "csharp", "c sharp": "csharp",
+    "c++": "cpp", "cplusplus": "cpp",
+    ".net": "dotnet", "dot net": "dotnet",
+    "mongo": "mongodb", "mongo db": "mongodb",
+    "postgres": "postgresql", "pg": "postgresql",
+    "ms sql": "mssql", "sql server": "mssql",
+    "amazon web services": "aws",
+    "google cloud platform": "gcp", "google cloud": "gcp",
+    "ml": "machine learning", "dl": "deep learning",
+    "ai": "artificial intelligence",
+    "ci/cd": "cicd", "ci cd": "cicd",
+    "devops": "devops", "dev ops": "devops",
+    "ui/ux": "uiux", "ui ux": "uiux",
+    "power bi": "powerbi",
+    "ms office": "microsoft office",
+    "ms excel": "excel",
+}
+
+# High-value tech skills (weighted higher in matching)
+HIGH_VALUE_SKILLS = {
+    "python", "javascript", "react", "node", "typescript", "java", "csharp",
+    "aws", "azure", "gcp", "docker", "kubernetes", "sql", "mongodb",
+    "machine learning", "deep learning", "tensorflow", "pytorch",
+    "flutter", "swift", "kotlin", "golang", "rust",
+    "graphql", "rest api", "microservices", "cicd",
+    "postgresql", "redis", "elasticsearch",
+}
+
+# ─────────────────────────────────────────────────────────────────────
+#  Boundary modes
+# ─────────────────────────────────────────────────────────────────────
+# WORD   - neighbours must not be word characters (like regex \b around a
+#          plain word, but also correct for terms such as "c++" or ".net")
+# LETTER - neighbours must not be letters, and the term may not follow "/"
+# NONE   - plain substring match
+WORD = 'word'
+LETTER = 'letter'
+NONE = 'none'
+
+_WORD_CHARS = frozenset('abcdefghijklmnopqrstuvwxyz0123456789_')
+_LETTERS = frozenset('abcdefghijklmnopqrstuvwxyz')
+
+_NEXT_BLOCKED = {WORD: _WORD_CHARS, LETTER: _LETTERS, NONE: frozenset()}
+_PREV_BLOCKED = {WORD: _WORD_CHARS, LETTER: _LETTERS | {'/'}, NONE: frozenset()}
+_LOOKAHEAD = {WORD: r'(?![a-z0-9_])', LETTER: r'(?![a-z])', NONE: ''}
+
+
+class SkillLexicon:
+    """
+    Compiled single-pass matcher for a fixed set of skill terms.
+
+    The terms are folded into a character trie which is emitted as one
+    prefix-factored regular expression, so the text is walked once no matter
+    how many terms the lexicon holds. At every start position the regex picks
+    the longest term; shorter terms sharing that start are recovered from a
+    table precomputed at build time, so overlapping skills such as
+    "sql server" and "sql" are both reported.
+    """
+
+    def __init__(
+        self,
+        terms: Iterable[str],
+        aliases: Optional[Dict[str, str]] = None,
+        boundary: str = WORD,
+        overrides: Optional[Dict[str, str]] = None,
+        strip: bool = True,
+    ):
+        self.aliases = {k.lower(): v.lower() for k, v in (aliases or {}).items()}
+        # strip=False keeps significant edge spaces (e.g. "bs " as a plain substring)
+        self.terms = frozenset((t.strip() if strip else t).lower() for t in terms if t and t.strip())
+        overrides = {k.lower(): v for k, v in (overrides or {}).items()}
+        self.modes = {t: overrides.get(t, boundary) for t in self.terms}
+
+        self._prefixes = self._build_prefix_table()
+        self._pattern = re.compile(self._build_regex()) if self.terms else None
+
+    # ─────────────────────────────────────────────────────────────────
+    #  Public API
+    # ─────────────────────────────────────────────────────────────────
+    def scan(self, text: str) -> List[str]:
+        """Return every lexicon term found in ``text`` (first-seen order)."""
+        return list(dict.fromkeys(term for _, term in self.occurrences(text)))
+
+    def occurrences(self, text: str) -> List[Tuple[int, str]]:
+        """(start offset, term) of every occurrence of every lexicon term in ``text``."""
+        if not text or self._pattern is None:
+            return []
+
+        lower = text.lower()
+        search = self._pattern.search
+        prefixes = self._prefixes
+        found: List[Tuple[int, str]] = []
+
+        pos = 0
+        while True:
+            m = search(lower, pos)
+            if m is None:
+                break
+            start = m.start()
+            prev = lower[start - 1] if start else ''
+            term = m.group(0)
+            if prev not in _PREV_BLOCKED[self.modes[term]]:
+                found.append((start, term))
+            for short, mode in prefixes.get(term, ()):
+                if prev not in _PREV_BLOCKED[mode]:
+                    found.append((start, short))
+            pos = start + 1
+
+        return found
+
+    def find(self, text: str) -> Set[str]:
+        """Return the alias-normalized skills found in ``text``."""
+        return {self.aliases.get(t, t) for t in self.scan(text)}
+
+    def canonical(self, term: str) -> Optional[str]:
+        """Exact lookup of a single keyword; returns its normalized form or None."""
+        t = (term or '').strip().lower()
+        if t in self.terms:
+            return self.aliases.get(t, t)
+        return None
+
+    def __contains__(self, term: str) -> bool:
+        return self.canonical(term) is not None
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    # ─────────────────────────────────────────────────────────────────
+    #  Compilation
+    # ─────────────────────────────────────────────────────────────────
+    def _build_prefix_table(self) -> Dict[str, List[tuple]]:
+        """For each term, the shorter terms that start it and end on a valid boundary."""
+        table: Dict[str, List[tuple]] = {}
+        for term in self.terms:
+            shorter = []
+            for i in range(1, len(term)):
+                head = term[:i]
+                if head in self.terms and term[i] not in _NEXT_BLOCKED[self.modes[head]]:
+                    shorter.append((head, self.modes[head]))
+            if shorter:
+                table[term] = shorter
+        return table
+
+    def _build_regex(self) -> str:
+        trie: Dict = {}
+        for term in self.terms:
+            node = trie
+            for ch in term:
+                node = node.setdefault(ch, {})
+            node[''] = term
+        return self._node_regex(trie)
+
+    def _node_regex(self, node: Dict) -> str:
+        # Longer continuations come first so the regex prefers the longest term
+        branches = [re.escape(ch) + self._node_regex(child)
+                    for ch, child in sorted(node.items()) if ch != '']
+        if '' in node:
+            branches.append(_LOOKAHEAD[self.modes[node['']]])
+        if len(branches) == 1:
+            return branches[0]
+        return '(?:' + '|'.join(branches) + ')'
+
+
+# ─────────────────────────────────────────────────────────────────────
+#  Shared compiled lexicons
+# ─────────────────────────────────────────────────────────────────────
+RESUME_LEXICON = SkillLexicon(RESUME_SKILLS)
+
+MATCHER_LEXICON = SkillLexicon(
+    set(SKILL_ALIASES.values()) | HIGH_VALUE_SKILLS | set(SKILL_ALIASES.keys()),
+    aliases=SKILL_ALIASES,
+)
+
+ANALYZER_LEXICON = SkillLexicon(
+    TECH_SKILLS | SOFT_SKILLS,
+    boundary=NONE,
+    overrides={s: LETTER for s in TECH_SKILLS if s in SUBSTR_CONFLICTS or len(s) <= 3},
+)
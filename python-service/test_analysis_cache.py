@@ -0,0 +1,71 @@
+"""
+Test script for the Analysis Result Cache
+Checks content-hash keys, the bounded LRU, private copies and per-stage stats
+"""
+
+from modules.analysis_cache import AnalysisCache
+
+RESUME_TEXT = "Sara Ahmed\nBackend developer building Django services on AWS.\nSkills: Python, Django"
+JD = "Senior Python Developer with Django, Docker and AWS."
+
+
+def test_keys_follow_stage_inputs():
+    """Same stage and inputs share a key; any changed input or another stage does not"""
+    print("=" * 70)
+    print("TEST: analysis cache keys")
+    print("=" * 70)
+
+    key = AnalysisCache.key('hrcode', RESUME_TEXT, JD, 30, 50)
+    assert key == AnalysisCache.key('hrcode', RESUME_TEXT, JD, 30, 50)
+    assert key.startswith('hrcode:')
+    assert key != AnalysisCache.key('hrcode', RESUME_TEXT + ' ', JD, 30, 50)
+    assert key != AnalysisCache.key('hrcode', RESUME_TEXT, JD, 40, 50)
+    assert key != AnalysisCache.key('groq', RESUME_TEXT, JD, 30, 50)
+    # Parts are separated: moving text across the boundary changes the key
+    assert AnalysisCache.key('groq', 'ab', 'c') != AnalysisCache.key('groq', 'a', 'bc')
+
+
+def test_bounded_lru_with_stage_stats():
+    """Results come back as private copies; the LRU is bounded and counts hits per stage"""
+    print("=" * 70)
+    print("TEST: analysis cache LRU and stats")
+    print("=" * 70)
+
+    cache = AnalysisCache(max_entries=2)
+    review = {'match_score': 80, 'matched_skills': ['Python']}
+    groq_key = AnalysisCache.key('groq', 'model', 'prompt')
+    assert cache.get(groq_key) is None
+    cache.put(groq_key, review)
+    review['matched_skills'].append('mutated after put')
+
+    cached = cache.get(groq_key)
+    assert cached == {'match_score': 80, 'matched_skills': ['Python']}
+    cached['matched_skills'].append('mutated after get')
+    assert cache.get(groq_key)['matched_skills'] == ['Python']
+
+    hrcode_keys = [AnalysisCache.key('hrcode', RESUME_TEXT, JD, threshold) for threshold in (10, 20)]
+    cache.put(hrcode_keys[0], {'success': True})
+    cache.get(groq_key)                                # groq result is now the most recent
+    cache.put(hrcode_keys[1], {'success': True})       # evicts hrcode_keys[0]
+    assert len(cache) == 2
+    assert cache.get(hrcode_keys[0]) is None and cache.get(groq_key) is not None
+
+    stats = cache.stats()
+    print(f"Stats: {stats}")
+    assert stats['entries'] == 2 and stats['max_entries'] == 2
+    assert stats['stages']['groq'] == {'hits': 4, 'misses': 1, 'hit_rate': 0.8}
+    assert stats['stages']['hrcode'] == {'hits': 0, 'misses': 1, 'hit_rate': 0.0}
+
+    disabled = AnalysisCache(max_entries=0)
+    disabled.put(groq_key, review)
+    assert disabled.get(groq_key) is None
+
+    cache.clear()
+    assert len(cache) == 0 and cache.stats()['stages'] == {}
+
+
+if __name__ == '__main__':
+    print("\n🗂️  ANALYSIS CACHE TEST SUITE\n")
+    test_keys_follow_stage_inputs()
+    test_bounded_lru_with_stage_stats()
+    print("\n✅ All tests passed!")
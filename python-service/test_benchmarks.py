@@ -0,0 +1,65 @@
+"""
+Test script for the benchmark suite
+Runs a tiny corpus through every stage and checks the JSON report shape
+"""
+
+import json
+import os
+import tempfile
+
+from benchmarks.corpus import generate_corpus, generate_jobs
+from benchmarks.run import STAGES, run_benchmark, compare_results, main
+
+
+def test_corpus_is_reproducible():
+    """Same seed -> same resumes; every format and size is represented"""
+    print("=" * 70)
+    print("TEST: synthetic corpus")
+    print("=" * 70)
+
+    first = generate_corpus(count=9, seed=3)
+    again = generate_corpus(count=9, seed=3)
+    assert [d.text for d in first] == [d.text for d in again]
+    assert {d.format for d in first} == {'pdf', 'docx', 'txt'}
+    assert {d.size for d in first} == {'small', 'medium', 'large'}
+    assert first[0].data.startswith(b'%PDF') and first[1].data.startswith(b'PK')
+    assert len(generate_jobs(count=5)) == 5
+
+
+def test_report_and_comparison():
+    """Every stage gets percentiles; a slower run is flagged as a regression"""
+    print("=" * 70)
+    print("TEST: benchmark report + comparison")
+    print("=" * 70)
+
+    report = run_benchmark(count=3, job_count=5)
+    for stage in STAGES:
+        summary = report['stages'][stage]
+        print(f"  {stage}: {summary['p50_ms']} ms p50")
+        assert summary['count'] == 3
+        assert summary['p50_ms'] <= summary['p95_ms'] <= summary['max_ms']
+        assert 'format:pdf' in summary['groups']
+    assert report['stages']['extract_text']['mb_per_s'] > 0
+
+    slower = json.loads(json.dumps(report))
+    slower['stages']['fields']['p50_ms'] *= 2
+    rows = compare_results(slower, report, threshold=0.10)
+    flagged = {(r['stage'], r['metric']) for r in rows if r['regression']}
+    assert flagged == {('fields', 'p50_ms')}
+
+    folder = tempfile.mkdtemp()
+    baseline = os.path.join(folder, 'baseline.json')
+    with open(baseline, 'w') as f:
+        json.dump(slower, f)
+    out = os.path.join(folder, 'current.json')
+    assert main(['--count', '3', '--jobs', '5', '--stages', 'extract_text', 'fields',
+                 '--out', out, '--compare', baseline]) == 0
+    with open(out) as f:
+        assert set(json.load(f)['stages']) == {'extract_text', 'fields'}
+
+
+if __name__ == '__main__':
+    print("\n⏱️ BENCHMARK SUITE TESTS\n")
+    test_corpus_is_reproducible()
+    test_report_and_comparison()
+    print("\n✅ All tests passed!")
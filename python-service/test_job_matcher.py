@@ -0,0 +1,346 @@
+"""
+Test script for the Job Matcher
+Checks indexed (incremental) TF-IDF scoring, pruned top-k ranking, vectorized and
+batch scoring, index persistence and reentrancy
+"""
+
+import math
+import os
+import tempfile
+import threading
+from collections import Counter
+
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.metrics.pairwise import cosine_similarity
+
+from benchmarks.corpus import generate_jobs
+from modules.job_index import IncrementalTfidf, JobFeatureIndex, TFIDF_PARAMS, job_text
+from modules.job_matcher import JobMatcher
+
+RESUME = {
+    'resume_skills': ['Python', 'Django', 'PostgreSQL', 'Docker', 'AWS', 'React'],
+    'resume_title': 'Python Developer',
+    'resume_summary': 'Backend engineer building Django REST APIs on AWS with Docker.',
+    'resume_experience_years': 4,
+}
+
+
+def _match(matcher, jobs, **overrides):
+    return matcher.match_resume_to_jobs(**dict(RESUME, **overrides), jobs=jobs, min_score=0)
+
+
+def _oov_scale(reference, n_docs, text):
+    """In-vocabulary share of the query's norm; terms outside the vocabulary weigh ln(1 + n_docs) + 1"""
+    terms = Counter(reference.build_analyzer()(text))
+    oov_idf = math.log(1 + n_docs) + 1
+    known = sum((count * reference.idf_[reference.vocabulary_[term]]) ** 2
+                for term, count in terms.items() if term in reference.vocabulary_)
+    unknown = sum((count * oov_idf) ** 2 for term, count in terms.items() if term not in reference.vocabulary_)
+    return math.sqrt(known / (known + unknown)) if known else 0.0
+
+
+def test_semantic_scores_use_indexed_corpus():
+    """Scores equal cosines under a TF-IDF fitted once over the indexed jobs (resume norm over all its terms)"""
+    print("=" * 70)
+    print("TEST: indexed TF-IDF semantic scores")
+    print("=" * 70)
+
+    jobs = generate_jobs(count=40, seed=11)
+    jobs.append({'title': '', 'description': '', 'url': 'empty'})  # no text: neutral score
+    matcher = JobMatcher()
+    matcher.index.add_jobs(jobs)
+    resume_text = f"{RESUME['resume_title']} {RESUME['resume_summary']} {' '.join(RESUME['resume_skills'])}"
+    job_texts = [job_text(job) for job in jobs]
+
+    scores = matcher.index.semantic_scores(resume_text, matcher.index.features_for(jobs))
+
+    reference = TfidfVectorizer(**TFIDF_PARAMS).fit(job_texts[:-1])
+    resume_vec = reference.transform([resume_text])
+    scale = _oov_scale(reference, len(job_texts) - 1, resume_text)
+    assert 0 < scale < 1  # "building" and most of its bigrams appear in no job
+    for text, score in zip(job_texts[:-1], scores):
+        sim = cosine_similarity(resume_vec, reference.transform([text]))[0][0] * scale
+        assert abs(score - max(0, min(100, sim * 200))) < 1e-6
+    assert scores[-1] == 50.0
+
+    fits = matcher.index.fits
+    results = _match(matcher, jobs)
+    assert matcher.index.fits == fits  # already indexed: no refit
+    print(f"Top match: {results[0]['title']} ({results[0]['matchScore']})")
+    assert len(results) == len(jobs)
+    assert [r['matchScore'] for r in results] == sorted((r['matchScore'] for r in results), reverse=True)
+    assert all(0 <= r['semanticScore'] <= 100 for r in results)
+
+
+def test_index_persists_and_tracks_content():
+    """Saved index reloads to identical scores; changed job content is re-extracted"""
+    print("=" * 70)
+    print("TEST: job index persistence")
+    print("=" * 70)
+
+    jobs = generate_jobs(count=25, seed=3)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'jobs.npz')
+        index = JobFeatureIndex(path=path)
+        index.add_jobs(jobs)
+        expected = _match(JobMatcher(index=index), jobs)
+        assert index.save_if_dirty()
+        assert not index.save_if_dirty()
+
+        reloaded = JobFeatureIndex(path=path)
+        print(f"Reloaded: {reloaded.stats()}")
+        assert len(reloaded) == len(jobs)
+        assert _match(JobMatcher(index=reloaded), jobs) == expected
+        assert reloaded.misses == 0 and reloaded.fits == 0
+
+    # Same URL, new description: replaces the stale entry
+    changed = dict(jobs[0], description="Senior Rust engineer, 9+ years of experience with Rust and Go.")
+    features = index.features_for([changed])[0]
+    assert features.required_years == 9
+    assert 'rust' in features.skills
+    assert len(index) == len(jobs)
+
+
+def test_incremental_idf_tracks_corpus():
+    """Added / evicted jobs update IDF without a refit; large drift triggers one"""
+    print("=" * 70)
+    print("TEST: incremental IDF")
+    print("=" * 70)
+
+    jobs = generate_jobs(count=400, seed=8)
+    resume_text = f"{RESUME['resume_title']} {RESUME['resume_summary']} {' '.join(RESUME['resume_skills'])}"
+    index = JobFeatureIndex(max_entries=240, compact_drift=0.5)
+    index.add_jobs(jobs[:200])
+    vocabulary = TfidfVectorizer(**TFIDF_PARAMS).fit([job_text(job) for job in jobs[:200]]).vocabulary_
+
+    def check(reference, live=None):
+        live = live or index.all_features()
+        scores = index.semantic_scores(resume_text, live)
+        resume_vec = reference.transform([resume_text])
+        sims = cosine_similarity(resume_vec, reference.transform([f.text for f in live]))[0]
+        sims *= _oov_scale(reference, len(index), resume_text)
+        assert all(abs(score - max(0, min(100, sim * 200))) < 1e-6 for score, sim in zip(scores, sims))
+
+    # 60 new jobs, 20 of the oldest evicted: drift 80 / 200, IDF over the 240 live jobs, fitted vocabulary.
+    # Added one scoring request at a time: rows live in many chunks (merged past MAX_CHUNKS)
+    for job in jobs[200:260]:
+        index.semantic_scores(resume_text, index.features_for([job]))
+    assert index.fits == 1 and len(index) == 240
+    live_texts = [f.text for f in index.all_features()]
+    reference = TfidfVectorizer(**dict(TFIDF_PARAMS, vocabulary=vocabulary)).fit(live_texts)
+    check(reference)
+    check(reference, index.all_features()[::-7])  # rows gathered across chunks, out of order
+    print(f"Incremental: {index.stats()}")
+
+    # 40 more (+40 evicted): drift 160 / 200 > 0.5, compacted into a fresh fit off the request path
+    index.add_jobs(jobs[260:300])
+    assert index.wait_for_compaction(60)
+    assert index.fits == 2 and index.stats()['model_drift'] == 0
+    check(TfidfVectorizer(**TFIDF_PARAMS).fit([f.text for f in index.all_features()]))
+
+
+def test_pruned_top_k_matches_full_ranking():
+    """Skill-index candidates, score bounds and the top-k heap never change the ranking"""
+    print("=" * 70)
+    print("TEST: pruned top-k ranking")
+    print("=" * 70)
+
+    jobs = generate_jobs(count=120, seed=21)
+    jobs.append({'title': 'Pastry Chef', 'description': 'Bake bread and cakes.', 'url': 'chef'})
+    matcher = JobMatcher()
+    matcher.index.add_jobs(jobs)
+
+    for overrides in ({}, {'resume_skills': []}, {'resume_title': ''}, {'resume_experience_years': 0}):
+        full = _match(matcher, jobs, **overrides)
+        for min_score in (0, 40, 55, 60):
+            expected = [r for r in full if r['matchScore'] >= min_score]
+            for top_k in (None, 1, 7, 500):
+                results = matcher.match_resume_to_jobs(
+                    **dict(RESUME, **overrides), jobs=jobs, min_score=min_score, top_k=top_k)
+                assert results == expected[:top_k], (overrides, min_score, top_k)
+
+            # A page (top_k) with totals over every match, as the endpoint asks for
+            scores = [r['matchScore'] for r in expected]
+            stats = {}
+            page = matcher.match_resume_to_jobs(
+                **dict(RESUME, **overrides), jobs=jobs, min_score=min_score, top_k=7, stats=stats)
+            assert page == expected[:7]
+            assert stats == {'matched': len(scores), 'scoreSum': sum(scores),
+                             'topScore': max(scores, default=0)}, (overrides, min_score)
+
+    candidates = matcher.index.skill_candidates({'rust'}, matcher.index.features_for(jobs))
+    assert candidates == []
+    print(f"Top 3: {[(r['title'], r['matchScore']) for r in full[:3]]}")
+
+
+def test_page_keeps_top_k_bound():
+    """match_page as the endpoint calls it: a limited page prunes, totals only on request"""
+    print("=" * 70)
+    print("TEST: endpoint page ranking (offset / limit / totals)")
+    print("=" * 70)
+
+    jobs = generate_jobs(count=1000, seed=31)
+    matcher = JobMatcher()
+    matcher.index.add_jobs(jobs)
+    full = matcher.match_resume_to_jobs(**RESUME, jobs=jobs, min_score=30)
+
+    scored = []
+    title_relevance = matcher._title_relevance
+    matcher._title_relevance = lambda *args: scored.append(1) or title_relevance(*args)
+
+    def run(**page):
+        scored.clear()
+        ranked, totals = matcher.match_page(**RESUME, jobs=jobs, min_score=30, **page)
+        return ranked, totals, len(scored)
+
+    ranked, totals, paged = run(offset=10, limit=10)
+    assert totals is None and ranked == full[:21]  # page + 1 to tell whether more follow
+    exact_ranked, exact, counted = run(offset=10, limit=10, totals=True)
+    assert exact_ranked == full[:21]
+    scores = [r['matchScore'] for r in full]
+    assert exact == {'matched': len(full), 'scoreSum': sum(scores), 'topScore': scores[0]}
+    _, everything, unlimited = run()
+    assert everything == exact
+    print(f"Fully scored: page {paged}, page + totals {counted}, no limit {unlimited}")
+    assert paged * 3 < counted
+
+
+def test_compaction_replays_changes_made_during_the_fit():
+    """Jobs added / evicted while the background refit runs end up in the swapped-in model"""
+    print("=" * 70)
+    print("TEST: background compaction")
+    print("=" * 70)
+
+    jobs = generate_jobs(count=400, seed=13)
+    index = JobFeatureIndex(max_entries=200, compact_drift=0.5)
+    index.add_jobs(jobs[:200])
+    fit = IncrementalTfidf.fit
+    fitting, release = threading.Event(), threading.Event()
+
+    def slow_fit(ids, texts):
+        fitting.set()
+        release.wait(30)
+        return fit(ids, texts)
+
+    IncrementalTfidf.fit = staticmethod(slow_fit)
+    try:
+        index.add_jobs(jobs[200:320])  # drift 240 / 200: compaction starts, the old model answers
+        assert fitting.wait(30) and index.fits == 1  # snapshot taken, fit in progress
+        index.add_jobs(jobs[320:350])  # 30 more (and 30 evicted) while the refit runs
+        release.set()
+        assert index.wait_for_compaction(60)
+    finally:
+        IncrementalTfidf.fit = fit
+
+    live = index.all_features()
+    model = index._model
+    assert index.fits == 2 and set(model.rows) == {f.entry_id for f in live}
+    assert model.fitted_docs == 200 and model.churn == 60
+    resume_text = f"{RESUME['resume_title']} {RESUME['resume_summary']}"
+    assert len(index.semantic_scores(resume_text, live)) == 200
+
+
+def test_vectorized_scoring_matches_per_job_path():
+    """Columnar NumPy scoring returns exactly the per-job results"""
+    print("=" * 70)
+    print("TEST: vectorized composite scoring")
+    print("=" * 70)
+
+    jobs = generate_jobs(count=150, seed=5)
+    jobs += [
+        {'title': '', 'description': '', 'url': 'empty'},
+        {'title': 'The Of', 'description': 'Stop words only title.', 'url': 'stop'},
+        {'title': 'Python Developer', 'description': '2-4 years building Django APIs.', 'url': 'exact'},
+    ]
+    per_job = JobMatcher()
+    per_job.index.add_jobs(jobs)
+    vectorized = JobMatcher(index=per_job.index, vectorized=True)
+    assert vectorized.vectorized
+
+    cases = [{}, {'resume_skills': []}, {'resume_title': ''}, {'resume_title': 'the of'},
+             {'resume_title': 'Python Developr'}, {'resume_experience_years': 0},
+             {'resume_experience_years': 2.5}]
+    for overrides in cases:
+        for min_score, top_k in ((0, None), (45, None), (30, 10)):
+            kwargs = dict(RESUME, **overrides, jobs=jobs, min_score=min_score, top_k=top_k)
+            expected = per_job.match_resume_to_jobs(**kwargs)
+            assert vectorized.match_resume_to_jobs(**kwargs) == expected, (overrides, min_score, top_k)
+            per_job_stats, vectorized_stats = {}, {}
+            per_job.match_resume_to_jobs(**kwargs, stats=per_job_stats)
+            vectorized.match_resume_to_jobs(**kwargs, stats=vectorized_stats)
+            assert vectorized_stats == per_job_stats, (overrides, min_score, top_k)
+
+    results = _match(vectorized, jobs)
+    print(f"Top 3: {[(r['title'], r['matchScore']) for r in results[:3]]}")
+
+
+def test_match_many_equals_single_matches():
+    """Blocked resume x job batch scoring returns each resume's single-call top-k"""
+    print("=" * 70)
+    print("TEST: many-to-many batch matching")
+    print("=" * 70)
+
+    jobs = generate_jobs(count=80, seed=8)
+    matcher = JobMatcher()
+    resumes = [
+        {'resume_skills': RESUME['resume_skills'][:n], 'resume_title': title,
+         'resume_summary': RESUME['resume_summary'] if n % 2 else '', 'resume_experience_years': n}
+        for n, title in enumerate(['Python Developer', 'Data Analyst', '', 'QA Engineer', 'Cloud Engineer',
+                                   'DevOps Engineer', 'Project Manager'])
+    ]
+
+    batch = matcher.match_many(resumes, jobs, min_score=35, top_k=5, block_size=3, workers=2)
+    assert batch == [matcher.match_resume_to_jobs(**r, jobs=jobs, min_score=35, top_k=5) for r in resumes]
+
+    # Against the stored index: job references instead of job payloads
+    stored = matcher.match_many(resumes[:2], top_k=3)
+    assert [j['matchScore'] for j in stored[0]] == [j['matchScore'] for j in batch[0][:3]]
+    assert set(stored[0][0]) >= {'jobKey', 'title', 'matchScore', 'matchedSkills'}
+    print(f"Top per resume: {[m[0]['matchScore'] if m else None for m in batch]}")
+
+
+def test_concurrent_requests_are_independent():
+    """Threads matching different job lists get the same answers as sequential calls"""
+    print("=" * 70)
+    print("TEST: reentrant matching across threads")
+    print("=" * 70)
+
+    matcher = JobMatcher()
+    batches = [generate_jobs(count=30, seed=seed) for seed in range(6)]
+    for jobs in batches:
+        matcher.index.add_jobs(jobs, fit=False)
+    matcher.index.build()
+    expected = [_match(matcher, jobs) for jobs in batches]
+
+    results = [None] * len(batches)
+    errors = []
+
+    def worker(i):
+        try:
+            for _ in range(3):
+                results[i] = _match(matcher, batches[i])
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(len(batches))]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert not errors
+    assert results == expected
+
+
+if __name__ == '__main__':
+    print("\n🎯 JOB MATCHER TEST SUITE\n")
+    test_semantic_scores_use_indexed_corpus()
+    test_index_persists_and_tracks_content()
+    test_incremental_idf_tracks_corpus()
+    test_compaction_replays_changes_made_during_the_fit()
+    test_pruned_top_k_matches_full_ranking()
+    test_page_keeps_top_k_bound()
+    test_vectorized_scoring_matches_per_job_path()
+    test_match_many_equals_single_matches()
+    test_concurrent_requests_are_independent()
+    print("\n✅ All tests passed!")
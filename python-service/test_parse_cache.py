@@ -0,0 +1,113 @@
+"""
+Test script for the content-addressed Parse Cache
+Covers the LRU tier, the SQLite tier and the ResumeParser integration
+"""
+
+import os
+import tempfile
+
+from modules.parse_cache import ParseCache
+from modules.resume_parser import ResumeParser
+
+RESUME_TEXT = b"""Ali Khan
+ali.khan@example.com
++92-321-7654321
+Skills: Python, Django, PostgreSQL, Docker
+Software Engineer at ABC Tech 2019 - present
+Bachelor of Computer Science, NUST 2018
+"""
+
+
+def test_memory_lru_tier():
+    """Least recently used entries are evicted first"""
+    print("=" * 70)
+    print("TEST: in-process LRU tier")
+    print("=" * 70)
+
+    cache = ParseCache(max_entries=2)
+    cache.put('a', {'n': 1})
+    cache.put('b', {'n': 2})
+    assert cache.get('a') == {'n': 1}   # 'a' becomes most recent
+    cache.put('c', {'n': 3})            # evicts 'b'
+    assert cache.get('b') is None
+    assert cache.get('c') == {'n': 3}
+
+    # Callers get private copies
+    value = cache.get('a')
+    value['n'] = 99
+    assert cache.get('a') == {'n': 1}
+
+    stats = cache.stats()
+    print(f"Stats: {stats}")
+    assert stats['hits'] == 4 and stats['misses'] == 1 and stats['evictions'] == 1
+
+
+def test_sqlite_tier_persists_and_evicts():
+    """The disk tier survives a new cache instance and respects its size budget"""
+    print("=" * 70)
+    print("TEST: SQLite tier")
+    print("=" * 70)
+
+    folder = tempfile.mkdtemp()
+    db_path = os.path.join(folder, 'parse_cache.sqlite3')
+
+    first = ParseCache(max_entries=0, db_path=db_path, max_db_bytes=10_000)
+    first.put('k1', {'raw_text': 'x' * 100})
+    second = ParseCache(max_entries=4, db_path=db_path, max_db_bytes=10_000)
+    assert second.get('k1') == {'raw_text': 'x' * 100}
+    assert second.stats()['disk_hits'] == 1
+    assert second.get('k1') is not None and second.stats()['memory_hits'] == 1
+
+    for i in range(20):
+        second.put(f'big{i}', {'raw_text': 'y' * 1000})
+    stats = second.stats()
+    print(f"Stats: {stats}")
+    assert stats['db_bytes'] <= 10_000
+    assert stats['evictions'] > 0
+
+
+def test_parser_skips_work_on_cache_hit():
+    """Unchanged content is parsed once; options are part of the key"""
+    print("=" * 70)
+    print("TEST: ResumeParser cache integration")
+    print("=" * 70)
+
+    cache = ParseCache(max_entries=8)
+    parser = ResumeParser(cache=cache)
+
+    first = parser.parse_resume(RESUME_TEXT, file_name='ali.txt')
+    again = parser.parse_resume(RESUME_TEXT, file_name='renamed.txt')
+    assert again['candidate_info'] == first['candidate_info']
+    assert again['file_path'] == 'renamed.txt'
+    assert cache.stats()['hits'] == 1
+
+    fd, path = tempfile.mkstemp(suffix='.txt')
+    with os.fdopen(fd, 'wb') as f:
+        f.write(RESUME_TEXT)
+    try:
+        from_disk = parser.parse_resume(path)
+        assert from_disk['file_path'] == path
+        assert cache.stats()['hits'] == 2
+    finally:
+        os.remove(path)
+
+    # Different budgets must not share entries
+    ResumeParser(cache=cache, max_chars=20).parse_resume(RESUME_TEXT, file_name='ali.txt')
+    assert cache.stats()['misses'] == 2
+
+    parser.parse_text(RESUME_TEXT.decode())
+    parser.parse_text(RESUME_TEXT.decode())
+    print(f"Stats: {cache.stats()}")
+    assert cache.stats()['hits'] == 3
+
+    uncached = ResumeParser(use_cache=False)
+    assert uncached.cache is None
+    assert uncached.parse_resume(RESUME_TEXT, file_name='ali.txt')['skills']
+
+
+if __name__ == '__main__':
+    print("\n⚡ PARSE CACHE TEST SUITE\n")
+    test_memory_lru_tier()
+    test_sqlite_tier_persists_and_evicts()
+    test_parser_skips_work_on_cache_hit()
+    print("\n✅ All tests passed!")
@@ -0,0 +1,97 @@
+"""
+Test script for Response Fields
+Checks fields= projection, limit / offset paging and explain=top-k on match results
+"""
+
+from benchmarks.corpus import generate_jobs
+from modules.job_matcher import JobMatcher
+from modules.response_fields import paginate, pagination, parse_explain, parse_fields, parse_page, project
+
+RESUME = {
+    'resume_skills': ['Python', 'Django', 'PostgreSQL', 'Docker', 'AWS', 'React'],
+    'resume_title': 'Python Developer',
+    'resume_summary': 'Backend engineer building Django REST APIs on AWS with Docker.',
+    'resume_experience_years': 4,
+}
+
+
+def test_option_parsing_and_projection():
+    """Dotted field paths, page bounds and explain forms; malformed options raise ValueError"""
+    print("=" * 70)
+    print("TEST: response option parsing")
+    print("=" * 70)
+
+    fields = parse_fields("rank, candidate_name,parsed_data.candidate_info.email,parsed_data.skills")
+    assert fields == {'rank': None, 'candidate_name': None,
+                      'parsed_data': {'candidate_info': {'email': None}, 'skills': None}}
+    assert parse_fields(['a.b', 'a']) == parse_fields(['a', 'a.b']) == {'a': None}  # whole field wins
+    assert parse_fields(None) is None and parse_fields(" , ") is None
+
+    candidate = {
+        'rank': 1, 'candidate_name': 'Ada', 'match_score': 88,
+        'parsed_data': {'raw_text': 'x' * 10000, 'skills': ['Python'],
+                        'candidate_info': {'name': 'Ada', 'email': 'ada@example.com'},
+                        'experience': [{'company': 'A', 'description': '...'}]},
+    }
+    assert project(candidate, fields) == {
+        'rank': 1, 'candidate_name': 'Ada',
+        'parsed_data': {'candidate_info': {'email': 'ada@example.com'}, 'skills': ['Python']},
+    }
+    assert project(candidate, parse_fields("parsed_data.experience.company")) == {
+        'parsed_data': {'experience': [{'company': 'A'}]}}
+    assert project(candidate, None) is candidate
+
+    assert parse_page(None, None) == (0, None)
+    assert parse_page('20', '40') == (40, 20)
+    assert parse_explain(None) is None and parse_explain('all') is None
+    assert parse_explain('none') == 0 and parse_explain('top-5') == 5 and parse_explain(3) == 3
+    for bad in (lambda: parse_page(-1, 0), lambda: parse_page('ten', 0), lambda: parse_page(2.5, 0),
+                lambda: parse_explain('best'), lambda: parse_explain(-2), lambda: parse_fields(5)):
+        try:
+            bad()
+        except ValueError as e:
+            print(f"Rejected: {e}")
+        else:
+            raise AssertionError("malformed option accepted")
+
+    items = list(range(10))
+    page = paginate(items, 8, 5)
+    assert page == [8, 9]
+    assert pagination(len(items), 8, 5, len(page)) == {
+        'offset': 8, 'limit': 5, 'returned': 2, 'total': 10, 'hasMore': False}
+    assert pagination(len(items), 0, 5, 5)['hasMore']
+    # Total not counted (page ranked alone): hasMore comes from the caller
+    assert pagination(None, 0, 5, 5, has_more=True) == {
+        'offset': 0, 'limit': 5, 'returned': 5, 'total': None, 'hasMore': True}
+
+
+def test_explain_limits_explanations_only():
+    """explain=k keeps scores and order; only the first k results carry the explanation fields"""
+    print("=" * 70)
+    print("TEST: explain=top-k")
+    print("=" * 70)
+
+    jobs = generate_jobs(count=80, seed=9)
+    for vectorized in (False, True):
+        matcher = JobMatcher(vectorized=vectorized)
+        full = matcher.match_resume_to_jobs(**RESUME, jobs=jobs, min_score=0)
+        for explain in (0, 3, 200):
+            results = matcher.match_resume_to_jobs(**RESUME, jobs=jobs, min_score=0, explain=explain)
+            assert [r['matchScore'] for r in results] == [r['matchScore'] for r in full]
+            assert results[:explain] == full[:explain]
+            for plain, reference in zip(results[explain:], full[explain:]):
+                assert not set(JobMatcher.EXPLANATION_FIELDS) & plain.keys()
+                assert plain == {k: v for k, v in reference.items() if k not in JobMatcher.EXPLANATION_FIELDS}
+
+    fields = parse_fields("title,url,matchScore")
+    page = [project(r, fields) for r in paginate(full, 5, 5)]
+    assert [r['url'] for r in page] == [r['url'] for r in full[5:10]]
+    assert all(set(r) == {'title', 'url', 'matchScore'} for r in page)
+    print(f"Page 2: {[(r['title'], r['matchScore']) for r in page]}")
+
+
+if __name__ == '__main__':
+    print("\n📦 RESPONSE FIELDS TEST SUITE\n")
+    test_option_parsing_and_projection()
+    test_explain_limits_explanations_only()
+    print("\n✅ All tests passed!")
@@ -0,0 +1,232 @@
+"""
+Test script for the shared Resume Document model
+Checks the single-pass views and that extractors / analyzers consume them
+"""
+
+import os
+import re
+
+from modules import deep_analyzer
+from modules.resume_document import ResumeDocument
+from modules.resume_parser import ResumeParser
+from modules.deep_analyzer import DeepResumeAnalyzer, JobDescription, section_cache_stats
+
+RESUME_TEXT = """Sara Ahmed
+sara@example.com
+Summary
+Backend developer who enjoys building reliable services.
+
+Technical Skills: Python, Django
+PostgreSQL | Docker
+
+Work Experience
+Senior Software Engineer
+Acme Corp
+2019 - present
+Python Developer
+Beta Labs, 2016 - 2019
+
+Education
+Bachelor of Computer Science
+FAST University 2015
+"""
+
+
+def test_views_and_sections():
+    """Lines, words, offsets and section spans are derived from one text"""
+    print("=" * 70)
+    print("TEST: document views + section spans")
+    print("=" * 70)
+
+    doc = ResumeDocument(RESUME_TEXT)
+    assert doc.words == RESUME_TEXT.split()
+    assert doc.lower_lines == RESUME_TEXT.lower().split('\n')
+    for (start, end), word in zip(doc.word_spans, doc.words):
+        assert RESUME_TEXT[start:end] == word
+    for offset, line in zip(doc.line_offsets, doc.lines):
+        assert RESUME_TEXT[offset:offset + len(line)] == line
+
+    print(f"Sections: {[(s.name, s.heading_line) for s in doc.sections]}")
+    assert [s.name for s in doc.sections] == ['summary', 'skills', 'experience', 'education']
+    assert doc.section('skills').inline == 'Python, Django'
+    assert doc.section_lines('education')[:2] == ['Bachelor of Computer Science', 'FAST University 2015']
+    assert doc.section_of_line(doc.lines.index('Acme Corp')) == 'experience'
+    assert doc.section_of_line(0) is None
+
+    # Views are computed once and reused
+    assert doc.lower is doc.lower and ResumeDocument.of(doc) is doc
+
+
+def test_parser_uses_sections_and_line_windows():
+    """Skills come from the skills section; durations from neighbouring lines"""
+    print("=" * 70)
+    print("TEST: parser extractors on the document model")
+    print("=" * 70)
+
+    parser = ResumeParser(use_cache=False)
+    parser.nlp = None
+    parsed = parser.parse_text(RESUME_TEXT)
+    print(f"Skills: {parsed['skills']}")
+    print(f"Experience: {parsed['experience']}")
+
+    assert {'Python', 'Django', 'Postgresql', 'Docker'} <= set(parsed['skills'])
+    # "Backend developer who enjoys..." must not leak in from the summary
+    assert not any('Enjoys' in skill for skill in parsed['skills'])
+
+    durations = {e['title']: e['duration'] for e in parsed['experience']}
+    assert durations['Senior Software Engineer'] == '2019 - present'
+    assert durations['Python Developer'] == '2016 - 2019'
+
+    # A prebuilt document gives the same result as the raw string
+    doc = ResumeDocument(RESUME_TEXT.strip())
+    assert parser.extract_skills(doc) == parser.extract_skills(RESUME_TEXT.strip())
+    assert parser.extract_education(doc) == parser.extract_education(RESUME_TEXT.strip())
+
+
+def test_analyzer_accepts_document():
+    """DeepResumeAnalyzer scores are identical for text and a shared document"""
+    print("=" * 70)
+    print("TEST: deep analyzer on the document model")
+    print("=" * 70)
+
+    analyzer = DeepResumeAnalyzer()
+    jd = "Looking for a Python developer with Django and Docker experience"
+    from_text = analyzer.analyze(RESUME_TEXT, jd)
+    from_doc = analyzer.analyze(ResumeDocument(RESUME_TEXT.strip()), jd)
+    print(f"Overall: {from_text['overall_score']}")
+    assert from_text == from_doc
+    assert from_text['metrics']['word_count'] == len(RESUME_TEXT.split())
+
+
+def test_frequency_views_match_regex_metrics():
+    """Counter-based word / term views give the counts of the per-sentence and regex scans"""
+    print("=" * 70)
+    print("TEST: word-frequency views")
+    print("=" * 70)
+
+    text = ("Managed managed MANAGED things stuff etc. etc.etc developed developing. "
+            "Café résumé tested_ed 2ing reinvented ed ing. Short one! Testing testing testing testing\t tools. ")
+    doc = ResumeDocument(text * 3)
+    assert doc.sentence_words == [s.lower().split() for s in doc.sentences]
+    assert sum(doc.word_counts.values()) == len(doc.words)
+
+    terms = doc.term_counts
+    assert sum(terms[w] for w in ("gonna", "wanna", "gotta", "stuff", "things", "etc")) == \
+        len(re.findall(r'\b(gonna|wanna|gotta|stuff|things|etc\.?)\b', doc.lower))
+    assert sum(c for t, c in terms.items() if len(t) > 2 and t.endswith('ed')) == \
+        len(re.findall(r'\b\w+ed\b', doc.lower))
+    assert sum(c for t, c in terms.items() if len(t) > 3 and t.endswith('ing')) == \
+        len(re.findall(r'\b\w+ing\b', doc.lower))
+
+    # One long unpunctuated sentence: repeated-word check stays linear
+    long_text = RESUME_TEXT + " ".join(["developed scalable services using python"] * 5000)
+    result = DeepResumeAnalyzer().analyze(long_text)
+    print(f"Long text: {result['metrics']}, grammar {result['grammar_score']}")
+    assert result['metrics']['word_count'] == len(long_text.split())
+    assert "Repetitive wording detected (5 instances)" in result['weaknesses']  # each 5+ letter word
+
+
+def test_analyze_many_shares_job_description():
+    """Batch analysis with a compiled JD (in-process and pooled) equals one analyze() per resume"""
+    print("=" * 70)
+    print("TEST: batch deep analysis")
+    print("=" * 70)
+
+    jd_text = "Looking for a Python developer with Django, Docker, Kubernetes and strong communication"
+    jd = JobDescription(jd_text)
+    assert jd.words == set(re.findall(r'\b[a-z]{3,}\b', jd_text.lower()))
+    assert {'python', 'django', 'docker', 'kubernetes', 'communication'} <= set(jd.skills)
+    assert JobDescription.of(jd) is jd
+
+    resumes = [RESUME_TEXT.replace('Docker', tool) for tool in ('Docker', 'Kubernetes', 'Rust', 'AWS', 'Go')]
+    resumes += [ResumeDocument(RESUME_TEXT.strip()), "too short"]
+    analyzer = DeepResumeAnalyzer()
+    expected = [analyzer.analyze(text, jd_text) for text in resumes]
+    try:
+        assert analyzer.analyze_many(resumes, jd_text, workers=1) == expected
+        assert analyzer.analyze_many(resumes, jd, workers=2) == expected
+        assert analyzer.analyze_many(resumes[:2], jd) == expected[:2]
+        # Ranking-only scores equal the full analysis' ATS score
+        scores = [result['ats_score'] for result in expected]
+        assert analyzer.ats_scores(resumes, jd, workers=2) == scores
+        assert [analyzer.ats_score(text, jd_text) for text in resumes] == scores
+    finally:
+        analyzer.close()
+    print(f"Missing skills: {[r['missing_skills'] for r in expected[:3]]}")
+
+
+_PARENT_PID = os.getpid()
+_analyze_chunk = deep_analyzer._analyze_chunk_in_worker
+
+
+def _crash_on_marker(items, jd):
+    """Pool worker stand-in that dies (like a native crash) on a chunk holding a CRASH resume"""
+    if os.getpid() != _PARENT_PID and any('CRASH' in str(item) for item in items):
+        os._exit(1)
+    return _analyze_chunk(items, jd)
+
+
+def test_analyze_many_survives_worker_crash():
+    """A dying worker costs a pool rebuild, not the batch: every resume is still analyzed, in order"""
+    print("=" * 70)
+    print("TEST: batch deep analysis with a crashing worker")
+    print("=" * 70)
+
+    jd = JobDescription("Looking for a Python developer with Django and Docker experience")
+    resumes = [RESUME_TEXT.replace('Sara Ahmed', f'Candidate {i}') for i in range(12)]
+    resumes[5] = RESUME_TEXT.replace('Sara Ahmed', 'CRASH')
+    analyzer = DeepResumeAnalyzer()
+    expected = [analyzer.analyze(text, jd) for text in resumes]
+
+    deep_analyzer._analyze_chunk_in_worker = _crash_on_marker
+    try:
+        assert analyzer.analyze_many(resumes, jd, workers=2) == expected  # chunks of 2
+        assert analyzer._pool is None  # the rebuilt pool broke too and was discarded
+        assert analyzer.analyze_many(resumes[:4], jd, workers=2) == expected[:4]
+        assert analyzer._pool is not None
+    finally:
+        deep_analyzer._analyze_chunk_in_worker = _analyze_chunk
+        analyzer.close()
+
+
+def test_incremental_reanalysis_matches_full():
+    """Block-cached re-analysis of an edited resume equals a full analysis and reuses unchanged blocks"""
+    print("=" * 70)
+    print("TEST: incremental re-analysis")
+    print("=" * 70)
+
+    doc = ResumeDocument(RESUME_TEXT.strip())
+    assert '\n'.join(doc.section_blocks) == doc.text
+    assert doc.section_blocks[1].startswith('Summary')
+    assert doc.section_blocks[2] == 'Technical Skills: Python, Django\nPostgreSQL | Docker\n'
+
+    analyzer = DeepResumeAnalyzer()
+    jd = "Looking for a Python developer with Django and Docker experience"
+    edits = [
+        RESUME_TEXT,
+        RESUME_TEXT.replace('reliable services.', 'reliable services and led the migration'),  # sentence runs on
+        RESUME_TEXT.replace('Acme Corp', 'Acme Corp. Developed, designed and optimized everything'),
+        RESUME_TEXT.replace('\nEducation\n', '\n'),
+        RESUME_TEXT + "\n\nProjects\n- Built things. Stuff etc.\n- Gonna ship it",
+        "No headings at all, a single paragraph that keeps going. " * 6,
+    ]
+    for text in edits:
+        assert analyzer.analyze(text, jd, incremental=True) == analyzer.analyze(text, jd)
+
+    stats = section_cache_stats()
+    analyzer.analyze(RESUME_TEXT.replace('FAST University', 'NUST'), jd, incremental=True)
+    after = section_cache_stats()
+    print(f"Block cache: {after}")
+    assert after['misses'] - stats['misses'] == 1  # only the edited education block
+
+
+if __name__ == '__main__':
+    print("\n📑 RESUME DOCUMENT TEST SUITE\n")
+    test_views_and_sections()
+    test_parser_uses_sections_and_line_windows()
+    test_analyzer_accepts_document()
+    test_frequency_views_match_regex_metrics()
+    test_analyze_many_shares_job_description()
+    test_analyze_many_survives_worker_crash()
+    test_incremental_reanalysis_matches_full()
+    print("\n✅ All tests passed!")
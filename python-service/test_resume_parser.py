@@ -0,0 +1,429 @@
+"""
+Test script for the Resume Parser
+Builds small PDF resumes on the fly and checks extraction behaviour
+"""
+
+import contextlib
+import io
+import os
+import tempfile
+import time
+
+import pymupdf as fitz
+from docx import Document
+
+from modules.parse_cache import ParseCache
+from modules.parse_guard import ParseBudgetExceeded, ParseGuard
+from modules.resume_parser import ResumeParser
+
+
+def _make_pdf(pages):
+    """Write a PDF with one text block per page and return its path"""
+    fd, path = tempfile.mkstemp(suffix='.pdf')
+    os.close(fd)
+    doc = fitz.open()
+    for text in pages:
+        page = doc.new_page()
+        page.insert_textbox(fitz.Rect(50, 50, 550, 800), text, fontsize=10)
+    doc.save(path)
+    doc.close()
+    return path
+
+
+SAMPLE_PAGES = [
+    "John Doe\njohn@example.com\n+92-300-1234567\n\nSKILLS\nPython, React, Docker",
+    "EXPERIENCE\nSoftware Engineer\nABC Tech 2020 - present",
+    "EDUCATION\nBachelor of Computer Science\nFAST University 2019",
+    "PORTFOLIO\n" + "Project screenshot caption\n" * 20,
+    "PORTFOLIO (continued)\n" + "More captions\n" * 20,
+]
+
+
+def test_pdf_page_and_char_budgets():
+    """Page and character budgets bound how much of a PDF is read"""
+    print("=" * 70)
+    print("TEST: PDF page / character budgets")
+    print("=" * 70)
+
+    path = _make_pdf(SAMPLE_PAGES)
+    try:
+        parser = ResumeParser()
+        full = parser.extract_text_from_pdf(path)
+        assert 'John Doe' in full and 'More captions' in full
+
+        two_pages = parser.extract_text_from_pdf(path, max_pages=2)
+        print(f"2-page budget: {len(two_pages)} chars")
+        assert 'Software Engineer' in two_pages
+        assert 'EDUCATION' not in two_pages
+
+        capped = ResumeParser(max_chars=40).extract_text_from_pdf(path)
+        print(f"40-char budget: {capped!r}")
+        assert len(capped) <= 40 and capped.startswith('John Doe')
+
+        pages = list(parser.iter_pdf_pages(path, max_pages=3))
+        assert len(pages) == 3
+
+        # A budget the whole document fits in exactly is not reported as a truncation
+        total = sum(len(page) for page in parser.iter_pdf_pages(path))
+        for budget, truncated in ((total, False), (total - 1, True)):
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                text = ''.join(parser.iter_pdf_pages(path, max_chars=budget))
+            assert len(text) == budget
+            assert ('PDF truncated' in output.getvalue()) == truncated
+    finally:
+        os.remove(path)
+
+
+def test_stop_after_sections():
+    """Reading stops shortly after skills, experience and education are seen"""
+    print("=" * 70)
+    print("TEST: stop after required sections")
+    print("=" * 70)
+
+    path = _make_pdf(SAMPLE_PAGES)
+    try:
+        parser = ResumeParser(stop_after_sections=True)
+        text = parser.extract_text_from_pdf(path)
+        print(f"Extracted {len(text)} chars")
+        # Education heading on page 3, one tail page (4) read, page 5 skipped
+        assert 'FAST University' in text
+        assert 'Project screenshot caption' in text
+        assert 'More captions' not in text
+
+        assert parser.find_section_headings("Work Experience\nfoo\nTechnical Skills:") == {
+            'experience', 'skills'}
+
+        parsed = parser.parse_resume(path)
+        assert parsed['candidate_info']['email'] == 'john@example.com'
+        assert 'Python' in parsed['skills']
+    finally:
+        os.remove(path)
+
+
+def test_in_memory_sources():
+    """Bytes, file-like objects and decoded text parse without touching disk"""
+    print("=" * 70)
+    print("TEST: in-memory parse path")
+    print("=" * 70)
+
+    parser = ResumeParser()
+    path = _make_pdf(SAMPLE_PAGES[:3])
+    try:
+        with open(path, 'rb') as f:
+            pdf_bytes = f.read()
+        from_path = parser.parse_resume(path)
+    finally:
+        os.remove(path)
+
+    from_bytes = parser.parse_resume(pdf_bytes, file_name='resume.pdf')
+    assert from_bytes['raw_text'] == from_path['raw_text']
+    assert from_bytes['file_path'] == 'resume.pdf'
+
+    # Unnamed stream: format sniffed from the %PDF magic
+    from_stream = parser.parse_resume(io.BytesIO(pdf_bytes))
+    assert from_stream['candidate_info'] == from_path['candidate_info']
+
+    doc = Document()
+    for line in ("Jane Roe", "jane@example.com", "Skills: Python, SQL"):
+        doc.add_paragraph(line)
+    buf = io.BytesIO()
+    doc.save(buf)
+    from_docx = parser.parse_resume(buf.getvalue(), file_name='cv.docx')
+    print(f"DOCX: {from_docx['candidate_info']}")
+    assert from_docx['candidate_info']['email'] == 'jane@example.com'
+    assert parser.detect_format(buf.getvalue()) == '.docx'
+
+    from_text = parser.parse_text("Jane Roe\njane@example.com\nPython developer")
+    assert from_text['candidate_info']['name'] == 'Jane Roe'
+    assert parser.parse_resume(b"Jane Roe\njane@example.com", file_name='cv.txt')[
+        'candidate_info']['email'] == 'jane@example.com'
+
+
+def test_streaming_docx_includes_tables():
+    """DOCX text is streamed in document order, table cells included"""
+    print("=" * 70)
+    print("TEST: streaming DOCX extraction")
+    print("=" * 70)
+
+    doc = Document()
+    doc.add_paragraph("Jane Roe")
+    doc.add_paragraph("jane@example.com")
+    doc.add_paragraph("Skills")
+    table = doc.add_table(rows=2, cols=2)
+    for cell, skill in zip(table._cells, ("Python", "Django", "Docker", "")):
+        cell.text = skill
+    doc.add_paragraph("Experience")
+    buf = io.BytesIO()
+    doc.save(buf)
+
+    parser = ResumeParser(use_cache=False)
+    text = parser.extract_text_from_docx(buf.getvalue())
+    print(f"Text: {text!r}")
+    assert text == "Jane Roe\njane@example.com\nSkills\nPython\nDjango\nDocker\nExperience"
+
+    # Same body paragraphs as python-docx, which never saw the table
+    fallback = parser._extract_text_from_docx_fallback(buf.getvalue())
+    assert fallback == "Jane Roe\njane@example.com\nSkills\nExperience"
+
+    assert ResumeParser(use_cache=False, max_chars=12).extract_text_from_docx(buf.getvalue()) == "Jane Roe\njan"
+    assert parser.extract_text_from_docx(b"PK\x03\x04 not a zip") == ""
+
+
+class _KeywordNER:
+    """Minimal stand-in pipeline: tags lines listed in `people` as PERSON"""
+
+    class _Ent:
+        label_ = 'PERSON'
+
+    class _Doc:
+        def __init__(self, ents):
+            self.ents = ents
+
+    def __init__(self, people):
+        self.people = set(people)
+        self.calls = 0
+        self.lines_seen = 0
+
+    def __call__(self, line):
+        return self._Doc([self._Ent()] if line in self.people else [])
+
+    def pipe(self, lines):
+        self.calls += 1
+        for line in lines:
+            self.lines_seen += 1
+            yield self(line)
+
+
+def _legacy_extract_name(nlp, text):
+    """The original per-line implementation"""
+    for line in text.split('\n')[:5]:
+        line = line.strip()
+        if line and len(line.split()) <= 4:
+            if any(ent.label_ == 'PERSON' for ent in nlp(line).ents):
+                return line
+            if all(word[0].isupper() for word in line.split() if word):
+                return line
+    return "Unknown Candidate"
+
+
+def test_batched_name_extraction():
+    """Batched NER with the capitalized fast path matches the per-line logic"""
+    print("=" * 70)
+    print("TEST: batched / fast-path name extraction")
+    print("=" * 70)
+
+    texts = [
+        "John Doe\njohn@example.com",                       # fast path, no NLP
+        "curriculum vitae\nsara ahmed\nSara's Resume",      # NER finds lower-case name
+        "resume\nobjective: build things\nAli Raza",        # falls through to capitalized
+        "this line has far too many words in it\nemail@x.com",
+        "",
+    ]
+    ner = _KeywordNER({'sara ahmed'})
+    parser = ResumeParser(use_cache=False)
+    parser.nlp = ner
+
+    names = parser.extract_names(texts)
+    print(f"Names: {names}")
+    assert names == [_legacy_extract_name(ner, t) for t in texts]
+    assert names[1] == 'sara ahmed' and names[2] == 'Ali Raza'
+
+    # One pipe call for the whole batch; capitalized-first resumes add no lines
+    ner.calls = ner.lines_seen = 0
+    parser.extract_names(texts)
+    assert ner.calls == 1
+    assert ner.lines_seen == 5  # curriculum vitae, sara ahmed, resume, objective..., email@x.com
+
+    ner.calls = 0
+    assert parser.extract_name("John Doe\nDeveloper") == 'John Doe'
+    assert ner.calls == 0
+
+
+def test_parse_many_in_order_with_errors():
+    """parse_many keeps input order, reports per-file errors and stage timings"""
+    print("=" * 70)
+    print("TEST: parse_many across a process pool")
+    print("=" * 70)
+
+    pdfs = [_make_pdf([f"Candidate {n}\ncand{n}@example.com\nSkills: Python, SQL"])
+            for n in range(5)]
+    try:
+        sources = pdfs + [b"not a real pdf", b"Plain Text Person\nplain@example.com"]
+        names = [None] * 5 + ['broken.pdf', 'plain.txt']
+
+        cache = ParseCache(max_entries=32)
+        parser = ResumeParser(cache=cache)
+        parser.PARALLEL_MIN_BATCH = 2
+        try:
+            results = parser.parse_many(sources, workers=2, file_names=names)
+            again = parser.parse_many(sources[:3], workers=2)
+        finally:
+            parser.close()
+
+        for item in results:
+            print(f"  [{item['index']}] {item['success']} {item['error'] or ''} {item['timings']}")
+        assert [r['index'] for r in results] == list(range(7))
+        assert [r['success'] for r in results] == [True] * 5 + [False, True]
+        for n in range(5):
+            assert results[n]['data']['candidate_info']['email'] == f'cand{n}@example.com'
+            assert results[n]['data']['file_path'] == pdfs[n]
+        assert results[5]['data'] is None and 'Could not extract text' in results[5]['error']
+        assert results[6]['data']['candidate_info']['name'] == 'Plain Text Person'
+        assert set(results[0]['timings']) == {'read_ms', 'extract_ms', 'fields_ms', 'total_ms'}
+
+        # Second batch is answered from the parse cache without the pool
+        assert all(r['cached'] for r in again)
+        assert [r['data']['raw_text'] for r in again] == [r['data']['raw_text'] for r in results[:3]]
+
+        # In-process path gives the same answers
+        inline = ResumeParser(use_cache=False).parse_many(sources, workers=1, file_names=names)
+        assert [r['data'] for r in inline][:5] == [
+            dict(r['data'], parsed_at=i['data']['parsed_at'])
+            for r, i in zip(results[:5], inline[:5])]
+    finally:
+        for path in pdfs:
+            os.remove(path)
+
+
+def _sleep_then_return(seconds, value):
+    time.sleep(seconds)
+    return value
+
+
+_extract_text = ResumeParser.extract_text
+
+
+def _stall_or_crash(self, file_path, file_name=None):
+    """extract_text for forked workers: b"HANG..." overruns any deadline, b"CRASH..." kills the process"""
+    if isinstance(file_path, bytes) and file_path.startswith(b"HANG"):
+        time.sleep(60)
+    if isinstance(file_path, bytes) and file_path.startswith(b"CRASH"):
+        os._exit(1)
+    return _extract_text(self, file_path, file_name)
+
+
+def test_guarded_parsing_budgets():
+    """Deadline, byte budget and worker isolation in guarded mode"""
+    print("=" * 70)
+    print("TEST: guarded parsing (time / byte budgets)")
+    print("=" * 70)
+
+    guard = ParseGuard(workers=1)
+    try:
+        assert guard.run(_sleep_then_return, (0, 'ok'), timeout=10) == 'ok'
+        started = time.perf_counter()
+        try:
+            guard.run(_sleep_then_return, (30, 'late'), timeout=0.5, file_name='slow.pdf')
+            assert False, "expected ParseBudgetExceeded"
+        except ParseBudgetExceeded as e:
+            print(f"Budget: {e.to_dict()}")
+            assert e.budget == 'time' and e.file_name == 'slow.pdf'
+        assert time.perf_counter() - started < 10
+        # The killed worker is replaced transparently
+        assert guard.run(_sleep_then_return, (0, 'again'), timeout=10) == 'again'
+        assert guard.stats()['timeouts'] == 1 and guard.stats()['spawned'] == 2
+    finally:
+        guard.close()
+
+    path = _make_pdf(SAMPLE_PAGES[:3])
+    parser = ResumeParser(use_cache=False, timeout=30, max_bytes=50_000)
+    try:
+        parsed = parser.parse_resume(path)
+        assert parsed['candidate_info']['email'] == 'john@example.com'
+
+        try:
+            parser.parse_resume(b"x" * 60_000, file_name='huge.txt')
+            assert False, "expected ParseBudgetExceeded"
+        except ParseBudgetExceeded as e:
+            assert e.budget == 'bytes' and e.actual == 60_000
+
+        results = parser.parse_many([path, b"x" * 60_000, b"not a pdf"],
+                                    file_names=[None, 'huge.txt', 'bad.pdf'])
+        assert [r['success'] for r in results] == [True, False, False]
+        assert results[1]['budget_exceeded']['budget'] == 'bytes'
+        assert results[2]['budget_exceeded'] is None
+        assert 'Could not extract text' in results[2]['error']
+    finally:
+        parser.close()
+        os.remove(path)
+
+
+def test_pool_worker_crash_fails_only_its_document():
+    """A worker dying mid-batch fails its own document; pending chunks are retried, not failed"""
+    print("=" * 70)
+    print("TEST: parse_many worker crash")
+    print("=" * 70)
+
+    sources = [f"Candidate Number {n}\ncand{n}@example.com\nSkills: Python".encode() for n in range(16)]
+    sources[5] = b"CRASH"
+
+    ResumeParser.extract_text = _stall_or_crash  # inherited by the forked workers
+    parser = ResumeParser(use_cache=False)
+    try:
+        results = parser.parse_many(sources, workers=2)  # chunks of 2
+        guard = parser._guard.stats()
+        again = parser.parse_many(sources[:4], workers=2)
+        pool = parser._pool
+    finally:
+        ResumeParser.extract_text = _extract_text
+        parser.close()
+
+    print(f"Failed: {[(r['index'], r['error']) for r in results if not r['success']]}")
+    assert [r['index'] for r in results] == list(range(16))
+    assert [r['success'] for r in results] == [n != 5 for n in range(16)]
+    assert 'ParseWorkerCrashed' in results[5]['error']
+    assert results[4]['data']['candidate_info']['email'] == 'cand4@example.com'  # same chunk as the crash
+    # The retry on a rebuilt pool crashed again: the rest ran in isolated workers
+    assert guard['crashes'] == 1
+    # Later batches get a fresh pool
+    assert pool is not None and all(r['success'] for r in again)
+
+
+def test_guarded_batches_isolate_failures():
+    """Guarded parse_many (per-batch timeout) ships per-worker batches; a stalled or crashing file fails alone"""
+    print("=" * 70)
+    print("TEST: guarded batches (per-document deadline, crash isolation)")
+    print("=" * 70)
+
+    sources = [f"Candidate Number {n}\ncand{n}@example.com\nSkills: Python, SQL".encode() for n in range(10)]
+    sources[3] = b"HANG"
+    sources[7] = b"CRASH"
+    names = [f"r{n}.txt" for n in range(10)]
+
+    ResumeParser.extract_text = _stall_or_crash  # inherited by the forked workers
+    parser = ResumeParser(use_cache=False, guard_workers=1)  # in-process unless a batch asks
+    try:
+        started = time.perf_counter()
+        results = parser.parse_many(sources, workers=2, file_names=names, timeout=2)
+        elapsed = time.perf_counter() - started
+        stats = parser._guard.stats()
+    finally:
+        ResumeParser.extract_text = _extract_text
+        parser.close()
+
+    print(f"Elapsed {elapsed:.1f}s, guard: {stats}")
+    assert [r['success'] for r in results] == [n not in (3, 7) for n in range(10)]
+    assert results[3]['budget_exceeded']['budget'] == 'time'
+    assert results[3]['budget_exceeded']['file_name'] == 'r3.txt'
+    assert 'ParseWorkerCrashed' in results[7]['error']
+    assert [r['data']['candidate_info']['email'] for r in results if r['success']] == [
+        f"cand{n}@example.com" for n in range(10) if n not in (3, 7)]
+    # Sized from workers=2 (not guard_workers=1); 5 chunks of 2 + 2 resubmitted remainders
+    assert stats['workers'] == 2 and stats['calls'] == 7
+    assert stats['timeouts'] == 1 and stats['crashes'] == 1
+    assert elapsed < 30
+
+
+if __name__ == '__main__':
+    print("\n📄 RESUME PARSER TEST SUITE\n")
+    test_pdf_page_and_char_budgets()
+    test_stop_after_sections()
+    test_in_memory_sources()
+    test_streaming_docx_includes_tables()
+    test_batched_name_extraction()
+    test_parse_many_in_order_with_errors()
+    test_guarded_parsing_budgets()
+    test_pool_worker_crash_fails_only_its_document()
+    test_guarded_batches_isolate_failures()
+    print("\n✅ All tests passed!")
@@ -0,0 +1,101 @@
+"""
+Test script for the shared Skill Taxonomy
+Checks the compiled lexicon against the per-skill regex scans it replaced
+"""
+
+import re
+
+from modules.skill_taxonomy import (
+    SkillLexicon, RESUME_LEXICON, MATCHER_LEXICON, ANALYZER_LEXICON,
+    RESUME_SKILLS, TECH_SKILLS, SOFT_SKILLS, SUBSTR_CONFLICTS,
+    SKILL_ALIASES, HIGH_VALUE_SKILLS, LETTER,
+)
+from modules.job_matcher import extract_skills_from_text
+from modules.deep_analyzer import DeepResumeAnalyzer
+
+SAMPLE_TEXT = """
+Jane Doe - Senior Software Engineer
+Experienced with Python, React.js and Node.js on AWS and Google Cloud.
+Built ML pipelines (scikit-learn, pandas) and REST API services backed by SQL Server.
+Tooling: Git, Docker, Kubernetes, CI/CD with Jenkins. Some Go and R scripting.
+Strong leadership, communication and problem solving. Scalable JavaScript apps.
+"""
+
+
+def _regex_scan(terms, text):
+    """Reference implementation: one word-boundary regex per skill"""
+    lower = text.lower()
+    return {t for t in terms if re.search(r'\b' + re.escape(t) + r'\b', lower)}
+
+
+def test_word_boundary_matches_regex_scan():
+    """Plain word terms behave exactly like the old \\b...\\b scans"""
+    print("=" * 70)
+    print("TEST: word-boundary lexicon vs per-skill regex")
+    print("=" * 70)
+
+    plain = {t for t in RESUME_SKILLS if t[0].isalnum() and t[-1].isalnum()}
+    found = set(RESUME_LEXICON.scan(SAMPLE_TEXT)) & plain
+    expected = _regex_scan(plain, SAMPLE_TEXT)
+    print(f"Found: {sorted(found)}")
+    assert found == expected
+
+    # "go" / "r" must not fire inside "google" / "experienced"
+    lex = SkillLexicon({'go', 'r', 'java'})
+    assert lex.scan("google experienced javascript") == []
+    assert sorted(lex.scan("Go, R and Java")) == ['go', 'java', 'r']
+
+
+def test_overlapping_terms_and_aliases():
+    """Terms sharing a start position are all reported and aliases normalized"""
+    print("=" * 70)
+    print("TEST: overlapping terms + alias normalization")
+    print("=" * 70)
+
+    skills = extract_skills_from_text(SAMPLE_TEXT)
+    print(f"Matcher skills: {sorted(skills)}")
+    # "sql server" -> mssql, and the shorter "sql" is still found
+    assert {'mssql', 'sql', 'react', 'node', 'gcp', 'aws', 'cicd'} <= skills
+    assert 'react.js' not in skills and 'node.js' not in skills
+
+    # Punctuated terms work on both sides (the old \b regex missed these)
+    assert {'cpp', 'csharp', 'dotnet'} <= MATCHER_LEXICON.find("C++, C# and .NET")
+
+    reference = {SKILL_ALIASES.get(t, t) for t in _regex_scan(
+        set(SKILL_ALIASES.values()) | HIGH_VALUE_SKILLS | set(SKILL_ALIASES), SAMPLE_TEXT)}
+    assert reference <= skills
+
+
+def test_analyzer_lexicon_matches_legacy_rules():
+    """Deep analyzer keeps its substring / strict-boundary semantics"""
+    print("=" * 70)
+    print("TEST: analyzer lexicon vs legacy _extract_skills rules")
+    print("=" * 70)
+
+    lower = SAMPLE_TEXT.lower()
+    legacy = set()
+    for s in TECH_SKILLS:
+        if s in SUBSTR_CONFLICTS or len(s) <= 3:
+            if re.search(r'(?<![a-zA-Z/])' + re.escape(s) + r'(?![a-zA-Z])', lower):
+                legacy.add(s)
+        elif s in lower:
+            legacy.add(s)
+    legacy |= {s for s in SOFT_SKILLS if s in lower}
+
+    info = DeepResumeAnalyzer()._extract_skills(lower)
+    print(f"Tech: {info['tech']}")
+    print(f"Soft: {info['soft']}")
+    assert set(info['all']) == legacy
+    assert 'scala' not in info['tech']  # "Scalable"
+
+    assert ANALYZER_LEXICON.canonical(' Machine Learning ') == 'machine learning'
+    assert 'esport' not in ANALYZER_LEXICON
+    assert ANALYZER_LEXICON.modes['r'] == LETTER
+
+
+if __name__ == '__main__':
+    print("\n🔍 SKILL TAXONOMY TEST SUITE\n")
+    test_word_boundary_matches_regex_scan()
+    test_overlapping_terms_and_aliases()
+    test_analyzer_lexicon_matches_legacy_rules()
+    print("\n✅ All tests passed!")
@@ -0,0 +1,74 @@
+"""
+Test script for Title Similarity
+Checks the signature-based scores against the SequenceMatcher scoring they replaced
+"""
+
+import itertools
+from difflib import SequenceMatcher
+
+from benchmarks.corpus import TITLES
+from modules.title_similarity import TitleSimilarity, TITLE_STOPWORDS, normalize_title
+
+
+def _sequence_matcher_score(resume_title, job_title):
+    """Reference implementation: the former JobMatcher._title_relevance"""
+    if not resume_title or not job_title:
+        return 50
+    if SequenceMatcher(None, resume_title, job_title).ratio() > 0.8:
+        return 95
+    resume_words = set(resume_title.split()) - TITLE_STOPWORDS
+    job_words = set(job_title.split()) - TITLE_STOPWORDS
+    if not resume_words:
+        return 50
+    return 20 + len(resume_words & job_words) / len(resume_words) * 75
+
+
+def test_scores_stay_calibrated():
+    """Same 20-95 scale, and near-exact decisions agree with SequenceMatcher"""
+    print("=" * 70)
+    print("TEST: title scores vs SequenceMatcher")
+    print("=" * 70)
+
+    titles = [t.lower() for t in TITLES]
+    titles += [f"senior {t}" for t in titles] + [f"{t} - remote" for t in titles] + [t[:-1] for t in titles]
+    engine = TitleSimilarity()
+
+    pairs = list(itertools.product(titles, titles))
+    agree = 0
+    for resume_title, job_title in pairs:
+        score = engine.score(resume_title, job_title)
+        assert 20 <= score <= 95
+        agree += (score == 95) == (_sequence_matcher_score(resume_title, job_title) == 95)
+    print(f"Near-exact agreement: {agree}/{len(pairs)}")
+    assert agree / len(pairs) > 0.97
+
+    assert engine.score('', 'Data Analyst') == 50
+    assert engine.score('Python Developer', 'python developer') == 95
+    assert engine.score('Sr. Python Dev', 'Senior Python Developer') == 95
+    assert engine.score('Data Analyst', 'Mobile App Developer') == 20
+    assert engine.score('the of', 'QA Engineer') == 50
+
+
+def test_titles_are_interned_and_memoized():
+    """Repeated titles hit the signature / pair caches and share one string"""
+    print("=" * 70)
+    print("TEST: title interning and memoization")
+    print("=" * 70)
+
+    engine = TitleSimilarity()
+    feed = ['Software Engineer', 'Software Engineer', 'software engineer', 'QA Engineer'] * 50
+    scores = [engine.score('Senior Software Engineer', title) for title in feed]
+    stats = engine.stats()
+    print(f"Stats: {stats}")
+
+    assert scores[:4] == scores[-4:]
+    assert stats['titles'] == 4 and stats['pairs'] == 2
+    assert stats['pair_hits'] == len(feed) - 2
+    assert normalize_title('Software  Engineer') is normalize_title('SOFTWARE ENGINEER')
+
+
+if __name__ == '__main__':
+    print("\n🏷️  TITLE SIMILARITY TEST SUITE\n")
+    test_scores_stay_calibrated()
+    test_titles_are_interned_and_memoized()
+    print("\n✅ All tests passed!")